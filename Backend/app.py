@@ -19,6 +19,8 @@ from playstation.settings import (
 from playstation.routes import routes
 from playstation.database import database
 from playstation.logger import setup_logging
+from playstation.admin.profiling import setup_profiling
+from playstation.admin.metrics import setup_metrics
 
 
 # Initiate flask application
@@ -35,12 +37,17 @@ CORS(app, resources={r"/api/*":{"origins":CORS_ALLOWED_ORIGINS}})
 # Register routes
 routes(app)
 
+# Expose Prometheus metrics when enabled, before the database opens connections
+setup_metrics(app)
+
 # Configure Database
 database(app)
 
 # Set up logger
 setup_logging(app)
 
+# Set up per-stage request timings
+setup_profiling(app)
 
 if __name__ == "__main__":
     # Run flask application
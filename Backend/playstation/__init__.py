@@ -1,8 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask import Flask
 from .config import config
-from sqlalchemy.orm import DeclarativeBase
-from typing import Self
+from contextlib import contextmanager
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import DeclarativeBase, Session
+from typing import Self, Iterator
 
 
 # Base Model Class
@@ -14,6 +16,48 @@ class Base(DeclarativeBase):
 db: SQLAlchemy = SQLAlchemy(model_class=Base)
 
 
+# Unit of work
+@contextmanager
+def db_unit_of_work() -> Iterator[Session]:
+    """
+    Defer the commits of a multi-object flow to a single commit at the end.
+
+    Inside the block `save()`, `delete()` and `db_commit()` only flush, so ids
+    are still assigned. The outermost block commits on success and rolls back
+    on any exception, nested blocks join the outer one.
+
+    ```py
+    with db_unit_of_work():
+        old_default.save()
+        new_address.save()
+    # Committed once here
+    ```
+    """
+    info: dict = db.session.info
+    depth: int = info.get("unit_of_work", 0)
+    info["unit_of_work"] = depth + 1
+    try:
+        yield db.session
+        if depth == 0:
+            db.session.commit()
+    except BaseException:
+        if depth == 0:
+            db.session.rollback()
+        raise
+    finally:
+        info["unit_of_work"] = depth
+
+
+def db_commit() -> None:
+    """
+    Commit the session, or only flush it inside a unit of work.
+    """
+    if db.session.info.get("unit_of_work"):
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
 # Create modification class
 class SQLMixin:
     """
@@ -26,15 +70,12 @@ class SQLMixin:
         """
         Method used to save SQL Session
         """
-        # Check if instance exists
-        instance: object = (
-            db.session.query(self.__class__).filter_by(id=self.id).first()
-        )
-        # Create new instance if instance does not exists
-        if instance is None:
+        # Add the instance unless the session already tracks it, no SELECT needed
+        state = inspect(self)
+        if not (state.persistent or state.pending):
             db.session.add(self)
         # Commit Changes
-        db.session.commit()
+        db_commit()
 
     # Create a Delete Method
     def delete(self: Self, *args, **kwargs) -> None:
@@ -43,8 +84,27 @@ class SQLMixin:
         """
         db.session.delete(self)
         # Commit Changes
-        db.session.commit()
+        db_commit()
+
+
+def configure_engine(app: Flask) -> None:
+    """
+    Run the SQLITE_PRAGMAS of the app config on every new SQLite connection of the app engine.
+
+    Called right after `db.init_app`, before the engine opens a connection.
+    """
+    pragmas: dict = app.config.get("SQLITE_PRAGMAS") or {}
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
 
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
 
 
 def create_app(config_name='testing'):
@@ -55,5 +115,6 @@ def create_app(config_name='testing'):
     app.config.from_object(config[config_name])
 
     db.init_app(app)
+    configure_engine(app)
 
     return app
\ No newline at end of file
@@ -6,6 +6,7 @@ from typing import Self, Callable, Union, Any
 from flask import make_response, Response, request
 from functools import wraps
 from playstation.settings import JWT_AUTHENTICATIONS
+from playstation.admin.profiling import stage
 from abc import ABC, abstractmethod
 
 
@@ -43,22 +44,28 @@ def authentication_classess(
         Response: A 401 Unauthorized response in case of failure.
     """
 
+    # Authentication classes are stateless, create them once and reuse them for every request
+    authenticators: tuple[Authentication, ...] = tuple(
+        authentication() for authentication in auth_classes
+    )
+    # Token Prefix, compared as a whole scheme so "BearerXYZ" is rejected
+    scheme: str = JWT_AUTHENTICATIONS.get("AUTH_HEADER_TYPES", "").strip()
+
     def decorator(view: Callable) -> Union[Callable, Response]:
         @wraps(view)
         def decorated_function(*args, **kwargs) -> Union[Response, Any]:
-            # Token
-            token: str = request.headers.get("Authorization")
-            # Token Prefix
-            prefix: str = JWT_AUTHENTICATIONS.get("AUTH_HEADER_TYPES", None)
-            # Check Token first
-            if token is None or not token.startswith(prefix):
-                return make_response({"error": "Unauthorized access"}, 401)
-            # Grab the token
-            token: str = token.split(" ")[1]
-            # Run authorization classes
-            for authentication in auth_classes:
-                if not authentication().authenticate(token):
+            with stage("auth"):
+                # Token
+                header: list[str] = request.headers.get("Authorization", "").split(None, 1)
+                # Check Token first
+                if len(header) != 2 or header[0] != scheme:
                     return make_response({"error": "Unauthorized access"}, 401)
+                # Grab the token
+                token: str = header[1].strip()
+                # Run authorization classes
+                for authentication in authenticators:
+                    if not authentication.authenticate(token):
+                        return make_response({"error": "Unauthorized access"}, 401)
             return view(*args, **kwargs)
 
         return decorated_function
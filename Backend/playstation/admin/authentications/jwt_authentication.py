@@ -5,9 +5,10 @@
 from typing import Optional, Self
 from flask import request
 from . import Authentication
-from playstation.models.users import User
-from playstation.models.blacklisted_tokens import BlackListedTokens
+from .principal import UserPrincipal, principal_cache
+from .revocation import revocation_index
 from .token import RefreshToken
+from playstation.models.blacklisted_tokens import BlackListedTokens
 
 
 class JWTAuthentication(Authentication):
@@ -15,32 +16,24 @@ class JWTAuthentication(Authentication):
     Class for JWT Authentication.
     """
 
-    def check_blacklisted(
-        self: Self, token: str, user: User, field: str = "access"
-    ) -> bool:
+    def check_blacklisted(self: Self, token: str, user: UserPrincipal) -> bool:
         """
         Check if the token is blacklisted.
 
+        The lookup goes through the revocation index. An in-process index
+        loads the tokens blacklisted by other workers at most once every
+        `REVOCATION_SYNC_INTERVAL` seconds, other requests never touch the database.
+
         Args:
             - token (str): String token.
-            - user (User): The user whose tokens are being checked.
-            - field (str): The token field to check (default is 'access').
+            - user (UserPrincipal): The user whose tokens are being checked.
 
         Returns:
             - bool: True if the token is blacklisted, otherwise False.
         """
-        # Grab the blacklisted tokens
-        blacklisted_tokens: list[BlackListedTokens] = user.blacklisted_tokens
-        # variable for blacklisted token
-        is_blacklisted: bool = False
-        # Loop over the tokens
-        for blacklisted_token in blacklisted_tokens:
-            # Check if access token is blacklisted
-            if getattr(blacklisted_token, field) == token:
-                is_blacklisted: bool = True
-            # Check token lift to delete expired tokens from database
-            blacklisted_token.check_token_life()
-        return is_blacklisted
+        if revocation_index.sync_due():
+            BlackListedTokens.sync_revocation_index()
+        return revocation_index.is_revoked(token)
 
     def decode(self: Self, token: str) -> Optional[dict[str, str]]:
         """
@@ -90,8 +83,8 @@ class JWTAuthentication(Authentication):
         # Get user ID from token
         user_id: int = valid_token.get("User")
 
-        # Query the user from the database
-        user: Optional[User] = User.query.get(user_id)
+        # Grab the user principal, cached for a short time
+        user: Optional[UserPrincipal] = principal_cache.get(user_id)
 
         # Check if user exists
         if user is None:
@@ -117,11 +110,6 @@ class RefreshTokenAuthentication(JWTAuthentication):
     Class for JWT Refresh Token Authentication.
     """
 
-    def check_blacklisted(
-        self: Self, token: str, user: User, field: str = "refresh"
-    ) -> bool:
-        return super().check_blacklisted(token, user, field)
-
     def token_type(self: Self, data: dict[str, str]) -> bool:
         """
         Method used to check if the token type is refresh token.
@@ -0,0 +1,153 @@
+"""
+# Module contains the cached user principal used by authentication
+
+A principal holds only what authentication and permissions need: the user id,
+the active flag and the staff/admin bits. The full `User` row is loaded lazily
+the first time any other attribute is read.
+
+```py
+from playstation.admin.authentications.principal import principal_cache
+
+user = principal_cache.get(user_id)  # No database round trip on a cache hit
+user.is_admin
+user.shipping_addresses  # Loads the User row
+```
+"""
+
+from typing import Self, Optional, Any
+from sqlalchemy import event, inspect
+from playstation import db
+from playstation.admin.cache import CacheBackend, create_cache, invalidate_on_commit
+from playstation.models.users import User
+from playstation.settings import PRINCIPAL_CACHE_TTL
+
+
+# User columns that invalidate a cached principal when they change
+PRINCIPAL_FIELDS: tuple[str, ...] = ("id", "active", "is_staff", "is_admin")
+
+
+class UserPrincipal:
+    """
+    Lightweight stand-in for an authenticated User.
+
+    Attributes:
+        id (int): User id.
+        active (bool): Indicates if the user is active.
+        is_staff (bool): Indicates if the user is staff.
+        is_admin (bool): Indicates if the user is an admin.
+    """
+
+    # Name used as the subject key when creating tokens for a principal
+    model_name: str = "User"
+
+    __slots__ = ("id", "active", "is_staff", "is_admin", "_instance")
+
+    def __init__(
+        self: Self, id: int, active: bool, is_staff: bool, is_admin: bool
+    ) -> None:
+        self.id: int = id
+        self.active: bool = active
+        self.is_staff: bool = is_staff
+        self.is_admin: bool = is_admin
+        self._instance: Optional[User] = None
+
+    def __repr__(self: Self) -> str:
+        return f"<{self.__class__.__name__} {self.id}>"
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        """
+        Returns the principal as a dictionary, the format stored in the cache.
+        """
+        return {field: getattr(self, field) for field in PRINCIPAL_FIELDS}
+
+    @property
+    def instance(self: Self) -> Optional[User]:
+        """
+        Returns the full User row, loaded on first access.
+        """
+        if self._instance is None:
+            self._instance = db.session.get(User, self.id)
+        return self._instance
+
+    def __getattr__(self: Self, name: str) -> Any:
+        # Only reached for attributes the principal does not hold
+        instance: Optional[User] = self.instance
+        if instance is None:
+            raise AttributeError(f"User {self.id} no longer exists")
+        return getattr(instance, name)
+
+
+class PrincipalCache:
+    """
+    Short TTL cache of user principals keyed by user id.
+
+    Attributes:
+        backend (CacheBackend): Cache backend storing the principals.
+        ttl (float): Seconds a principal is cached.
+    """
+
+    def __init__(self: Self, backend: CacheBackend, ttl: float) -> None:
+        self.backend: CacheBackend = backend
+        self.ttl: float = ttl
+
+    def get(self: Self, user_id: Optional[int]) -> Optional[UserPrincipal]:
+        """
+        Returns the principal of a user, querying only the principal columns on a miss.
+
+        Args:
+            user_id (Optional[int]): User id.
+
+        Returns:
+            Optional[UserPrincipal]: The principal or None if the user does not exist.
+        """
+        if user_id is None:
+            return None
+        cached: Optional[dict] = self.backend.get(str(user_id))
+        if cached is not None:
+            return UserPrincipal(**cached)
+        row = (
+            db.session.query(*(getattr(User, field) for field in PRINCIPAL_FIELDS))
+            .filter(User.id == user_id)
+            .first()
+        )
+        if row is None:
+            return None
+        principal: UserPrincipal = UserPrincipal(*row)
+        self.backend.set(str(user_id), principal.to_dict(), ttl=self.ttl)
+        return principal
+
+    def invalidate(self: Self, user_id: int) -> None:
+        """
+        Drops the cached principal of a user.
+
+        Args:
+            user_id (int): User id.
+        """
+        self.backend.delete(str(user_id))
+
+
+principal_cache: PrincipalCache = PrincipalCache(
+    create_cache("principals", max_entries=4096), ttl=PRINCIPAL_CACHE_TTL
+)
+
+
+# Per user invalidation; a rolled back change left the principal as it was
+invalidate_principal = invalidate_on_commit(principal_cache.invalidate, key="invalidated_principals", rollback=False)
+
+
+@event.listens_for(User, "after_update")
+def invalidate_updated_principal(mapper, connection, target: User) -> None:
+    """
+    Invalidate the principal when the active flag or the staff/admin bits change.
+    """
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in PRINCIPAL_FIELDS):
+        invalidate_principal(state.session, target.id)
+
+
+@event.listens_for(User, "after_delete")
+def invalidate_deleted_principal(mapper, connection, target: User) -> None:
+    """
+    Invalidate the principal of a deleted user.
+    """
+    invalidate_principal(inspect(target).session, target.id)
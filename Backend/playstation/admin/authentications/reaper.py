@@ -0,0 +1,91 @@
+"""
+# Module contains the background reaper for expired blacklisted tokens
+
+```py
+from playstation.admin.authentications.reaper import TokenReaper
+
+reaper = TokenReaper(app, interval=3600)
+reaper.start()  # Purge on a schedule
+reaper.reap()   # Purge once, returns counts and timings
+```
+"""
+
+import threading
+import time
+from typing import Self, Optional
+from flask import Flask
+from playstation.models.blacklisted_tokens import BlackListedTokens
+from .revocation import revocation_index
+
+
+class TokenReaper:
+    """
+    Purges expired blacklisted tokens outside of the request path.
+
+    Attributes:
+        app (Flask): Flask application providing the database context.
+        interval (float): Seconds between two purges.
+    """
+
+    def __init__(self: Self, app: Flask, interval: float) -> None:
+        """
+        Initializes the TokenReaper.
+
+        Args:
+            app (Flask): Flask application providing the database context.
+            interval (float): Seconds between two purges.
+        """
+        self.app: Flask = app
+        self.interval: float = interval
+        self._stopped: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def reap(self: Self) -> dict[str, float]:
+        """
+        Purge expired tokens from the database and the revocation index.
+
+        Returns:
+            dict: Number of purged rows, purged index entries and elapsed seconds.
+        """
+        started: float = time.perf_counter()
+        with self.app.app_context():
+            purged: int = BlackListedTokens.purge_expired()
+        index_purged: int = revocation_index.backend.purge_expired()
+        report: dict[str, float] = {
+            "purged": purged,
+            "index_purged": index_purged,
+            "seconds": round(time.perf_counter() - started, 6),
+        }
+        self.app.logger.info(
+            f"Token reaper purged {purged} rows and {index_purged} index entries in {report['seconds']}s"
+        )
+        return report
+
+    def _run(self: Self) -> None:
+        """
+        Reaper loop, runs until stop() is called.
+        """
+        while not self._stopped.wait(self.interval):
+            try:
+                self.reap()
+            except Exception as e:
+                self.app.logger.error(f"Token reaper failed: {e}")
+
+    def start(self: Self) -> None:
+        """
+        Start purging on a daemon thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="token-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self: Self) -> None:
+        """
+        Stop the reaper thread.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,130 @@
+"""
+# Module contains the revocation index for blacklisted tokens
+
+The index is keyed by a SHA-256 digest of the token so a lookup never loads
+`BlackListedTokens` rows or decodes a JWT. An in-process index only sees the
+revocations of its own process, so it loads the rows blacklisted by other
+processes at most once every `REVOCATION_SYNC_INTERVAL` seconds.
+
+```py
+from playstation.admin.authentications.revocation import revocation_index
+
+revocation_index.revoke(token)
+revocation_index.is_revoked(token)  # True
+```
+"""
+
+import hashlib
+import threading
+import time
+from datetime import timedelta
+from typing import Self, Optional
+from playstation.admin.cache import CacheBackend, SharedCache, create_cache
+from playstation.settings import JWT_AUTHENTICATIONS, REVOCATION_SYNC_INTERVAL
+
+
+class RevocationIndex:
+    """
+    Index of revoked tokens with entries that expire with the refresh lifetime.
+
+    Attributes:
+        backend (CacheBackend): Cache backend storing the token digests.
+        ttl (timedelta): Time a revocation is kept.
+        sync_interval (float): Seconds between two loads of new blacklisted tokens.
+        synced_id (int): Highest `BlackListedTokens` id loaded so far.
+    """
+
+    def __init__(
+        self: Self,
+        backend: CacheBackend,
+        ttl: timedelta = JWT_AUTHENTICATIONS["REFRESH_TOKEN_LIFETIME"],
+        sync_interval: float = REVOCATION_SYNC_INTERVAL,
+    ) -> None:
+        """
+        Initializes the RevocationIndex.
+
+        Args:
+            backend (CacheBackend): Cache backend storing the token digests.
+            ttl (timedelta): Time a revocation is kept.
+            sync_interval (float): Seconds between two loads of new blacklisted tokens.
+        """
+        self.backend: CacheBackend = backend
+        self.ttl: timedelta = ttl
+        self.sync_interval: float = sync_interval
+        self.synced_id: int = 0
+        self._synced_at: Optional[float] = None
+        self._sync_lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> str:
+        """
+        Create the index key of a token.
+
+        Args:
+            token (str): String token.
+
+        Returns:
+            str: Hex digest of the token.
+        """
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    @property
+    def shared(self: Self) -> bool:
+        """
+        True when every worker reads the same index, otherwise it only holds this process's revocations.
+        """
+        return isinstance(self.backend, SharedCache)
+
+    def sync_due(self: Self) -> bool:
+        """
+        Claim the next load of new blacklisted tokens, at most once per sync interval.
+
+        Returns:
+            bool: True if the caller should load them, always False for a shared index.
+        """
+        if self.shared:
+            return False
+        with self._sync_lock:
+            now: float = time.monotonic()
+            if self._synced_at is not None and now - self._synced_at < self.sync_interval:
+                return False
+            self._synced_at = now
+            return True
+
+    def revoke(self: Self, token: str, ttl: Optional[timedelta] = None) -> None:
+        """
+        Add a token to the index.
+
+        Args:
+            token (str): String token.
+            ttl (Optional[timedelta]): Time the revocation is kept, defaults to the refresh lifetime.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        self.backend.set(self.digest(token), 1, ttl=ttl.total_seconds())
+
+    def is_revoked(self: Self, token: str) -> bool:
+        """
+        Check if a token is in the index.
+
+        Args:
+            token (str): String token.
+
+        Returns:
+            bool: True if the token is revoked, otherwise False.
+        """
+        return self.backend.exists(self.digest(token))
+
+    def clear(self: Self) -> None:
+        """
+        Remove every token from the index, the next sync loads every row again.
+        """
+        self.backend.clear()
+        with self._sync_lock:
+            self.synced_id = 0
+            self._synced_at = None
+
+
+# Revocation entries must never be evicted early, so the in-process index is unbounded
+revocation_index: RevocationIndex = RevocationIndex(
+    create_cache("revoked_tokens", max_entries=None)
+)
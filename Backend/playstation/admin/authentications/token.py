@@ -42,6 +42,19 @@ class TokenUtility:
         """
         return hasattr(model, id)
 
+    @staticmethod
+    def subject_name(model: object) -> str:
+        """
+        Get the payload key identifying the model of a token.
+
+        Args:
+            - model (object): Model instance or principal standing in for one
+
+        Returns:
+            - str: Model name, principals report the name of the model they stand for
+        """
+        return getattr(model, "model_name", model.__class__.__name__)
+
 
 # Refresh Token Class
 class RefreshToken:
@@ -73,7 +86,7 @@ class RefreshToken:
             raise ValueError("Model instance must have an id attribute")
         # Payload
         payload: dict[str, str] = {
-            f"{model.__class__.__name__}": getattr(model, id),
+            TokenUtility.subject_name(model): getattr(model, id),
             "type": "access",
             "exp": datetime.now(timezone.utc) + time,
         }
@@ -110,7 +123,7 @@ class RefreshToken:
             raise ValueError("Model instance must have an id attribute")
         # Payload
         payload: dict[str, str] = {
-            f"{model.__class__.__name__}": getattr(model, id),
+            TokenUtility.subject_name(model): getattr(model, id),
             "type": "refresh",
             "exp": datetime.now(timezone.utc) + time,
         }
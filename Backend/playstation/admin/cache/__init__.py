@@ -0,0 +1,63 @@
+"""
+cache package initialization.
+
+```py
+from playstation.admin.cache import create_cache
+
+cache = create_cache("namespace", max_entries=512)
+cache.set("key", {"value": 1}, ttl=60)
+```
+"""
+
+from typing import Any, Optional
+from .backends import CacheBackend, InMemoryCache, SharedCache, LocalSharedStore
+from .invalidation import invalidate_on_commit, run_on_commit
+from playstation.settings import CACHE, CACHE_URL
+
+
+# Shared client, created once per process
+_shared_client: Optional[Any] = None
+
+
+def get_shared_client() -> Any:
+    """
+    Returns the shared store client selected by the CACHE setting.
+
+    Returns:
+        Redis client or LocalSharedStore stand-in.
+    """
+    global _shared_client
+    if _shared_client is None:
+        if CACHE.lower() == "redis":
+            try:
+                import redis
+            except ImportError:
+                raise ImportError("CACHE is set to 'redis' but the redis package is not installed")
+            _shared_client = redis.Redis.from_url(CACHE_URL)
+        else:
+            _shared_client = LocalSharedStore()
+    return _shared_client
+
+
+def create_cache(
+    namespace: str, max_entries: Optional[int] = 1024, default_ttl: Optional[float] = None
+) -> CacheBackend:
+    """
+    Create a cache backend for a namespace based on the CACHE setting.
+
+    Args:
+        namespace (str): Name used to prefix keys in shared stores.
+        max_entries (Optional[int]): Maximum entries for the in-process backend, None for unbounded.
+        default_ttl (Optional[float]): Default TTL in seconds.
+
+    Returns:
+        CacheBackend: The configured cache backend.
+    """
+    if CACHE.lower() in {"redis", "local"}:
+        return SharedCache(
+            get_shared_client(),
+            prefix=f"playstation:{namespace}:",
+            default_ttl=default_ttl,
+            namespace=namespace,
+        )
+    return InMemoryCache(max_entries=max_entries, default_ttl=default_ttl, namespace=namespace)
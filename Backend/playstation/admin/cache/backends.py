@@ -0,0 +1,317 @@
+"""
+Module for cache backends.
+"""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Self
+from playstation.admin.metrics import record_cache
+
+
+class CacheBackend(ABC):
+    """
+    Abstract base class for cache backends.
+
+    Methods:
+        get(key): Returns the cached value or None.
+        set(key, value, ttl): Stores a value with an optional time to live in seconds.
+        delete(key): Removes a value from the cache.
+        exists(key): Checks if a key is cached.
+        clear(): Removes every value from the cache.
+    """
+
+    @abstractmethod
+    def get(self: Self, key: str) -> Optional[Any]:
+        """
+        Returns the cached value for a key.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Any]: The cached value or None if missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self: Self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value in the cache.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to store, must be JSON serializable for shared backends.
+            ttl (Optional[float]): Time to live in seconds, None means no expiry.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self: Self, key: str) -> None:
+        """
+        Removes a key from the cache.
+
+        Args:
+            key (str): Cache key.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self: Self) -> None:
+        """
+        Removes every key from the cache.
+        """
+        pass
+
+    def exists(self: Self, key: str) -> bool:
+        """
+        Checks if a key is cached.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            bool: True if the key is cached, otherwise False.
+        """
+        return self.get(key) is not None
+
+    def purge_expired(self: Self) -> int:
+        """
+        Removes every expired entry, backends with native expiry have nothing to do.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        return 0
+
+
+class InMemoryCache(CacheBackend):
+    """
+    Thread safe in-process cache with LRU and TTL eviction.
+
+    Attributes:
+        max_entries (Optional[int]): Maximum number of entries before the least recently used
+            is evicted, None keeps every entry until it expires.
+        default_ttl (Optional[float]): TTL applied when set() is called without one.
+        namespace (str): Name the lookups are counted under in the metrics.
+    """
+
+    def __init__(
+        self: Self,
+        max_entries: Optional[int] = 1024,
+        default_ttl: Optional[float] = None,
+        namespace: str = "",
+    ) -> None:
+        """
+        Initializes the InMemoryCache.
+
+        Args:
+            max_entries (Optional[int]): Maximum number of entries.
+            default_ttl (Optional[float]): Default TTL in seconds.
+            namespace (str): Name the lookups are counted under in the metrics.
+        """
+        self.max_entries: Optional[int] = max_entries
+        self.default_ttl: Optional[float] = default_ttl
+        self.namespace: str = namespace
+        self._entries: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self: Self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry: Optional[tuple] = self._entries.get(key)
+            if entry is None:
+                record_cache(self.namespace, False)
+                return None
+            expires_at, value = entry
+            # Expired entries are dropped lazily on read
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                record_cache(self.namespace, False)
+                return None
+            self._entries.move_to_end(key)
+            record_cache(self.namespace, True)
+            return value
+
+    def set(self: Self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at: Optional[float] = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if self.max_entries is None or len(self._entries) <= self.max_entries:
+                return
+            # Drop expired entries before evicting live ones
+            self._purge_expired()
+            # Evict least recently used entries
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _purge_expired(self: Self) -> int:
+        now: float = time.monotonic()
+        expired: list[str] = [
+            key
+            for key, (expires_at, _) in self._entries.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def purge_expired(self: Self) -> int:
+        """
+        Removes every expired entry.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        with self._lock:
+            return self._purge_expired()
+
+    def delete(self: Self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self: Self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self: Self) -> int:
+        return len(self._entries)
+
+
+class SharedCache(CacheBackend):
+    """
+    Cache backed by a shared key/value store such as Redis.
+
+    The client only needs the subset of the redis-py API used here:
+    get, set(name, value, ex=None), delete, exists and incr.
+    Values are stored as JSON so every process reads the same data.
+
+    Attributes:
+        client: Redis compatible client.
+        prefix (str): Prefix applied to every key.
+        default_ttl (Optional[float]): TTL applied when set() is called without one.
+        namespace (str): Name the lookups are counted under in the metrics.
+    """
+
+    def __init__(
+        self: Self,
+        client: Any,
+        prefix: str = "",
+        default_ttl: Optional[float] = None,
+        namespace: str = "",
+    ) -> None:
+        """
+        Initializes the SharedCache.
+
+        Args:
+            client: Redis compatible client.
+            prefix (str): Prefix applied to every key.
+            default_ttl (Optional[float]): Default TTL in seconds.
+            namespace (str): Name the lookups are counted under in the metrics.
+        """
+        self.client = client
+        self.prefix: str = prefix
+        self.default_ttl: Optional[float] = default_ttl
+        self.namespace: str = namespace
+
+    def _key(self: Self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def get(self: Self, key: str) -> Optional[Any]:
+        value = self.client.get(self._key(key))
+        record_cache(self.namespace, value is not None)
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def set(self: Self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        # Redis expects whole seconds, never round a short TTL down to "no expiry"
+        expiry: Optional[int] = None if ttl is None else max(1, int(ttl))
+        self.client.set(self._key(key), json.dumps(value), ex=expiry)
+
+    def delete(self: Self, key: str) -> None:
+        self.client.delete(self._key(key))
+
+    def exists(self: Self, key: str) -> bool:
+        return bool(self.client.exists(self._key(key)))
+
+    def incr(self: Self, key: str) -> int:
+        """
+        Atomically increments an integer counter.
+
+        Args:
+            key (str): Counter key.
+
+        Returns:
+            int: The value after the increment.
+        """
+        return int(self.client.incr(self._key(key)))
+
+    def clear(self: Self) -> None:
+        """
+        Removes every key under this cache prefix.
+        """
+        for key in list(self.client.scan_iter(f"{self.prefix}*")):
+            self.client.delete(key)
+
+
+class LocalSharedStore:
+    """
+    In-process stand-in for a Redis client.
+
+    Implements the subset of the redis-py API used by SharedCache so the shared
+    backend can run in tests and local development without a Redis server.
+    """
+
+    def __init__(self: Self) -> None:
+        self._data: dict[str, tuple[Optional[float], Any]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _alive(self: Self, name: str) -> Optional[tuple[Optional[float], Any]]:
+        entry = self._data.get(name)
+        if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+            del self._data[name]
+            return None
+        return entry
+
+    def get(self: Self, name: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._alive(name)
+            return None if entry is None else entry[1]
+
+    def set(self: Self, name: str, value: Any, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            expires_at = None if ex is None else time.monotonic() + ex
+            self._data[name] = (expires_at, value)
+        return True
+
+    def delete(self: Self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def exists(self: Self, *names: str) -> int:
+        with self._lock:
+            return sum(self._alive(name) is not None for name in names)
+
+    def incr(self: Self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            entry = self._alive(name)
+            expires_at, value = entry if entry is not None else (None, 0)
+            value = int(value) + amount
+            self._data[name] = (expires_at, str(value))
+            return value
+
+    def scan_iter(self: Self, match: str = "*"):
+        prefix: str = match.rstrip("*")
+        with self._lock:
+            names: list[str] = [name for name in self._data if name.startswith(prefix)]
+        return iter(names)
+
+    def flushdb(self: Self) -> bool:
+        with self._lock:
+            self._data.clear()
+        return True
@@ -0,0 +1,101 @@
+"""
+# Module contains helpers deferring cache work until a session's transaction ends
+
+A cache filled from the database is invalidated at flush time and again once
+the transaction commits, so a concurrent request cannot cache the old rows in
+between. Rolling back either invalidates again or forgets the pending work.
+
+```py
+from playstation.admin.cache.invalidation import invalidate_on_commit
+
+invalidate_on_commit(category_ids.invalidate, Category, key="invalidated_categories")
+```
+"""
+
+from typing import Any, Callable, Hashable, Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, ORMExecuteState
+
+
+def run_on_commit(
+    key: str, apply: Callable[..., None], rollback: bool = False
+) -> Callable[..., None]:
+    """
+    Register session listeners running deferred calls once a transaction ends.
+
+    Calls with the same arguments run once, in the order of their last deferral.
+
+    Args:
+        key (str): `session.info` key holding the pending arguments.
+        apply (Callable[..., None]): Called with each pending arguments after commit.
+        rollback (bool): Also call `apply` after a rollback instead of forgetting the calls.
+
+    Returns:
+        Callable[..., None]: `defer(session, *args)` queueing a call for the session's transaction.
+    """
+    def defer(session: Session, *args: Hashable) -> None:
+        pending: dict[tuple, None] = session.info.setdefault(key, {})
+        pending.pop(args, None)
+        pending[args] = None
+
+    @event.listens_for(Session, "after_commit")
+    def apply_committed(session: Session) -> None:
+        for args in session.info.pop(key, ()):
+            apply(*args)
+
+    @event.listens_for(Session, "after_rollback")
+    def end_rolled_back(session: Session) -> None:
+        pending: dict[tuple, None] = session.info.pop(key, {})
+        if rollback:
+            for args in pending:
+                apply(*args)
+
+    return defer
+
+
+def invalidate_on_commit(
+    invalidate: Callable[..., None],
+    *models: type,
+    key: str,
+    rollback: bool = True,
+    statements: bool = False,
+) -> Callable[..., None]:
+    """
+    Invalidate a cache when rows of the models are written, at flush time and after commit.
+
+    Args:
+        invalidate (Callable[..., None]): Cache invalidation, called without arguments for mapper events.
+        *models (type): Models whose inserts, updates and deletes invalidate the whole cache.
+        key (str): `session.info` key holding the pending invalidations.
+        rollback (bool): Invalidate again after a rollback instead of forgetting the pending invalidations.
+        statements (bool): Also invalidate on ORM-enabled INSERT, UPDATE and DELETE statements,
+            which skip mapper events.
+
+    Returns:
+        Callable[..., None]: `mark(session, *args)` invalidating now and again after commit,
+            for listeners that only invalidate some entries.
+    """
+    defer: Callable[..., None] = run_on_commit(key, invalidate, rollback=rollback)
+
+    def mark(session: Optional[Session], *args: Hashable) -> None:
+        invalidate(*args)
+        if session is not None:
+            defer(session, *args)
+
+    def invalidate_written(mapper, connection, target: Any) -> None:
+        mark(inspect(target).session)
+
+    for model in models:
+        for name in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, name, invalidate_written)
+
+    if statements and models:
+        @event.listens_for(Session, "do_orm_execute")
+        def invalidate_statement(orm_execute_state: ORMExecuteState) -> None:
+            if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+                return
+            mapper = orm_execute_state.bind_mapper
+            if mapper is not None and mapper.class_ in models:
+                mark(orm_execute_state.session)
+
+    return mark
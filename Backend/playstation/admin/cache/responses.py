@@ -0,0 +1,142 @@
+"""
+# Module contains the cache of public JSON responses
+
+Entries are keyed by a name and the normalized request parameters. Every entry
+carries an ETag, so a client sending `If-None-Match` gets a 304 without the
+body. Invalidation swaps the cache generation: entries of older generations are
+never read again and age out through the TTL and LRU eviction of the backend.
+
+```py
+from playstation.admin.cache import create_cache
+from playstation.admin.cache.responses import ResponseCache
+
+listings = ResponseCache(create_cache("listings"), ttl=60)
+
+return listings.respond("products", validated_queries, build_products)
+listings.invalidate()
+```
+"""
+
+import hashlib
+import json
+import uuid
+from typing import Self, Optional, Any, Callable
+from flask import Response, jsonify, request
+from .backends import CacheBackend
+
+
+class ResponseCache:
+    """
+    Cache of JSON responses with ETag revalidation.
+
+    Attributes:
+        backend (CacheBackend): Cache backend storing the responses.
+        ttl (float): Seconds a response is cached, 0 disables the cache.
+    """
+
+    generation_key: str = "generation"
+
+    def __init__(self: Self, backend: CacheBackend, ttl: float) -> None:
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            backend (CacheBackend): Cache backend storing the responses.
+            ttl (float): Seconds a response is cached, 0 disables the cache.
+        """
+        self.backend: CacheBackend = backend
+        self.ttl: float = ttl
+
+    def generation(self: Self) -> str:
+        """
+        Returns the current generation, a new one is started when it is missing.
+        """
+        generation: Optional[str] = self.backend.get(self.generation_key)
+        if generation is None:
+            # An evicted generation must never revive older entries
+            generation = uuid.uuid4().hex
+            self.backend.set(self.generation_key, generation)
+        return generation
+
+    def invalidate(self: Self) -> None:
+        """
+        Start a new generation, every cached response becomes unreachable.
+        """
+        self.backend.set(self.generation_key, uuid.uuid4().hex)
+
+    def key(self: Self, name: str, params: Any) -> str:
+        """
+        Create the cache key of a response in the current generation.
+
+        Args:
+            name (str): Response name.
+            params (Any): Normalized request parameters.
+
+        Returns:
+            str: Cache key.
+        """
+        digest: str = hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return f"{self.generation()}:{name}:{digest}"
+
+    @staticmethod
+    def etag(body: Any) -> str:
+        """
+        Returns the ETag of a response body.
+        """
+        return hashlib.sha256(
+            json.dumps(body, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def respond(
+        self: Self,
+        name: str,
+        params: Any,
+        build: Callable[[], tuple[Any, dict[str, str]]],
+    ) -> Response:
+        """
+        Returns the cached response, building and caching it on a miss.
+
+        The key is created before the response is built, so a response built
+        while the cache is invalidated is stored in the old generation.
+
+        Args:
+            name (str): Response name.
+            params (Any): Normalized request parameters.
+            build (Callable): Returns the JSON body and the extra headers of the response.
+
+        Returns:
+            Response: The response, 304 when the client already has it.
+        """
+        if self.ttl <= 0:
+            body, headers = build()
+            return self.make_response({"body": body, "headers": headers, "etag": self.etag(body)})
+        key: str = self.key(name, params)
+        entry: Optional[dict] = self.backend.get(key)
+        if entry is None:
+            body, headers = build()
+            entry = {"body": body, "headers": headers, "etag": self.etag(body)}
+            self.backend.set(key, entry, ttl=self.ttl)
+        return self.make_response(entry)
+
+    @staticmethod
+    def make_response(entry: dict) -> Response:
+        """
+        Create the response of a cache entry, honouring `If-None-Match`.
+
+        Args:
+            entry (dict): Body, headers and ETag of the response.
+
+        Returns:
+            Response: 200 with the body or 304 without it.
+        """
+        if request.if_none_match.contains(entry["etag"]):
+            response: Response = Response(status=304)
+        else:
+            response = jsonify(entry["body"])
+            response.headers.update(entry["headers"])
+        response.set_etag(entry["etag"])
+        # Clients may store the response but must revalidate it
+        response.headers["Cache-Control"] = "no-cache"
+        return response
@@ -4,8 +4,8 @@ file_manager package initialization.
 
 from .file_handler import FileHandler
 from .image_handler import ImageHandler
-from .storage import LocalStorage, AmazonS3Bucket
-from playstation.settings import STORAGE
+from .storage import LocalStorage, AmazonS3Bucket, ContentAddressedStorage
+from playstation.settings import STORAGE, BLOB_DIR
 
 
 # Check if storage is local or Amazon
@@ -14,13 +14,22 @@ if STORAGE.lower() in {"amazon", "aws"}:
         AWS_STORAGE_BUCKET_NAME,
         AWS_ACCESS_KEY_ID,
         AWS_SECRET_ACCESS_KEY,
+        AWS_S3_ENDPOINT_URL,
+        AWS_S3_TRANSFER,
     )
 
-    storage = AmazonS3Bucket(
-        AWS_STORAGE_BUCKET_NAME, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
+    backend = AmazonS3Bucket(
+        AWS_STORAGE_BUCKET_NAME,
+        AWS_ACCESS_KEY_ID,
+        AWS_SECRET_ACCESS_KEY,
+        endpoint_url=AWS_S3_ENDPOINT_URL or None,
+        **AWS_S3_TRANSFER,
     )
 else:
-    storage = LocalStorage()
+    backend = LocalStorage()
+
+# Every upload is stored once, by content
+storage: ContentAddressedStorage = ContentAddressedStorage(backend, BLOB_DIR)
 
 # Define image and file handlers
 image_handler: ImageHandler = ImageHandler(storage)
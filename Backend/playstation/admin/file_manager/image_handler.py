@@ -1,12 +1,66 @@
 """
 Module for handling image file operations.
+
+Uploads are validated from memory before anything is written. Resized
+variants (see `IMAGE_VARIANTS`) are encoded as WebP and in the original
+format by a pool of worker threads, so the request thread only stores the
+original.
+
+```py
+upload = image_handler.upload(file, upload_dir, safe=True)
+upload.process(lambda variants: print(variants["card"]["webp"]))
+```
 """
 
 import os
-from PIL import Image
+import threading
+from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterator, Optional
+from PIL import Image, ImageOps
+from werkzeug.datastructures import FileStorage
 from .file_handler import FileHandler
+from .storage import Storage
 from .exceptions import InvalidFileTypeException
-from playstation.settings import MEDIA_DIR, ALLOW_IMAGE_TYPES, STATIC_DIR
+from playstation.admin.metrics import observe_image
+from playstation.settings import MEDIA_DIR, ALLOW_IMAGE_TYPES, STATIC_DIR, IMAGE_VARIANTS, IMAGE_WORKERS
+
+
+# Pillow format of each allowed extension
+IMAGE_FORMATS: dict[str, str] = {"png": "PNG", "jpg": "JPEG", "jpeg": "JPEG"}
+
+
+class ImageUpload:
+    """
+    An image stored by `ImageHandler.upload`, whose variants can be generated later.
+
+    Attributes:
+        path (str): Path of the stored original, without the static directory when safe.
+        data (bytes): Content of the original.
+        stored_path (str): Path the storage returned for the original.
+        filename (str): File name of the stored original.
+        safe (bool): Whether the paths have the static directory removed.
+    """
+
+    def __init__(self, handler: "ImageHandler", path: str, data: bytes, stored_path: str, safe: bool):
+        self.handler: ImageHandler = handler
+        self.path: str = path
+        self.data: bytes = data
+        self.stored_path: str = stored_path
+        self.filename: str = os.path.basename(handler.storage.key(stored_path))
+        self.safe: bool = safe
+
+    def process(self, on_done: Optional[Callable[[dict], None]] = None) -> Future:
+        """
+        Generate the variants in the worker pool.
+
+        Args:
+            on_done (Optional[Callable[[dict], None]]): Called from the worker with the variants.
+
+        Returns:
+            Future: Resolves to the variants.
+        """
+        return self.handler.submit(self, on_done)
 
 
 class ImageHandler(FileHandler):
@@ -17,8 +71,26 @@ class ImageHandler(FileHandler):
 
     Methods:
         save_image(file, upload_dir, allowed_extensions=None): Saves an image file to the specified directory.
+        upload(file, upload_dir, allowed_extensions=None): Saves an image file and returns an ImageUpload.
+        save_variants(upload): Resizes and stores the variants of an upload.
     """
 
+    def __init__(self, storage: Storage, variants: dict[str, int] = IMAGE_VARIANTS, workers: int = IMAGE_WORKERS):
+        """
+        Initializes the ImageHandler with the specified storage.
+
+        Args:
+            storage (Storage): The storage mechanism to use.
+            variants (dict[str, int]): Maximum width of each variant.
+            workers (int): Threads generating variants.
+        """
+        super().__init__(storage)
+        self.variants: dict[str, int] = variants
+        self.workers: int = max(workers, 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: set[Future] = set()
+        self._lock: threading.Lock = threading.Lock()
+
     def save_image(
         self,
         file,
@@ -38,43 +110,191 @@ class ImageHandler(FileHandler):
         Returns:
             str: The path where the image was saved.
 
+        Raises:
+            InvalidFileTypeException: If the file type is not allowed or the file is not a valid image.
+        """
+        return self.upload(file, upload_dir, allowed_extensions, safe).path
+
+    def upload(
+        self,
+        file,
+        upload_dir: str = MEDIA_DIR,
+        allowed_extensions: set = ALLOW_IMAGE_TYPES,
+        safe: bool = False,
+    ) -> ImageUpload:
+        """
+        Validates the image from memory, then saves it to the specified upload directory.
+
+        Args:
+            file: The image file to be saved.
+            upload_dir (str): The directory where the file should be saved.
+            allowed_extensions (set, optional): A set of allowed file extensions. Defaults to {'png', 'jpg', 'jpeg'}.
+            safe (bool, optional): Whether to save the file in a safe manner. Defaults to False
+
+        Returns:
+            ImageUpload: The saved image.
+
         Raises:
             InvalidFileTypeException: If the file type is not allowed or the file is not a valid image.
         """
         if not self._is_allowed_file(file.filename, allowed_extensions):
             raise InvalidFileTypeException(f"Invalid file type: {file.filename}")
-        file_path = self.save_file(file, upload_dir)
-        self._validate_image(file_path)
-        return file_path if not safe else file_path.replace(STATIC_DIR, "")
+        with observe_image("upload"):
+            data: bytes = self._read_image(file)
+            file_path = self.save_file(file, upload_dir)
+        return ImageUpload(self, self._public_path(file_path, safe), data, file_path, safe)
 
-    def _is_allowed_file(self, filename, allowed_extensions):
+    def submit(self, upload: ImageUpload, on_done: Optional[Callable[[dict], None]] = None) -> Future:
         """
-        Checks if the file has an allowed extension.
+        Generate the variants of an upload in the worker pool.
 
         Args:
-            filename (str): The name of the file.
-            allowed_extensions (set): A set of allowed file extensions.
+            upload (ImageUpload): The saved image.
+            on_done (Optional[Callable[[dict], None]]): Called from the worker with the variants.
 
         Returns:
-            bool: True if the file extension is allowed, False otherwise.
+            Future: Resolves to the variants.
         """
-        return (
-            "." in filename and filename.rsplit(".", 1)[1].lower() in allowed_extensions
-        )
 
-    def _validate_image(self, file_path):
+        def job() -> dict:
+            variants: dict = self.save_variants(upload)
+            if on_done is not None:
+                on_done(variants)
+            return variants
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="images")
+            future: Future = self._executor.submit(job)
+            self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the variants being generated.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait at most.
+        """
+        wait(list(self._pending), timeout=timeout)
+
+    def save_variants(self, upload: ImageUpload) -> dict:
+        """
+        Resizes the upload to every variant width and stores each as WebP and in the original format.
+        Images narrower than a variant are not enlarged. Every variant is stored in one `save_many` batch.
+
+        Args:
+            upload (ImageUpload): The saved image.
+
+        Returns:
+            dict: Width and paths of each variant, by name.
+        """
+        with observe_image("variants"):
+            return self._save_variants(upload)
+
+    def _save_variants(self, upload: ImageUpload) -> dict:
+        """
+        Encodes and stores the variants of an upload, see save_variants.
+        """
+        extension: str = upload.filename.rsplit(".", 1)[1].lower()
+        formats: dict[str, str] = {"webp": "WEBP", extension: IMAGE_FORMATS.get(extension, "PNG")}
+        widths: dict[str, int] = {}
+        files: list[tuple[FileStorage, str]] = []
+        with Image.open(BytesIO(upload.data)) as opened:
+            image: Image.Image = ImageOps.exif_transpose(opened)
+            for name, max_width in self.variants.items():
+                resized: Image.Image = image
+                if image.width > max_width:
+                    height: int = max(round(image.height * max_width / image.width), 1)
+                    resized = image.resize((max_width, height), Image.Resampling.LANCZOS)
+                widths[name] = resized.width
+                for variant_extension, format in formats.items():
+                    filename: str = self.variant_name(upload.filename, name, variant_extension)
+                    files.append((self._encode_variant(resized, filename, format), filename))
+
+        paths: Iterator[str] = iter(self.storage.save_many_beside(files, upload.stored_path))
+        variants: dict = {}
+        for name, width in widths.items():
+            variants[name] = {"width": width}
+            for variant_extension in formats:
+                variants[name][variant_extension] = self._public_path(next(paths), upload.safe)
+        return variants
+
+    def _encode_variant(self, image: Image.Image, filename: str, format: str) -> FileStorage:
+        """
+        Encodes one variant in memory.
+
+        Returns:
+            FileStorage: The encoded variant.
+        """
+        buffer: BytesIO = BytesIO()
+        if format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        if format == "PNG":
+            image.save(buffer, format, optimize=True)
+        else:
+            image.save(buffer, format, quality=80)
+        buffer.seek(0)
+        return FileStorage(stream=buffer, filename=filename)
+
+    @staticmethod
+    def variant_name(filename: str, variant: str, extension: str) -> str:
+        """
+        Returns the file name of a variant, e.g. `cover.png@card.webp`.
+        """
+        return f"{filename}@{variant}.{extension}"
+
+    @staticmethod
+    def original_path(path: str) -> str:
+        """
+        Returns the path of the original image of a variant, or the path itself.
         """
-        Validates that the file at the specified path is a valid image.
+        directory, filename = os.path.split(path)
+        if "@" not in filename:
+            return path
+        return os.path.join(directory, filename.split("@", 1)[0])
+
+    def _public_path(self, file_path: str, safe: bool) -> str:
+        """
+        Removes the static directory from a path when saving in a safe manner.
+        """
+        return file_path if not safe else file_path.replace(STATIC_DIR, "")
+
+    def _read_image(self, file) -> bytes:
+        """
+        Reads and validates the uploaded image from memory, before it is saved.
 
         Args:
-            file_path (str): The path to the image file.
+            file: The uploaded image file.
+
+        Returns:
+            bytes: Content of the image.
 
         Raises:
             InvalidFileTypeException: If the file is not a valid image.
         """
+        stream = getattr(file, "stream", file)
+        data: bytes = stream.read()
+        stream.seek(0)
         try:
-            img = Image.open(file_path)
-            img.verify()
-        except (IOError, SyntaxError) as e:
-            os.remove(file_path)
+            with Image.open(BytesIO(data)) as image:
+                image.verify()
+        except (IOError, SyntaxError, Image.DecompressionBombError) as e:
             raise InvalidFileTypeException(f"Invalid image file: {str(e)}")
+        return data
+
+    def _is_allowed_file(self, filename, allowed_extensions):
+        """
+        Checks if the file has an allowed extension.
+
+        Args:
+            filename (str): The name of the file.
+            allowed_extensions (set): A set of allowed file extensions.
+
+        Returns:
+            bool: True if the file extension is allowed, False otherwise.
+        """
+        return (
+            "." in filename and filename.rsplit(".", 1)[1].lower() in allowed_extensions
+        )
@@ -3,9 +3,18 @@ Module for storage handling.
 """
 
 import os
+import re
+import hashlib
+import threading
 import boto3
 from abc import ABC, abstractmethod
-from botocore.exceptions import NoCredentialsError
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from typing import Iterable, Iterator, Optional
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError, NoCredentialsError
+from werkzeug.datastructures import FileStorage
 from .exceptions import FileSaveException
 
 
@@ -15,6 +24,11 @@ class Storage(ABC):
 
     Methods:
         save(file, upload_dir, filename): Saves the file to the specified directory.
+        save_many(files): Saves several files concurrently.
+        save_beside(file, path, filename): Saves a file in the directory of a stored file.
+        exists(key): Checks if a file is stored.
+        delete(key): Deletes a stored file.
+        list_keys(prefix): Lists the stored files under a prefix.
     """
 
     @abstractmethod
@@ -32,6 +46,95 @@ class Storage(ABC):
         """
         pass
 
+    # Threads used by save_many
+    workers: int = 1
+
+    def save_many(self, files: Iterable[tuple]) -> list[str]:
+        """
+        Saves several files, concurrently when the storage has more than one worker.
+
+        Args:
+            files (Iterable[tuple]): (file, upload_dir, filename) of every file.
+
+        Returns:
+            list[str]: The paths where the files were saved, in order.
+
+        Raises:
+            FileSaveException: If a file cannot be saved, after every save finished.
+        """
+        files = list(files)
+        if self.workers <= 1 or len(files) <= 1:
+            return [self.save(*item) for item in files]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(files))) as executor:
+            return list(executor.map(lambda item: self.save(*item), files))
+
+    def save_beside(self, file, path, filename):
+        """
+        Saves a file derived from a stored file, such as a resized image, in the same directory.
+
+        Args:
+            file: The file to be saved.
+            path (str): The path returned when the original file was saved.
+            filename (str): The name of the file.
+
+        Returns:
+            str: The path where the file was saved.
+        """
+        return self.save(file, os.path.dirname(self.key(path)), filename)
+
+    def save_many_beside(self, files: Iterable[tuple], path: str) -> list[str]:
+        """
+        Saves several files derived from a stored file in its directory, see save_many.
+
+        Args:
+            files (Iterable[tuple]): (file, filename) of every file.
+            path (str): The path returned when the original file was saved.
+
+        Returns:
+            list[str]: The paths where the files were saved, in order.
+        """
+        directory: str = os.path.dirname(self.key(path))
+        return self.save_many((file, directory, filename) for file, filename in files)
+
+    def key(self, path: str) -> str:
+        """
+        Returns the storage key of a path returned by save().
+        """
+        return path
+
+    def url(self, key: str) -> str:
+        """
+        Returns the path save() returns for a storage key.
+        """
+        return key
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """
+        Checks if a file is stored under the key.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Deletes the file stored under the key.
+        """
+        pass
+
+    def touch(self, key: str) -> None:
+        """
+        Updates the modification time of a stored file.
+        """
+        pass
+
+    @abstractmethod
+    def list_keys(self, prefix: str) -> Iterator[tuple[str, float]]:
+        """
+        Lists the keys stored under a prefix with their modification timestamps.
+        """
+        pass
+
 
 class LocalStorage(Storage):
     """
@@ -41,6 +144,15 @@ class LocalStorage(Storage):
         save(file, upload_dir, filename): Saves the file to the local filesystem.
     """
 
+    def __init__(self, workers: int = 1):
+        """
+        Initializes the LocalStorage.
+
+        Args:
+            workers (int): Files written at the same time by save_many.
+        """
+        self.workers: int = workers
+
     def save(self, file, upload_dir, filename):
         """
         Saves the file to the local filesystem.
@@ -59,20 +171,54 @@ class LocalStorage(Storage):
         file.save(file_path)
         return file_path
 
+    def exists(self, key: str) -> bool:
+        return os.path.exists(key)
+
+    def delete(self, key: str) -> None:
+        if os.path.exists(key):
+            os.remove(key)
+
+    def touch(self, key: str) -> None:
+        os.utime(key)
+
+    def list_keys(self, prefix: str) -> Iterator[tuple[str, float]]:
+        for root, _, filenames in os.walk(prefix):
+            for filename in filenames:
+                path: str = os.path.join(root, filename)
+                yield path, os.path.getmtime(path)
+
 
 class AmazonS3Bucket(Storage):
     """
     Concrete implementation of Storage for saving files to Amazon S3.
 
+    The client is built on first use with a connection pool sized for
+    `save_many`, and retries throttled or failed calls with backoff. Large
+    files are uploaded in concurrent multipart chunks. An `endpoint_url`
+    points the bucket at an S3-compatible server such as MinIO.
+
     Attributes:
         bucket_name (str): The name of the S3 bucket.
         s3_client: The boto3 S3 client.
+        transfer_config (TransferConfig): Multipart thresholds and concurrency of uploads.
 
     Methods:
         save(file, upload_dir, filename): Uploads the file to the S3 bucket.
     """
 
-    def __init__(self, bucket_name, aws_access_key_id, aws_secret_access_key):
+    def __init__(
+        self,
+        bucket_name,
+        aws_access_key_id,
+        aws_secret_access_key,
+        endpoint_url: Optional[str] = None,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        multipart_chunksize: int = 8 * 1024 * 1024,
+        max_concurrency: int = 10,
+        max_pool_connections: int = 20,
+        max_attempts: int = 5,
+        workers: int = 8,
+    ):
         """
         Initializes the AmazonS3Bucket with the specified bucket name and credentials.
 
@@ -80,13 +226,48 @@ class AmazonS3Bucket(Storage):
             bucket_name (str): The name of the S3 bucket.
             aws_access_key_id (str): The AWS Access Key ID.
             aws_secret_access_key (str): The AWS Secret Access Key.
+            endpoint_url (Optional[str]): URL of an S3-compatible server, None for Amazon S3.
+            multipart_threshold (int): Files from this size are uploaded in parts.
+            multipart_chunksize (int): Size of each part.
+            max_concurrency (int): Parts of one file uploaded at the same time.
+            max_pool_connections (int): Connections kept open to S3.
+            max_attempts (int): Attempts of each call, retried with backoff.
+            workers (int): Files uploaded at the same time by save_many.
         """
         self.bucket_name = bucket_name
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
+        self.endpoint_url: Optional[str] = endpoint_url
+        self.workers: int = workers
+        self.transfer_config: TransferConfig = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+        )
+        self.client_config: Config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={"max_attempts": max_attempts, "mode": "adaptive"},
         )
+        self._credentials: dict = {
+            "aws_access_key_id": aws_access_key_id,
+            "aws_secret_access_key": aws_secret_access_key,
+        }
+        self._client = None
+        self._client_lock: threading.Lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        """
+        The boto3 S3 client, built on first use and shared by every thread.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.client(
+                        "s3",
+                        endpoint_url=self.endpoint_url,
+                        config=self.client_config,
+                        **self._credentials,
+                    )
+        return self._client
 
     def save(self, file, upload_dir, filename):
         """
@@ -105,10 +286,152 @@ class AmazonS3Bucket(Storage):
         """
         try:
             s3_path = os.path.join(upload_dir, filename)
-            self.s3_client.upload_fileobj(file, self.bucket_name, s3_path)
-            s3_url = f"https://{self.bucket_name}.s3.amazonaws.com/{s3_path}"
-            return s3_url
+            self.s3_client.upload_fileobj(file, self.bucket_name, s3_path, Config=self.transfer_config)
+            return self.url(s3_path)
         except NoCredentialsError:
             raise FileSaveException("Credentials not available")
         except Exception as e:
             raise FileSaveException(f"Failed to upload file to S3: {str(e)}")
+
+    def url(self, key: str) -> str:
+        if self.endpoint_url:
+            return f"{self.endpoint_url.rstrip('/')}/{self.bucket_name}/{key}"
+        return f"https://{self.bucket_name}.s3.amazonaws.com/{key}"
+
+    def key(self, path: str) -> str:
+        prefix: str = self.url("")
+        return path[len(prefix):] if path.startswith(prefix) else path
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def delete(self, key: str) -> None:
+        self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
+
+    def touch(self, key: str) -> None:
+        self.s3_client.copy_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            CopySource={"Bucket": self.bucket_name, "Key": key},
+            MetadataDirective="REPLACE",
+        )
+
+    def list_keys(self, prefix: str) -> Iterator[tuple[str, float]]:
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for item in page.get("Contents", []):
+                yield item["Key"], item["LastModified"].timestamp()
+
+
+class ContentAddressedStorage(Storage):
+    """
+    Storage keeping every file once, under the SHA-256 of its content.
+
+    Files are hashed while they are streamed into a spooled temporary file,
+    then stored as `<root>/<first two hex digits>/<digest><extension>` unless
+    that blob already exists. Derived files (resized images) are stored next
+    to their blob without hashing, their names start with the blob name.
+
+    Attributes:
+        backend (Storage): Storage holding the blobs.
+        root (str): Directory of the blobs.
+    """
+
+    # Bytes read from the upload at a time
+    chunk_size: int = 64 * 1024
+    # Uploads larger than this are spooled to disk while hashing
+    spool_size: int = 8 * 1024 * 1024
+    # Digest at the start of a blob or derived file name
+    digest_pattern: re.Pattern = re.compile(r"^([0-9a-f]{64})(?:\.|$)")
+
+    def __init__(self, backend: Storage, root: str):
+        """
+        Initializes the ContentAddressedStorage.
+
+        Args:
+            backend (Storage): Storage holding the blobs.
+            root (str): Directory of the blobs.
+        """
+        self.backend: Storage = backend
+        self.root: str = root
+
+    def save(self, file, upload_dir, filename):
+        """
+        Hashes and stores the file once, `upload_dir` is ignored.
+
+        Args:
+            file: The file to be saved.
+            upload_dir (str): Ignored, blobs are stored under the root.
+            filename (str): The name of the file, only its extension is kept.
+
+        Returns:
+            str: The path of the blob.
+        """
+        stream = getattr(file, "stream", file)
+        digest = hashlib.sha256()
+        with SpooledTemporaryFile(max_size=self.spool_size) as spool:
+            for chunk in iter(lambda: stream.read(self.chunk_size), b""):
+                digest.update(chunk)
+                spool.write(chunk)
+            spool.seek(0)
+            name: str = f"{digest.hexdigest()}{os.path.splitext(filename)[1].lower()}"
+            directory: str = os.path.join(self.root, name[:2])
+            key: str = os.path.join(directory, name)
+            # Same content, same blob, touched so garbage collection keeps it until referenced
+            if self.backend.exists(key):
+                self.backend.touch(key)
+                return self.backend.url(key)
+            return self.backend.save(FileStorage(stream=spool, filename=name), directory, name)
+
+    @property
+    def workers(self) -> int:
+        return self.backend.workers
+
+    def save_beside(self, file, path, filename):
+        return self.backend.save_beside(file, path, filename)
+
+    def save_many_beside(self, files: Iterable[tuple], path: str) -> list[str]:
+        return self.backend.save_many_beside(files, path)
+
+    def key(self, path: str) -> str:
+        return self.backend.key(path)
+
+    def url(self, key: str) -> str:
+        return self.backend.url(key)
+
+    def exists(self, key: str) -> bool:
+        return self.backend.exists(key)
+
+    def delete(self, key: str) -> None:
+        self.backend.delete(key)
+
+    def touch(self, key: str) -> None:
+        self.backend.touch(key)
+
+    def list_keys(self, prefix: str) -> Iterator[tuple[str, float]]:
+        return self.backend.list_keys(prefix)
+
+    @classmethod
+    def digest(cls, path: str) -> Optional[str]:
+        """
+        Returns the digest of the blob a path belongs to, None for other paths.
+        """
+        match: Optional[re.Match] = cls.digest_pattern.match(os.path.basename(path))
+        return match.group(1) if match else None
+
+    def blobs(self) -> dict[str, list[tuple[str, float]]]:
+        """
+        Returns the stored keys and their modification timestamps, grouped by blob digest.
+        """
+        blobs: dict[str, list[tuple[str, float]]] = {}
+        for key, modified in self.list_keys(self.root):
+            digest: Optional[str] = self.digest(key)
+            if digest is not None:
+                blobs.setdefault(digest, []).append((key, modified))
+        return blobs
@@ -0,0 +1,224 @@
+"""
+# File that contains the optional Prometheus metrics
+
+Metrics are opt-in with METRICS=True and require the prometheus_client
+package. The hooks below do nothing while metrics are disabled, so they are
+called unconditionally from requests, caches and image processing.
+
+```py
+from playstation.admin.metrics import setup_metrics
+
+setup_metrics(app)  # GET /metrics
+```
+
+With several worker processes every process writes its samples to files in
+`PROMETHEUS_MULTIPROC_DIR`, which must be an empty directory set in the
+environment before the workers start, and `/metrics` aggregates them.
+Gunicorn should also drop the files of exited workers:
+
+```py
+# gunicorn.conf.py
+from playstation.admin.metrics import mark_process_dead
+
+def child_exit(server, worker):
+    mark_process_dead(worker.pid)
+```
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Self
+from flask import Flask, Response, g, request
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+from playstation.settings import METRICS, METRICS_PATH
+
+
+class Metrics:
+    """
+    Prometheus metrics of the application.
+
+    Attributes:
+        requests: Counter of requests by blueprint, endpoint, method and status.
+        request_duration: Histogram of request latency by blueprint, endpoint and method.
+        pool_connections: Gauge of database connections, open or in use.
+        cache_requests: Counter of cache lookups by namespace and result.
+        image_duration: Histogram of image upload and variant processing times.
+    """
+
+    def __init__(self: Self, prometheus: Any) -> None:
+        self.requests = prometheus.Counter(
+            "playstation_http_requests_total",
+            "HTTP requests.",
+            ["blueprint", "endpoint", "method", "status"],
+        )
+        self.request_duration = prometheus.Histogram(
+            "playstation_http_request_duration_seconds",
+            "HTTP request latency.",
+            ["blueprint", "endpoint", "method"],
+        )
+        # Summed over the live processes in multiprocess mode
+        self.pool_connections = prometheus.Gauge(
+            "playstation_db_pool_connections",
+            "Database pool connections.",
+            ["state"],
+            multiprocess_mode="livesum",
+        )
+        self.cache_requests = prometheus.Counter(
+            "playstation_cache_requests_total",
+            "Cache lookups.",
+            ["namespace", "result"],
+        )
+        self.image_duration = prometheus.Histogram(
+            "playstation_image_processing_seconds",
+            "Image upload and variant processing time.",
+            ["stage"],
+            buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+        )
+
+
+# Metrics of the process, None while disabled
+_metrics: Optional[Metrics] = None
+
+
+def _prometheus() -> Any:
+    """
+    Returns the prometheus_client module.
+    """
+    try:
+        import prometheus_client
+    except ImportError:
+        raise ImportError("METRICS is enabled but the prometheus_client package is not installed")
+    return prometheus_client
+
+
+def enable_metrics() -> Metrics:
+    """
+    Create the metrics of the process and listen to the database pools, once per process.
+
+    Returns:
+        Metrics: The metrics.
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics(_prometheus())
+        connections = _metrics.pool_connections
+        event.listen(Pool, "connect", lambda *args: connections.labels("open").inc())
+        event.listen(Pool, "close", lambda *args: connections.labels("open").dec())
+        event.listen(Pool, "detach", lambda *args: connections.labels("open").dec())
+        event.listen(Pool, "checkout", lambda *args: connections.labels("in_use").inc())
+        event.listen(Pool, "checkin", lambda *args: connections.labels("in_use").dec())
+    return _metrics
+
+
+def record_request(seconds: float, status: int) -> None:
+    """
+    Record the current request.
+
+    Args:
+        seconds (float): Time spent on the request.
+        status (int): Response status code.
+    """
+    if _metrics is None:
+        return
+    # Unmatched URLs share one label set
+    blueprint: str = request.blueprint or ""
+    endpoint: str = request.endpoint or ""
+    _metrics.requests.labels(blueprint, endpoint, request.method, str(status)).inc()
+    _metrics.request_duration.labels(blueprint, endpoint, request.method).observe(seconds)
+
+
+def record_cache(namespace: str, hit: bool) -> None:
+    """
+    Record a cache lookup.
+
+    Args:
+        namespace (str): Cache namespace.
+        hit (bool): Whether the key was cached.
+    """
+    if _metrics is None:
+        return
+    _metrics.cache_requests.labels(namespace, "hit" if hit else "miss").inc()
+
+
+@contextmanager
+def observe_image(stage: str) -> Iterator[None]:
+    """
+    Context manager timing an image processing stage, "upload" or "variants".
+
+    Args:
+        stage (str): Stage name.
+    """
+    if _metrics is None:
+        yield
+        return
+    started: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        _metrics.image_duration.labels(stage).observe(time.perf_counter() - started)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Returns the metrics in the Prometheus text format, aggregated over every worker in multiprocess mode.
+
+    Returns:
+        tuple[bytes, str]: Body and content type.
+    """
+    prometheus = _prometheus()
+    registry = prometheus.REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = prometheus.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return prometheus.generate_latest(registry), prometheus.CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """
+    Drop the live gauges of an exited worker in multiprocess mode.
+
+    Args:
+        pid (int): Process id of the worker.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid)
+
+
+def setup_metrics(app: Flask, enabled: bool = METRICS, path: str = METRICS_PATH) -> None:
+    """
+    Set up the request metrics and the metrics endpoint of the Flask application.
+
+    Args:
+        app (Flask): Flask application.
+        enabled (bool): Collect and expose the metrics.
+        path (str): URL of the metrics endpoint.
+
+    Returns:
+        None
+    """
+    if not enabled:
+        return
+    enable_metrics()
+
+    @app.before_request
+    def start_metrics_timer() -> None:
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_metrics(response: Response) -> Response:
+        started: Optional[float] = g.get("metrics_started")
+        if started is not None and request.endpoint != "metrics":
+            record_request(time.perf_counter() - started, response.status_code)
+        return response
+
+    def metrics() -> Response:
+        body, content_type = render_metrics()
+        return Response(body, content_type=content_type)
+
+    app.add_url_rule(path, "metrics", metrics)
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from typing import Self, Callable, Any, Union
 from flask import request, jsonify, Request, Response
 from functools import wraps
+from playstation.admin.profiling import stage
 
 
 # BaseClass
@@ -35,12 +36,16 @@ def permission_required(permissions: list[BasePermission]) -> Union[Callable, Re
         Response: A 403 Permission Denied in case of failure.
     """
 
+    # Permission classes are stateless, create them once and reuse them for every request
+    checks: tuple[BasePermission, ...] = tuple(permission() for permission in permissions)
+
     def decorator(view: Callable) -> Callable:
         @wraps(view)
         def decorated_function(*args: Any, **kwargs: Any) -> Any:
-            for permission in permissions:
-                if not permission().has_permission(request, *args, **kwargs):
-                    return jsonify({"message": "Permission denied"}), 403
+            with stage("permission"):
+                for permission in checks:
+                    if not permission.has_permission(request, *args, **kwargs):
+                        return jsonify({"message": "Permission denied"}), 403
             return view(*args, **kwargs)
 
         return decorated_function
@@ -0,0 +1,324 @@
+"""
+# File that contains per-request stage timing hooks
+
+Stages such as authentication, permission checks, serializer validation and
+serialization record how long they take on the current request, and the time
+spent in database cursors is summed from SQLAlchemy events. The same events
+count the queries of the request and flag statements repeated at least
+QUERY_REPEAT_THRESHOLD times, which usually means an N+1 query. When
+profiling is enabled every response carries a `Server-Timing` header
+splitting the request into its stages and the view, and `X-Query-Count` /
+`X-Query-Repeated` headers. When request logging is enabled every request is
+logged as one JSON line with its route, status, user, timings and queries,
+including requests that fail with an unhandled exception.
+
+```py
+from playstation.admin.profiling import count_queries, stage, setup_profiling
+
+setup_profiling(app)
+
+with stage("auth"):
+    authenticate()
+
+with count_queries() as queries:
+    client.get("/api/products")
+print(queries.count, queries.repeated())
+```
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Self
+from flask import Flask, Response, g, got_request_exception, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from playstation.settings import PROFILING, REQUEST_LOG, LOGGING_COFIGURATION, QUERY_REPEAT_THRESHOLD
+
+
+# Logger of the request lines
+request_logger: logging.Logger = logging.getLogger(f"{LOGGING_COFIGURATION['NAME']}.requests")
+
+# Placeholder lists of expanded IN clauses, e.g. (?, ?, ?) or (%(id_1)s, %(id_2)s)
+PLACEHOLDERS_PATTERN: re.Pattern = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+|\$\d+))*\s*\)")
+
+# Counters opened by count_queries() on each thread
+_counters: threading.local = threading.local()
+
+
+class QueryStats:
+    """
+    Queries executed by a request or a counted block.
+
+    Attributes:
+        count (int): Cursor executions.
+        time (float): Seconds spent in cursor executions.
+        shapes (Counter[str]): Executions of each statement shape.
+    """
+
+    def __init__(self: Self) -> None:
+        self.count: int = 0
+        self.time: float = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    @staticmethod
+    def shape(statement: str) -> str:
+        """
+        Returns the shape of a statement, whitespace and expanded IN lists collapsed.
+        """
+        return PLACEHOLDERS_PATTERN.sub("(?)", " ".join(statement.split()))
+
+    def add(self: Self, statement: str, seconds: float) -> None:
+        """
+        Record one cursor execution.
+
+        Args:
+            statement (str): SQL statement.
+            seconds (float): Time of the execution.
+        """
+        self.count += 1
+        self.time += seconds
+        self.shapes[self.shape(statement)] += 1
+
+    def repeated(self: Self, threshold: int = QUERY_REPEAT_THRESHOLD) -> dict[str, int]:
+        """
+        Returns the statement shapes executed at least `threshold` times, likely N+1 queries.
+        """
+        return {shape: count for shape, count in self.shapes.most_common() if count >= threshold}
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """
+    Context manager counting the queries executed on the current thread, inside or outside requests.
+
+    Returns:
+        Iterator[QueryStats]: Queries of the block.
+    """
+    instrument_engines()
+    stats: QueryStats = QueryStats()
+    active: list[QueryStats] = _counters.__dict__.setdefault("active", [])
+    active.append(stats)
+    try:
+        yield stats
+    finally:
+        active.remove(stats)
+
+
+def record_stage(name: str, seconds: float) -> None:
+    """
+    Add the time spent in a stage to the current request.
+
+    Args:
+        name (str): Stage name.
+        seconds (float): Time spent in the stage.
+    """
+    if not has_app_context():
+        return
+    timings: dict[str, float] = g.setdefault("stage_timings", {})
+    timings[name] = timings.get(name, 0.0) + seconds
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Context manager timing a block as a stage of the current request.
+
+    Nested blocks of a stage that is already running, e.g. nested serializers,
+    are counted once.
+
+    Args:
+        name (str): Stage name.
+    """
+    if not has_app_context():
+        yield
+        return
+    active: set[str] = g.setdefault("active_stages", set())
+    if name in active:
+        yield
+        return
+    active.add(name)
+    started: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        active.discard(name)
+        record_stage(name, time.perf_counter() - started)
+
+
+def get_stage_timings() -> dict[str, float]:
+    """
+    Returns the stage timings recorded on the current request, in seconds.
+    """
+    if not has_app_context():
+        return {}
+    return dict(g.get("stage_timings", {}))
+
+
+def get_query_stats() -> QueryStats:
+    """
+    Returns the queries of the current request.
+    """
+    if not has_app_context():
+        return QueryStats()
+    return g.setdefault("query_stats", QueryStats())
+
+
+def get_db_time() -> float:
+    """
+    Returns the seconds the current request spent in database cursors.
+    """
+    return get_query_stats().time
+
+
+def start_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    """
+    Remember when a cursor execution starts, executions nest on the connection.
+    """
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def end_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    """
+    Add a cursor execution to the current request and the open counters.
+    """
+    started: list[float] = conn.info.get("query_started")
+    if not started:
+        return
+    seconds: float = time.perf_counter() - started.pop()
+    if has_app_context():
+        get_query_stats().add(statement, seconds)
+    for stats in getattr(_counters, "active", ()):
+        stats.add(statement, seconds)
+
+
+def instrument_engines() -> None:
+    """
+    Time the cursor executions of every engine, once per process.
+    """
+    if not event.contains(Engine, "before_cursor_execute", start_query):
+        event.listen(Engine, "before_cursor_execute", start_query)
+        event.listen(Engine, "after_cursor_execute", end_query)
+
+
+def request_summary(status: int, exception: Optional[BaseException] = None) -> dict[str, Any]:
+    """
+    Returns the fields logged for the current request.
+
+    Args:
+        status (int): Status code of the response.
+        exception (Optional[BaseException]): Unhandled exception of a failed request.
+    """
+    user: Optional[Any] = getattr(request, "user", None)
+    total: float = request_duration()
+    timings: dict[str, float] = get_stage_timings()
+    queries: QueryStats = get_query_stats()
+    summary: dict[str, Any] = {
+        "method": request.method,
+        "path": request.path,
+        "route": request.url_rule.rule if request.url_rule is not None else None,
+        "endpoint": request.endpoint,
+        "status": status,
+        "user_id": getattr(user, "id", None),
+        "duration_ms": round(total * 1000, 3),
+        "db_ms": round(queries.time * 1000, 3),
+        "queries": queries.count,
+        "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in timings.items()},
+    }
+    repeated: dict[str, int] = queries.repeated()
+    if repeated:
+        summary["repeated_queries"] = [
+            {"statement": shape[:200], "count": count} for shape, count in repeated.items()
+        ]
+    if exception is not None:
+        summary["error"] = type(exception).__name__
+    return summary
+
+
+def log_request(status: int, exception: Optional[BaseException] = None) -> None:
+    """
+    Log the current request as one JSON line, once.
+
+    Args:
+        status (int): Status code of the response.
+        exception (Optional[BaseException]): Unhandled exception of a failed request.
+    """
+    if g.get("request_logged") or not request_logger.isEnabledFor(logging.INFO):
+        return
+    g.request_logged = True
+    fields: dict[str, Any] = request_summary(status, exception or g.get("request_exception"))
+    request_logger.info(json.dumps(fields, separators=(",", ":")), extra={"fields": fields})
+
+
+def request_duration() -> float:
+    """
+    Returns the seconds elapsed since the current request started.
+    """
+    started: float = g.get("request_started", time.perf_counter())
+    return time.perf_counter() - started
+
+
+def setup_profiling(app: Flask, enabled: bool = PROFILING, request_log: bool = REQUEST_LOG) -> None:
+    """
+    Set up per-request stage timings for the Flask application.
+
+    Args:
+        app (Flask): Flask application.
+        enabled (bool): Add the Server-Timing header to every response.
+        request_log (bool): Log every request as one JSON line.
+
+    Returns:
+        None
+    """
+    instrument_engines()
+
+    @app.before_request
+    def start_request_timer() -> None:
+        g.request_started = time.perf_counter()
+        # Requests can share an app context that is already pushed
+        g.stage_timings = {}
+        g.query_stats = QueryStats()
+        g.request_logged = False
+        g.request_exception = None
+
+    if request_log:
+
+        @app.after_request
+        def log_response(response: Response) -> Response:
+            if has_request_context():
+                log_request(response.status_code)
+            return response
+
+        @got_request_exception.connect_via(app)
+        def remember_exception(sender: Flask, exception: BaseException, **extra: Any) -> None:
+            g.request_exception = exception
+
+        @app.teardown_request
+        def log_failed_request(exception: Optional[BaseException] = None) -> None:
+            # after_request is skipped when an unhandled exception propagates
+            if exception is not None:
+                log_request(500, exception)
+
+    if not enabled:
+        return
+
+    @app.after_request
+    def add_server_timing(response: Response) -> Response:
+        timings: dict[str, float] = get_stage_timings()
+        total: float = request_duration()
+        # Whatever is not spent in a recorded stage is spent in the view
+        timings["view"] = max(total - sum(timings.values()), 0.0)
+        # Database time overlaps the other stages
+        timings["db"] = get_db_time()
+        timings["total"] = total
+        response.headers["Server-Timing"] = ", ".join(
+            f"{name};dur={seconds * 1000:.3f}" for name, seconds in timings.items()
+        )
+        queries: QueryStats = get_query_stats()
+        response.headers["X-Query-Count"] = str(queries.count)
+        response.headers["X-Query-Repeated"] = str(len(queries.repeated()))
+        return response
@@ -1,9 +1,11 @@
 """
-# File that contains base validator class
+# File that contains base validator classes
 """
 
 from abc import ABC, abstractmethod
-from typing import Self
+from typing import Self, Any, Iterable
+from sqlalchemy import exists, select
+from playstation import db
 
 
 # Abstracted Validator Class
@@ -15,3 +17,67 @@ class BaseValidator(ABC):
     @abstractmethod
     def validate(self, data):
         pass
+
+
+# Validator checking rows exist without loading them
+class ExistsValidator(BaseValidator):
+    """
+    Validator testing whether rows with a column value exist.
+
+    Single values compile to `SELECT EXISTS (...)` and batches to one
+    `SELECT column ... WHERE column IN (...)`, no ORM row is loaded.
+
+    ```py
+    class ProductValidatorByName(ExistsValidator):
+        model = Product
+        column = "name"
+
+    ProductValidatorByName().validate("Astro Bot")  # True
+    ProductValidatorByName().validate_many(["Astro Bot", "Returnal"])  # {"Astro Bot"}
+    ```
+
+    Attributes:
+        model (type): Model queried.
+        column (str): Column the values are compared to.
+    """
+
+    model: type = None
+    column: str = "id"
+
+    def exists(self: Self, value: Any) -> bool:
+        """
+        Returns True if a row has the value.
+
+        Args:
+            value (Any): Value of the column.
+        """
+        field = getattr(self.model, self.column)
+        return bool(db.session.execute(select(exists().where(field == value))).scalar())
+
+    def validate_many(self: Self, values: Iterable[Any]) -> set:
+        """
+        Resolve a batch of values in one round trip.
+
+        Args:
+            values (Iterable[Any]): Values of the column.
+
+        Returns:
+            set: The values a row has.
+        """
+        values = set(values)
+        if not values:
+            return set()
+        field = getattr(self.model, self.column)
+        return set(db.session.execute(select(field).where(field.in_(values)).distinct()).scalars())
+
+    def validate(self: Self, data: Any) -> bool:
+        """
+        Validate if a row with the value exists
+
+        Args:
+            data (Any): Value of the column.
+
+        Returns:
+            bool: True if the row exists, False otherwise
+        """
+        return self.exists(data)
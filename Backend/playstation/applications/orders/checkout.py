@@ -0,0 +1,148 @@
+"""
+# Module contains the checkout service placing a whole order in one transaction
+
+```py
+from playstation.applications.orders.checkout import Checkout
+
+order = Checkout(user_id, [(product_id, quantity), ...], shipping_address_id).place()
+```
+
+A cart of N lines costs one SELECT of the product prices, one conditional stock
+UPDATE per line, the order INSERT and one bulk `order_product` INSERT, all
+committed together. A line without enough stock rolls the whole order back.
+"""
+
+from typing import Self, Iterable, Optional
+from sqlalchemy import select
+from playstation import db, db_unit_of_work
+from playstation.models.orders import Orders
+from playstation.models.products import Product
+from playstation.models.shipping_address import ShippingAddress
+from playstation.models.junction_models import order_product
+from playstation.models.exceptions import ProductOutOfStock
+from .exceptions import UnknownProducts, InvalidShippingAddress
+
+
+class Checkout:
+    """
+    Places an order for a cart.
+
+    Attributes:
+        user_id (int): Id of the ordering user.
+        quantities (dict[int, int]): Quantity by product id, in product id order.
+        shipping_address_id (Optional[int]): Shipping address of the order.
+    """
+
+    def __init__(
+        self: Self,
+        user_id: int,
+        items: Iterable[tuple[int, int]],
+        shipping_address_id: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the Checkout.
+
+        Args:
+            user_id (int): Id of the ordering user.
+            items (Iterable[tuple[int, int]]): Product id and quantity of every cart line.
+            shipping_address_id (Optional[int]): Shipping address of the order.
+        """
+        self.user_id: int = user_id
+        self.quantities: dict[int, int] = self.merge(items)
+        self.shipping_address_id: Optional[int] = shipping_address_id
+
+    @staticmethod
+    def merge(items: Iterable[tuple[int, int]]) -> dict[int, int]:
+        """
+        Merge lines of the same product.
+
+        Products are ordered by id so concurrent checkouts lock rows in the same order.
+
+        Args:
+            items (Iterable[tuple[int, int]]): Product id and quantity of every cart line.
+
+        Returns:
+            dict[int, int]: Quantity by product id.
+        """
+        quantities: dict[int, int] = {}
+        for product_id, quantity in items:
+            quantities[product_id] = quantities.get(product_id, 0) + quantity
+        return dict(sorted(quantities.items()))
+
+    def total(self: Self, prices: list) -> float:
+        """
+        Compute the order total from the price rows of the cart products.
+
+        Args:
+            prices (list): Rows of product id, price, discount and sale flag.
+
+        Returns:
+            float: Total amount of the order.
+        """
+        return float(
+            sum(
+                Product.unit_cost(price, discount, is_sale) * self.quantities[product_id]
+                for product_id, price, discount, is_sale in prices
+            )
+        )
+
+    def check_shipping_address(self: Self) -> None:
+        """
+        Check the shipping address belongs to the user.
+
+        Raises:
+            InvalidShippingAddress: If the address is not one of the user's addresses.
+        """
+        if self.shipping_address_id is None:
+            return
+        owned = db.session.execute(
+            select(ShippingAddress.id).where(
+                ShippingAddress.id == self.shipping_address_id,
+                ShippingAddress.user_id == self.user_id,
+            )
+        ).first()
+        if owned is None:
+            raise InvalidShippingAddress(f"Shipping address {self.shipping_address_id} not found")
+
+    def place(self: Self) -> Orders:
+        """
+        Place the order in a single unit of work, committed once.
+
+        Raises:
+            UnknownProducts: If a product does not exist.
+            ProductOutOfStock: If a product does not have enough stock.
+            InvalidShippingAddress: If the address is not one of the user's addresses.
+
+        Returns:
+            Orders: The placed order.
+        """
+        with db_unit_of_work():
+            prices: list = db.session.execute(
+                select(Product.id, Product.price, Product.discount, Product.is_sale).where(
+                    Product.id.in_(self.quantities)
+                )
+            ).all()
+            missing: set[int] = set(self.quantities) - {row.id for row in prices}
+            if missing:
+                raise UnknownProducts(f"Products {sorted(missing)} do not exist")
+            self.check_shipping_address()
+            # Conditional updates, stock can never go below zero
+            for product_id, quantity in self.quantities.items():
+                if not Product.take_stock(product_id, quantity):
+                    raise ProductOutOfStock(f"Not enough stock for product {product_id}")
+            order: Orders = Orders(
+                user_id=self.user_id,
+                shipping_address_id=self.shipping_address_id,
+                total_amount=self.total(prices),
+                status="Pending",
+            )
+            db.session.add(order)
+            db.session.flush()
+            db.session.execute(
+                order_product.insert(),
+                [
+                    {"order_id": order.id, "product_id": product_id, "quantity": quantity}
+                    for product_id, quantity in self.quantities.items()
+                ],
+            )
+        return order
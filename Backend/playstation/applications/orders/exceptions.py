@@ -0,0 +1,12 @@
+"""
+# Model that contains all errors related to Orders Application
+"""
+
+
+# Checkout errors
+class UnknownProducts(Exception):
+    pass
+
+
+class InvalidShippingAddress(Exception):
+    pass
@@ -0,0 +1,26 @@
+"""
+# Pydantic Models for Orders Application
+"""
+
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+
+
+# Pydantic Serializer for a cart line
+class CheckoutLine(BaseModel):
+    # Configuration for Pydantic V2
+    model_config = ConfigDict(
+        extra="forbid",  # Forbid extra fields not defined in the model
+    )
+    product_id: int = Field(ge=1)
+    quantity: int = Field(ge=1)
+
+
+# Pydantic Serializer for a checkout
+class CheckoutRequest(BaseModel):
+    # Configuration for Pydantic V2
+    model_config = ConfigDict(
+        extra="forbid",  # Forbid extra fields not defined in the model
+    )
+    items: list[CheckoutLine] = Field(min_length=1, max_length=100)
+    shipping_address_id: Optional[int] = None
@@ -9,13 +9,25 @@
 - /Orders/me: Get the current user's profile
 - /Orders/me/update: Update the current user's profile
 - /Orders/me/delete: Delete the current user's account
+- /api/orders/checkout: Place an order for a cart in one transaction (POST, JWT required)
 
 #### Public Routes
 - /Orders/register: Register a new user
 - /Orders/login: Login a user
 """
 
-from flask import current_app
+from flask import current_app, make_response, request, Response
+from playstation.admin.authentications import authentication_classess
+from playstation.admin.authentications.jwt_authentication import JWTAuthentication
+from playstation.admin.authentications.exceptions import UserNotAssignedError
+from playstation.applications.users.utils import get_request_user
+from playstation.admin.authentications.principal import UserPrincipal
+from playstation.models.exceptions import ProductOutOfStock
+from sqlalchemy.exc import SQLAlchemyError
+from pydantic import ValidationError
+from .checkout import Checkout
+from .exceptions import UnknownProducts, InvalidShippingAddress
+from .serializers.pydantic_serializer import CheckoutRequest
 from . import orders_api
 
 
@@ -26,3 +38,60 @@ def orders_test() -> str:
     Check orders API
     """
     return "Orders API is working!"
+
+
+@orders_api.route("/checkout", methods=["POST"])
+@authentication_classess(auth_classes=[JWTAuthentication])
+def checkout(*args, **kwargs) -> Response:
+    """
+    Place an order for a cart
+
+    Request Body:
+        - items (list): Cart lines, each with a product_id and a quantity.
+        - shipping_address_id (int, optional): One of the user's shipping addresses.
+
+    Returns:
+        Response: The order id, total amount and status with status 201.
+
+    Error Codes:
+        - 400: Bad Request - If the input data or the shipping address is invalid.
+        - 401: Unauthorized - If the user is not authenticated.
+        - 404: Not Found - If a product does not exist.
+        - 409: Conflict - If a product does not have enough stock, nothing is ordered.
+        - 500: Internal Server Error - If an error occurs while placing the order.
+    """
+    try:
+        # Grab user
+        user: UserPrincipal = get_request_user(request)
+        # Validate cart
+        cart: CheckoutRequest = CheckoutRequest(**(request.get_json() or {}))
+        # Place order
+        order = Checkout(
+            user.id,
+            [(line.product_id, line.quantity) for line in cart.items],
+            cart.shipping_address_id,
+        ).place()
+        return make_response(
+            {"id": order.id, "total_amount": order.total_amount, "status": order.status}, 201
+        )
+    except ValidationError as e:
+        error: list[dict] = e.errors()
+        return make_response(error, 400)
+    except InvalidShippingAddress as e:
+        current_app.logger.error(str(e))
+        return make_response({"message": "Invalid shipping address"}, 400)
+    except UnknownProducts as e:
+        current_app.logger.error(str(e))
+        return make_response({"message": str(e)}, 404)
+    except ProductOutOfStock as e:
+        current_app.logger.error(str(e))
+        return make_response({"message": str(e)}, 409)
+    except UserNotAssignedError as e:
+        current_app.logger.error(str(e))
+        return make_response({"message": "User not assigned"}, 401)
+    except SQLAlchemyError as e:
+        current_app.logger.error(str(e))
+        return make_response({"message": "Failed to place order"}, 500)
+    except Exception as e:
+        current_app.logger.error(str(e))
+        return make_response({"message": "Failed to place order"}, 500)
@@ -0,0 +1,69 @@
+"""
+# Module contains the cached set of product image URLs served by the pages application
+
+The set is loaded with a single query and kept in-process, so serving an
+image does not query the database. Writes to `Product` through the ORM drop
+the set; products written by other workers are found once it expires.
+
+```py
+from playstation.applications.pages.images import known_images
+
+known_images.contains("/images/blobs/ab/<digest>.png")
+```
+"""
+
+from typing import Self, Optional
+from sqlalchemy import select
+from playstation import db
+from playstation.admin.cache import CacheBackend, InMemoryCache, invalidate_on_commit
+from playstation.models.products import Product
+from playstation.settings import KNOWN_IMAGES_TTL
+
+
+class KnownImageCache:
+    """
+    In-process cache of every product image URL.
+
+    Attributes:
+        backend (CacheBackend): Cache backend storing the URLs.
+        ttl (float): Seconds the URLs are cached.
+    """
+
+    key: str = "image_urls"
+
+    def __init__(self: Self, backend: CacheBackend, ttl: float) -> None:
+        self.backend: CacheBackend = backend
+        self.ttl: float = ttl
+
+    def urls(self: Self) -> frozenset[str]:
+        """
+        Returns every product image URL, loaded in one query on a miss.
+        """
+        cached: Optional[frozenset[str]] = self.backend.get(self.key)
+        if cached is None:
+            cached = frozenset(db.session.execute(select(Product.image_url).distinct()).scalars())
+            self.backend.set(self.key, cached, ttl=self.ttl)
+        return cached
+
+    def contains(self: Self, image_url: str) -> bool:
+        """
+        Returns True if a product uses the image URL.
+
+        Args:
+            image_url (str): Image URL as stored on the product.
+        """
+        return image_url in self.urls()
+
+    def invalidate(self: Self) -> None:
+        """
+        Drops the cached URLs.
+        """
+        self.backend.delete(self.key)
+
+
+known_images: KnownImageCache = KnownImageCache(
+    InMemoryCache(max_entries=1, namespace="known_images"), ttl=KNOWN_IMAGES_TTL
+)
+
+
+invalidate_on_commit(known_images.invalidate, Product, key="invalidated_images")
@@ -0,0 +1,98 @@
+"""
+# Module contains the fingerprinted files listed by the frontend build manifests
+
+Each frontend build writes a Vite manifest (`build.manifest` in its
+vite.config.ts), copied to STATIC_MANIFEST_DIR next to its bundles. Only the
+scripts, stylesheets and assets a manifest lists are served as immutable, a
+file merely named like a bundle is revalidated. Manifests are read again when
+one of them changes.
+
+```py
+from playstation.applications.pages.manifest import build_manifests
+
+build_manifests.contains(app.root_path, "index-DbMNdUTD.js")
+```
+"""
+
+import json
+import os
+import threading
+from typing import Self, Optional, Any
+from flask import current_app
+from playstation.settings import STATIC_MANIFEST_DIR
+
+
+class BuildManifests:
+    """
+    File names listed by the build manifests of a directory.
+
+    Attributes:
+        directory (str): Directory of the manifests, relative to the application root.
+    """
+
+    def __init__(self: Self, directory: str) -> None:
+        self.directory: str = directory
+        self._signature: Optional[tuple] = None
+        self._files: frozenset[str] = frozenset()
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def manifest_files(manifest: dict[str, Any]) -> set[str]:
+        """
+        Returns the names of the files a Vite manifest lists.
+
+        Args:
+            manifest (dict[str, Any]): Parsed manifest, chunks by source path.
+        """
+        files: set[str] = set()
+        for chunk in manifest.values():
+            if not isinstance(chunk, dict):
+                continue
+            if isinstance(chunk.get("file"), str):
+                files.add(os.path.basename(chunk["file"]))
+            for key in ("css", "assets"):
+                files.update(os.path.basename(path) for path in chunk.get(key, ()) if isinstance(path, str))
+        return files
+
+    def files(self: Self, root: str) -> frozenset[str]:
+        """
+        Returns every file name listed by the manifests, read again when one changes.
+
+        Args:
+            root (str): Application root path.
+        """
+        directory: str = os.path.join(root, self.directory)
+        try:
+            entries: list[os.DirEntry] = [
+                entry for entry in os.scandir(directory) if entry.name.endswith(".json") and entry.is_file()
+            ]
+        except FileNotFoundError:
+            return frozenset()
+        signature: tuple = tuple(sorted((entry.path, entry.stat().st_mtime_ns) for entry in entries))
+        with self._lock:
+            if signature == self._signature:
+                return self._files
+        files: set[str] = set()
+        for entry in entries:
+            try:
+                with open(entry.path, encoding="utf-8") as manifest:
+                    files |= self.manifest_files(json.load(manifest))
+            except (OSError, ValueError, AttributeError):
+                current_app.logger.error(f"Invalid build manifest {entry.path}")
+        with self._lock:
+            self._signature = signature
+            self._files = frozenset(files)
+        return self._files
+
+    def contains(self: Self, root: str, file_name: str) -> bool:
+        """
+        Returns True if a manifest lists the file.
+
+        Args:
+            root (str): Application root path.
+            file_name (str): Path of the file inside its static directory.
+        """
+        return os.path.basename(file_name) in self.files(root)
+
+
+build_manifests: BuildManifests = BuildManifests(STATIC_MANIFEST_DIR)
@@ -5,6 +5,7 @@
 from playstation import serializers
 from playstation.models.products import Product
 from typing import Self
+from .images import known_images
 
 
 class CheckImageSerializer(serializers.Serializer):
@@ -20,6 +21,6 @@ class CheckImageSerializer(serializers.Serializer):
         """
         Method for checking image of product
         """
-        if not self.model.query.filter_by(image_url=value).first():
+        if not known_images.contains(value):
             raise ValueError("Image not found")
         return value
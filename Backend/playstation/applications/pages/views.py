@@ -25,15 +25,98 @@ This module handles the rendering of templates for various pages and serves stat
 #### CSS
 - **/css/<path:file_name>**: Serve CSS files from the static directory.
 
+Static responses carry ETag and Last-Modified headers and answer conditional
+requests with 304. Bundles listed by a build manifest in STATIC_MANIFEST_DIR
+and content-addressed images are cached as immutable for STATIC_CACHE_MAX_AGE,
+other files are revalidated.
+
+With STATIC_OFFLOAD set, the views only decide whether and how a file is
+served and the front proxy transfers it, e.g. for nginx:
+
+```nginx
+location /protected/ {
+    internal;
+    alias /srv/playstation/static/;
+}
+```
+
 """
 
-from flask import current_app, abort, render_template, send_from_directory, Response
-from playstation.settings import STATIC_DIR, MEDIA_DIR
+from flask import current_app, abort, render_template, request, send_from_directory, Response
+from urllib.parse import quote
+from werkzeug import utils
+from playstation.settings import STATIC_DIR, MEDIA_DIR, STATIC_CACHE_MAX_AGE, STATIC_OFFLOAD, STATIC_OFFLOAD_PREFIX
+from playstation.admin.file_manager.image_handler import ImageHandler
+from playstation.admin.file_manager.storage import ContentAddressedStorage
 from .serializer import CheckImageSerializer
+from .manifest import build_manifests
 import os
 from . import pages
 
 
+def cache_static(response: Response, immutable: bool) -> Response:
+    """
+    Set the Cache-Control header of a static file response.
+
+    Args:
+        response (Response): Response of send_from_directory.
+        immutable (bool): Whether the content never changes under the same URL.
+
+    Returns:
+        Response: The response.
+    """
+    if immutable:
+        # send_file marks responses no-cache without a max age
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_CACHE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        # Revalidated with the ETag and Last-Modified headers
+        response.cache_control.no_cache = True
+    return response
+
+
+def send_static(directory: str, file_name: str, immutable: bool = False, offload: str = STATIC_OFFLOAD) -> Response:
+    """
+    Send a static file, or hand its transfer to the front proxy when offloading.
+
+    Offloaded responses keep the validators and answer conditional requests,
+    the body and range requests are left to the proxy.
+
+    Args:
+        directory (str): Directory of the file, relative to the application root.
+        file_name (str): Path of the file inside the directory.
+        immutable (bool): Whether the content never changes under the same URL.
+        offload (str): "x-sendfile", "x-accel-redirect" or "" to stream the file.
+
+    Returns:
+        Response: The file response.
+    """
+    if not offload:
+        return cache_static(send_from_directory(directory, file_name, as_attachment=False), immutable)
+    directory = os.path.join(current_app.root_path, directory)
+    response: Response = utils.send_from_directory(
+        directory,
+        file_name,
+        environ=request.environ,
+        use_x_sendfile=True,
+        conditional=False,
+        response_class=current_app.response_class,
+    )
+    path: str = response.headers.pop("X-Sendfile")
+    response.make_conditional(request)
+    # The proxy sets the length of the file it sends
+    response.headers.pop("Content-Length", None)
+    if response.status_code == 200:
+        if offload == "x-accel-redirect":
+            location: str = os.path.relpath(path, os.path.join(current_app.root_path, STATIC_DIR))
+            response.headers["X-Accel-Redirect"] = STATIC_OFFLOAD_PREFIX.rstrip("/") + "/" + quote(location)
+        else:
+            response.headers["X-Sendfile"] = path
+    return cache_static(response, immutable)
+
+
 @pages.route("/")
 def home_page() -> str:
     """
@@ -81,22 +164,25 @@ def get_static_image(file_path: str) -> Response:
     """
     # If just single images
     if len(file_path.split("/")) == 1:
-        return send_from_directory(MEDIA_DIR, file_path)
+        return send_static(MEDIA_DIR, file_path)
     image: str = file_path.split("/")[-1]
-    directory_path: str = os.path.join(MEDIA_DIR, file_path.split("/")[0])
     relative_path: str = os.path.join(MEDIA_DIR, file_path)
     relative_path = os.path.normpath(relative_path)
-    directory_path = os.path.normpath(directory_path)
-    data = {"image_url": relative_path.replace(STATIC_DIR, "")}
+    # Blobs are nested, e.g. blobs/ab/<digest>.png
+    directory_path: str = os.path.dirname(relative_path)
+    # Variants are served when their original image belongs to a product
+    data = {"image_url": ImageHandler.original_path(relative_path.replace(STATIC_DIR, ""))}
 
     try:
         serializer = CheckImageSerializer(data=data)
         if serializer.is_valid() and ".." not in file_path:
-            return send_from_directory(directory_path, image, as_attachment=False)
-        return send_from_directory(MEDIA_DIR, "default.png", as_attachment=False)
+            # Blob names are the digest of their content
+            immutable: bool = ContentAddressedStorage.digest(image) is not None
+            return send_static(directory_path, image, immutable)
+        return send_static(MEDIA_DIR, "default.png")
     except Exception as e:
         current_app.logger.error(f"Error getting image {e}, path={relative_path}")
-        return send_from_directory(MEDIA_DIR, "default.png", as_attachment=False)
+        return send_static(MEDIA_DIR, "default.png")
 
 
 @pages.route("/js/<path:file_name>")
@@ -112,7 +198,7 @@ def get_static_js(file_name: str) -> Response:
     """
     if file_name.endswith(".js") and ".." not in file_name:
         javascript_dir = os.path.join(STATIC_DIR, "js")
-        return send_from_directory(javascript_dir, file_name, as_attachment=False)
+        return send_static(javascript_dir, file_name, build_manifests.contains(current_app.root_path, file_name))
     abort(404)
 
 
@@ -129,5 +215,5 @@ def get_static_css(file_name: str) -> Response:
     """
     if file_name.endswith(".css") and ".." not in file_name:
         css_dir = os.path.join(STATIC_DIR, "css")
-        return send_from_directory(css_dir, file_name, as_attachment=False)
+        return send_static(css_dir, file_name, build_manifests.contains(current_app.root_path, file_name))
     abort(404)
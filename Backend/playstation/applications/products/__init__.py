@@ -16,6 +16,8 @@ from playstation.settings import LOGGING_COFIGURATION
 url_prefix: str = "/api/products"
 
 # Blueprint
-products_api: Blueprint = Blueprint("products_api", __name__, url_prefix=url_prefix)
+products_api: Blueprint = Blueprint(
+    "products_api", __name__, url_prefix=url_prefix, cli_group="products"
+)
 
-from . import views
+from . import views, commands
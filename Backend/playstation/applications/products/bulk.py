@@ -0,0 +1,313 @@
+"""
+# Module contains the bulk product import and export pipeline
+
+Imports read CSV or NDJSON rows lazily and handle them in batches: every
+batch is validated row by row, checked against the database with one query
+for names and one cached lookup for categories, then written with chunked
+multi-row INSERT statements and committed. Exports stream the catalog in the
+same formats with `yield_per`, so neither side holds the whole catalog.
+
+```py
+from playstation.applications.products.bulk import ProductImporter, read_rows, export_products
+
+with open("catalog.csv", encoding="utf-8", newline="") as stream:
+    report = ProductImporter().run(read_rows(stream, "csv"))
+
+for chunk in export_products("ndjson"):
+    output.write(chunk)
+```
+"""
+
+import csv
+import io
+import json
+import os
+from typing import Self, Iterable, Iterator, Optional, Any
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from playstation import db, db_unit_of_work
+from playstation.models.products import Product
+from playstation.settings import BULK_BATCH_SIZE, MEDIA_DIR
+from .categories import category_ids
+from .search import get_search_backend
+from .serializers.pydantic_serializer import ProductImportRow
+from .serializers.validators import ImageUrlValidator, ProductNameByLength, ProductValidatorByName
+
+
+# Supported file formats
+FORMATS: tuple[str, ...] = ("csv", "ndjson")
+
+# Columns written by exports, in order
+EXPORT_FIELDS: tuple[str, ...] = (
+    "id",
+    "name",
+    "description",
+    "price",
+    "discount",
+    "stock",
+    "is_sale",
+    "image_url",
+    "category_id",
+)
+
+# Image of products imported without one
+DEFAULT_IMAGE: str = os.path.join(MEDIA_DIR, "default.png")
+
+
+def guess_format(filename: Optional[str]) -> Optional[str]:
+    """
+    Returns the format of a file from its extension, None when unknown.
+    """
+    if not filename:
+        return None
+    extension: str = os.path.splitext(filename)[1].lstrip(".").lower()
+    if extension in ("json", "jsonl"):
+        return "ndjson"
+    return extension if extension in FORMATS else None
+
+
+def read_rows(stream: Iterable[str], format: str) -> Iterator[Any]:
+    """
+    Lazily read the rows of an import file.
+
+    Empty CSV cells are left out so the row defaults apply. NDJSON lines that
+    are not valid JSON are yielded as they are and rejected by the importer.
+
+    Args:
+        stream (Iterable[str]): Text lines of the file.
+        format (str): "csv" or "ndjson".
+
+    Returns:
+        Iterator[Any]: Rows of the file.
+    """
+    if format == "csv":
+        for row in csv.DictReader(stream):
+            yield {key: value for key, value in row.items() if key and value not in ("", None)}
+    elif format == "ndjson":
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield line
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+
+class ProductImporter:
+    """
+    Validates and inserts product rows in batches.
+
+    Attributes:
+        batch_size (int): Rows validated and committed together.
+        created (int): Products created so far.
+        failed (int): Rows rejected so far.
+        errors (list[dict]): First rejected rows with their line, field and message.
+    """
+
+    # Rows per INSERT statement, keeps the bound parameters under the SQLite limit
+    insert_chunk_size: int = 100
+    # Rejected rows reported in detail
+    max_errors: int = 100
+
+    def __init__(self: Self, batch_size: int = BULK_BATCH_SIZE) -> None:
+        self.batch_size: int = max(batch_size, 1)
+        self.created: int = 0
+        self.failed: int = 0
+        self.errors: list[dict] = []
+
+    def run(self: Self, rows: Iterable[Any]) -> dict:
+        """
+        Import every row.
+
+        Args:
+            rows (Iterable[Any]): Rows from read_rows().
+
+        Returns:
+            dict: Report with the created and failed counts and the first errors.
+        """
+        batch: list[tuple[int, Any]] = []
+        for line, row in enumerate(rows, start=1):
+            batch.append((line, row))
+            if len(batch) >= self.batch_size:
+                self.import_batch(batch)
+                batch = []
+        if batch:
+            self.import_batch(batch)
+        return self.report()
+
+    def report(self: Self) -> dict:
+        """
+        Returns the import report.
+        """
+        return {"created": self.created, "failed": self.failed, "errors": self.errors}
+
+    def reject(self: Self, line: int, errors: list[dict]) -> None:
+        """
+        Record a rejected row.
+
+        Args:
+            line (int): Row number in the file.
+            errors (list[dict]): Field and message of every error of the row.
+        """
+        self.failed += 1
+        for error in errors:
+            if len(self.errors) >= self.max_errors:
+                return
+            self.errors.append({"line": line, **error})
+
+    def validate_row(self: Self, line: int, row: Any) -> Optional[dict]:
+        """
+        Validate a row on its own, without touching the database.
+
+        Args:
+            line (int): Row number in the file.
+            row (Any): Row from read_rows().
+
+        Returns:
+            Optional[dict]: Column values of the product, None when rejected.
+        """
+        if not isinstance(row, dict):
+            self.reject(line, [{"field": None, "msg": "Row is not an object"}])
+            return None
+        try:
+            values: dict = ProductImportRow.model_validate(row).model_dump()
+        except ValidationError as e:
+            self.reject(
+                line,
+                [
+                    {"field": ".".join(str(part) for part in error["loc"]), "msg": error["msg"]}
+                    for error in e.errors()
+                ],
+            )
+            return None
+
+        errors: list[dict] = []
+        if not ProductNameByLength().validate(values["name"]):
+            errors.append({"field": "name", "msg": "Name should be between 3 and 255 characters"})
+        # Exports carry the default image, which is not an https URL
+        if values["image_url"] in (None, DEFAULT_IMAGE):
+            values["image_url"] = DEFAULT_IMAGE
+        elif not ImageUrlValidator().validate(values["image_url"]):
+            errors.append({"field": "image_url", "msg": "URL is not valid"})
+        if errors:
+            self.reject(line, errors)
+            return None
+        return values
+
+    def import_batch(self: Self, batch: list[tuple[int, Any]]) -> None:
+        """
+        Validate, insert and commit one batch of rows.
+
+        Args:
+            batch (list[tuple[int, Any]]): Row numbers and rows.
+        """
+        valid: list[tuple[int, dict]] = []
+        for line, row in batch:
+            values: Optional[dict] = self.validate_row(line, row)
+            if values is not None:
+                valid.append((line, values))
+        if not valid:
+            return
+
+        # One query for the names of the batch, earlier batches are committed already
+        names: set[str] = {values["name"] for _, values in valid}
+        taken: set[str] = ProductValidatorByName().validate_many(names)
+        categories: set[int] = set(category_ids.existing({values["category_id"] for _, values in valid}))
+
+        products: list[dict] = []
+        for line, values in valid:
+            if values["name"] in taken:
+                self.reject(line, [{"field": "name", "msg": "Product with the same name already exists"}])
+            elif values["category_id"] not in categories:
+                self.reject(line, [{"field": "category_id", "msg": "Category does not exist"}])
+            else:
+                # Later rows of the batch can not reuse the name
+                taken.add(values["name"])
+                products.append(values)
+        if products:
+            self.insert(products)
+
+    def insert(self: Self, products: list[dict]) -> None:
+        """
+        Insert validated products with multi-row INSERT statements and commit them.
+
+        Bulk statements skip mapper events, so the new rows are added to the
+        search index explicitly in the same transaction.
+
+        Args:
+            products (list[dict]): Column values of the products.
+        """
+        with db_unit_of_work():
+            for start in range(0, len(products), self.insert_chunk_size):
+                chunk: list[dict] = products[start : start + self.insert_chunk_size]
+                db.session.execute(insert(Product).values(chunk))
+            connection = db.session.connection()
+            rows = db.session.execute(
+                select(Product.id, Product.name, Product.description).where(
+                    Product.name.in_([values["name"] for values in products])
+                )
+            ).all()
+            get_search_backend(connection).index_rows(connection, db.session, rows)
+        self.created += len(products)
+
+
+def export_rows(chunk_size: int = 1000) -> Iterator[dict]:
+    """
+    Stream every product as a dictionary of EXPORT_FIELDS, ordered by id.
+
+    Args:
+        chunk_size (int): Rows fetched from the database at a time.
+
+    Returns:
+        Iterator[dict]: Exported products.
+    """
+    columns: list = [getattr(Product, field) for field in EXPORT_FIELDS]
+    query = select(*columns).order_by(Product.id).execution_options(yield_per=chunk_size)
+    for row in db.session.execute(query):
+        yield row._asdict()
+
+
+def write_rows(rows: Iterable[dict], format: str) -> Iterator[str]:
+    """
+    Encode exported rows, one chunk of text per row.
+
+    Args:
+        rows (Iterable[dict]): Rows from export_rows().
+        format (str): "csv" or "ndjson".
+
+    Returns:
+        Iterator[str]: Encoded text.
+    """
+    if format == "csv":
+        buffer: io.StringIO = io.StringIO()
+        writer: csv.DictWriter = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        # Header of an empty catalog
+        if buffer.tell():
+            yield buffer.getvalue()
+    elif format == "ndjson":
+        for row in rows:
+            yield json.dumps(row) + "\n"
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+
+def export_products(format: str) -> Iterator[str]:
+    """
+    Stream the whole catalog in a file format.
+
+    Args:
+        format (str): "csv" or "ndjson".
+
+    Returns:
+        Iterator[str]: Encoded text.
+    """
+    return write_rows(export_rows(), format)
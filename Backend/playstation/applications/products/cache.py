@@ -0,0 +1,22 @@
+"""
+# Module contains the response cache of the public product and category listings
+
+Any `Product` or `Category` write through the ORM, including ORM-enabled
+INSERT, UPDATE and DELETE statements, invalidates every cached listing, at flush or
+execution time and again once the transaction commits.
+"""
+
+from playstation.admin.cache import create_cache, invalidate_on_commit
+from playstation.admin.cache.responses import ResponseCache
+from playstation.models.products import Product, Category
+from playstation.settings import LISTING_CACHE_TTL, LISTING_CACHE_SIZE
+
+
+listing_cache: ResponseCache = ResponseCache(
+    create_cache("listings", max_entries=LISTING_CACHE_SIZE), ttl=LISTING_CACHE_TTL
+)
+
+
+invalidate_on_commit(
+    listing_cache.invalidate, Product, Category, key="invalidated_listings", statements=True
+)
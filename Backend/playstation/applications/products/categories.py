@@ -0,0 +1,71 @@
+"""
+# Module contains the cached set of category ids used to filter products
+
+The set is loaded with a single query and dropped whenever a `Category` row is
+created, updated or deleted through the ORM.
+
+```py
+from playstation.applications.products.categories import category_ids
+
+category_ids.existing([1, 2, 3])  # [1, 3] when category 2 does not exist
+```
+"""
+
+from typing import Self, Iterable, Optional
+from playstation import db
+from playstation.admin.cache import CacheBackend, create_cache, invalidate_on_commit
+from playstation.models.products import Category
+from playstation.settings import CATEGORY_CACHE_TTL
+
+
+class CategoryIdCache:
+    """
+    Cache of every existing category id.
+
+    Attributes:
+        backend (CacheBackend): Cache backend storing the ids.
+        ttl (float): Seconds the ids are cached.
+    """
+
+    key: str = "ids"
+
+    def __init__(self: Self, backend: CacheBackend, ttl: float) -> None:
+        self.backend: CacheBackend = backend
+        self.ttl: float = ttl
+
+    def ids(self: Self) -> frozenset[int]:
+        """
+        Returns every category id, loaded in one query on a miss.
+        """
+        cached: Optional[list[int]] = self.backend.get(self.key)
+        if cached is None:
+            cached = [category_id for (category_id,) in db.session.query(Category.id)]
+            self.backend.set(self.key, cached, ttl=self.ttl)
+        return frozenset(cached)
+
+    def existing(self: Self, category_ids: Iterable[int]) -> list[int]:
+        """
+        Keep the ids of existing categories, in their original order.
+
+        Args:
+            category_ids (Iterable[int]): Category ids to check.
+
+        Returns:
+            list[int]: Ids of existing categories.
+        """
+        ids: frozenset[int] = self.ids()
+        return [category_id for category_id in category_ids if category_id in ids]
+
+    def invalidate(self: Self) -> None:
+        """
+        Drops the cached ids.
+        """
+        self.backend.delete(self.key)
+
+
+category_ids: CategoryIdCache = CategoryIdCache(
+    create_cache("categories", max_entries=1), ttl=CATEGORY_CACHE_TTL
+)
+
+
+invalidate_on_commit(category_ids.invalidate, Category, key="invalidated_categories")
@@ -0,0 +1,52 @@
+"""
+# File that contains CLI commands for the products application
+
+```bash
+flask products import catalog.csv
+flask products export catalog.ndjson --format ndjson
+flask products gc-images
+```
+"""
+
+import click
+from typing import Optional, TextIO
+from .bulk import FORMATS, ProductImporter, export_products, guess_format, read_rows
+from .images import collect_unreferenced_blobs
+from . import products_api
+
+
+@products_api.cli.command("import")
+@click.argument("file", type=click.File("r", encoding="utf-8", lazy=False))
+@click.option("--format", "file_format", type=click.Choice(FORMATS), default=None, help="Defaults to the file extension.")
+def import_products(file: TextIO, file_format: Optional[str]) -> None:
+    """
+    Import products from a CSV or NDJSON file.
+    """
+    file_format = file_format or guess_format(file.name)
+    if file_format is None:
+        raise click.UsageError("Unknown file format, pass --format")
+    report: dict = ProductImporter().run(read_rows(file, file_format))
+    for error in report["errors"]:
+        click.echo(f"Line {error['line']}: {error['field']}: {error['msg']}", err=True)
+    click.echo(f"Created {report['created']} products, {report['failed']} rows failed")
+
+
+@products_api.cli.command("export")
+@click.argument("file", type=click.File("w", encoding="utf-8"), default="-")
+@click.option("--format", "file_format", type=click.Choice(FORMATS), default=None, help="Defaults to the file extension, csv on stdout.")
+def export_products_command(file: TextIO, file_format: Optional[str]) -> None:
+    """
+    Export every product to a CSV or NDJSON file, standard output by default.
+    """
+    file_format = file_format or guess_format(file.name) or "csv"
+    for chunk in export_products(file_format):
+        file.write(chunk)
+
+
+@products_api.cli.command("gc-images")
+def collect_images() -> None:
+    """
+    Delete the stored images no product references anymore, meant for cron style scheduling.
+    """
+    report: dict = collect_unreferenced_blobs()
+    click.echo(f"Deleted {report['deleted']} of {report['blobs']} image blobs ({report['files']} files)")
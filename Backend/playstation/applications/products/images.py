@@ -0,0 +1,169 @@
+"""
+# Module contains the stored images of products
+
+Variants are generated in the image worker pool once the product is saved,
+then recorded in `Product.image_variants`. Serializers expose them as one
+`srcset` string per format.
+
+Uploaded images are content-addressed blobs. Every product insert, image
+change and delete adjusts the `MediaBlob` reference count in the same
+transaction, and `collect_unreferenced_blobs` deletes the blobs no product
+uses anymore.
+
+```py
+from playstation.applications.products.images import process_image_variants, srcset
+
+process_image_variants(upload)
+srcset(product.image_variants)  # {"webp": "/images/a.png@thumbnail.webp 160w, ...", "png": "..."}
+```
+"""
+
+import time
+from concurrent.futures import Future
+from typing import Optional
+from flask import current_app, Flask
+from sqlalchemy import Connection, delete, event, func, inspect, select, update
+from playstation import db, db_commit
+from playstation.admin.file_manager import storage
+from playstation.admin.file_manager.image_handler import ImageUpload
+from playstation.admin.file_manager.storage import ContentAddressedStorage
+from playstation.models.media import MediaBlob
+from playstation.models.products import Product
+from playstation.settings import BLOB_GC_GRACE
+
+
+def process_image_variants(upload: Optional[ImageUpload]) -> Optional[Future]:
+    """
+    Generate the variants of an uploaded product image in the background.
+
+    Call it once the product is committed, the variants are recorded on every
+    product still using the image.
+
+    Args:
+        upload (Optional[ImageUpload]): The uploaded image, None when nothing was uploaded.
+
+    Returns:
+        Optional[Future]: Resolves to the variants.
+    """
+    if upload is None:
+        return None
+    app: Flask = current_app._get_current_object()
+
+    def record(variants: dict) -> None:
+        with app.app_context():
+            Product.set_image_variants(upload.path, variants)
+
+    def report(future: Future) -> None:
+        if future.exception() is not None:
+            app.logger.error(f"Failed to generate variants of {upload.path}: {future.exception()}")
+
+    future: Future = upload.process(record)
+    future.add_done_callback(report)
+    return future
+
+
+def srcset(variants: Optional[dict]) -> Optional[dict]:
+    """
+    Build a `srcset` string per format from recorded variants.
+
+    Args:
+        variants (Optional[dict]): Variants recorded on the product.
+
+    Returns:
+        Optional[dict]: srcset by format, None when the product has no variants yet.
+    """
+    if not variants:
+        return None
+    ordered: list[dict] = sorted(variants.values(), key=lambda variant: variant["width"])
+    formats: list[str] = [key for key in ordered[0] if key != "width"]
+    return {
+        format: ", ".join(f"{variant[format]} {variant['width']}w" for variant in ordered)
+        for format in formats
+    }
+
+
+def reference_image(connection: Connection, image_url: Optional[str], delta: int) -> None:
+    """
+    Change the reference count of the blob behind an image URL, other URLs are ignored.
+
+    Args:
+        connection (Connection): Connection of the transaction.
+        image_url (Optional[str]): Image URL of a product.
+        delta (int): Change of the reference count.
+    """
+    digest: Optional[str] = ContentAddressedStorage.digest(image_url or "")
+    if digest is not None:
+        MediaBlob.reference(connection, digest, delta)
+
+
+@event.listens_for(Product, "after_insert")
+def reference_inserted_image(mapper, connection: Connection, target: Product) -> None:
+    reference_image(connection, target.image_url, 1)
+
+
+@event.listens_for(Product, "after_update")
+def reference_updated_image(mapper, connection: Connection, target: Product) -> None:
+    # Only changes of a loaded image_url are seen, garbage collection reconciles the rest
+    history = inspect(target).attrs.image_url.history
+    for image_url in history.deleted:
+        reference_image(connection, image_url, -1)
+    for image_url in history.added:
+        reference_image(connection, image_url, 1)
+
+
+@event.listens_for(Product, "after_delete")
+def release_deleted_image(mapper, connection: Connection, target: Product) -> None:
+    reference_image(connection, target.image_url, -1)
+
+
+def collect_unreferenced_blobs(
+    blob_storage: ContentAddressedStorage = storage, grace: float = BLOB_GC_GRACE
+) -> dict:
+    """
+    Delete the stored blobs, with their variants, that no product references.
+
+    Reference counts are first recomputed from the products, bulk statements
+    skip the mapper events. Blobs modified during the grace period are kept,
+    an upload is only referenced once its product is saved.
+
+    Args:
+        blob_storage (ContentAddressedStorage): Storage holding the blobs.
+        grace (float): Seconds a new blob is kept unreferenced.
+
+    Returns:
+        dict: Number of blobs found, blobs deleted and files deleted.
+    """
+    db.session.execute(
+        update(MediaBlob)
+        .values(
+            refcount=select(func.count(Product.id))
+            .where(Product.image_url.contains(MediaBlob.digest))
+            .scalar_subquery()
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db_commit()
+    referenced: set[str] = set(
+        db.session.execute(select(MediaBlob.digest).where(MediaBlob.refcount > 0)).scalars()
+    )
+
+    cutoff: float = time.time() - grace
+    blobs: dict[str, list[tuple[str, float]]] = blob_storage.blobs()
+    deleted: list[str] = []
+    files: int = 0
+    for digest, stored in blobs.items():
+        if digest in referenced or max(modified for _, modified in stored) > cutoff:
+            continue
+        for key, _ in stored:
+            blob_storage.delete(key)
+            files += 1
+        deleted.append(digest)
+
+    if deleted:
+        db.session.execute(
+            delete(MediaBlob)
+            .where(MediaBlob.digest.in_(deleted), MediaBlob.refcount <= 0)
+            .execution_options(synchronize_session=False)
+        )
+        db_commit()
+    return {"blobs": len(blobs), "deleted": len(deleted), "files": files}
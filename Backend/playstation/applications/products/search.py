@@ -0,0 +1,576 @@
+"""
+# Module contains the full-text search backends of the products listing
+
+The backend is chosen from the database dialect:
+
+- SQLite: an FTS5 virtual table `product_search` keyed by the product id.
+- PostgreSQL: a GIN expression index over the product `tsvector`.
+- MySQL: a `FULLTEXT` index over the product name and description, searched
+  in boolean mode. The server's minimum token size and stopwords apply.
+- Anything else, or `SEARCH = "python"`: an in-process inverted index,
+  rebuilt every `SEARCH_INDEX_TTL` seconds to pick up other workers' writes.
+
+Every search term must match the start of a word of the product name or
+description, and results are ranked by relevance with name matches weighing
+more than description matches. Indexes are kept in sync by `Product` mapper
+events. A search no word matches falls back to a substring match of the
+whole search, so "ider" still finds "Spider-Man".
+
+```py
+from playstation.applications.products.search import get_search_backend
+
+match = get_search_backend(db.session.connection()).match("spider man")
+query = match.apply(query).order_by(match.rank.desc())
+```
+"""
+
+import bisect
+import heapq
+import re
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from typing import Self, Optional, Any, Iterable
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    case,
+    event,
+    false,
+    func,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.mysql import match as mysql_match
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import ColumnElement
+from playstation.admin.cache import run_on_commit
+from playstation.models.products import Product
+from playstation.settings import SEARCH, SEARCH_INDEX_TTL, SEARCH_MAX_RESULTS
+
+
+# Relevance weights of the indexed columns
+NAME_WEIGHT: float = 2.0
+DESCRIPTION_WEIGHT: float = 1.0
+
+
+def tokenize(value: Optional[str]) -> list[str]:
+    """
+    Split a text into lowercase word tokens.
+
+    Args:
+        value (Optional[str]): Text to split.
+
+    Returns:
+        list[str]: Word tokens.
+    """
+    return re.findall(r"\w+", value.lower()) if value else []
+
+
+class SearchMatch:
+    """
+    Result of a search, applied to a products query.
+
+    Attributes:
+        rank (ColumnElement): Relevance of a product, higher is better.
+    """
+
+    def __init__(self: Self, rank: ColumnElement) -> None:
+        self.rank: ColumnElement = rank
+
+    def apply(self: Self, query: Query) -> Query:
+        """
+        Filter a products query to the matching products.
+        """
+        return query.filter(false())
+
+    def exists(self: Self, session: Session) -> bool:
+        """
+        Returns True if any product matches.
+        """
+        return session.query(self.apply(session.query(Product.id)).exists()).scalar()
+
+
+class EmptySearchMatch(SearchMatch):
+    """
+    Match known to find no product without querying.
+    """
+
+    def exists(self: Self, session: Session) -> bool:
+        return False
+
+
+class SearchBackend(ABC):
+    """
+    Full-text search over product names and descriptions.
+    """
+
+    def setup(self: Self, connection: Connection) -> None:
+        """
+        Create the index structures if they do not exist yet.
+        """
+        pass
+
+    def refresh(self: Self, connection: Connection) -> None:
+        """
+        Bring an index the database does not maintain up to date before searching.
+        """
+        pass
+
+    @abstractmethod
+    def match(self: Self, search: str) -> SearchMatch:
+        """
+        Search the products.
+
+        Args:
+            search (str): Search terms.
+
+        Returns:
+            SearchMatch: Filter and relevance of the matching products.
+        """
+        pass
+
+    def index(self: Self, connection: Connection, product: Product) -> None:
+        """
+        Add or replace a product in the index.
+        """
+        pass
+
+    def remove(self: Self, connection: Connection, product: Product) -> None:
+        """
+        Remove a product from the index.
+        """
+        pass
+
+    def index_rows(self: Self, connection: Connection, session: Session, rows: Iterable) -> None:
+        """
+        Add new products inserted without mapper events, such as bulk inserts.
+
+        Args:
+            connection (Connection): Connection of the inserting transaction.
+            session (Session): Session of the inserting transaction.
+            rows (Iterable): Rows of product id, name and description.
+        """
+        pass
+
+    def rebuild(self: Self, connection: Connection) -> None:
+        """
+        Rebuild the index from the product table.
+        """
+        pass
+
+
+class JoinedSearchMatch(SearchMatch):
+    """
+    Match of the SQLite backend, joins the FTS5 table.
+    """
+
+    def __init__(self: Self, table: Table, expression: str, rank: ColumnElement) -> None:
+        super().__init__(rank)
+        self.table: Table = table
+        self.expression: str = expression
+
+    def apply(self: Self, query: Query) -> Query:
+        return query.join(self.table, self.table.c.rowid == Product.id).filter(
+            literal_column(self.table.name).op("MATCH")(self.expression)
+        )
+
+
+class SQLiteSearch(SearchBackend):
+    """
+    SQLite FTS5 virtual table, rows share the rowid of their product.
+    """
+
+    table: Table = Table(
+        "product_search",
+        MetaData(),
+        Column("rowid", Integer, primary_key=True),
+        Column("name", Text),
+        Column("description", Text),
+    )
+
+    def setup(self: Self, connection: Connection) -> None:
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": self.table.name}
+        ).first()
+        if exists:
+            return
+        connection.execute(
+            text(
+                f"CREATE VIRTUAL TABLE {self.table.name} "
+                "USING fts5(name, description, prefix='2 3')"
+            )
+        )
+        if inspect(connection).has_table(Product.__tablename__):
+            self.rebuild(connection)
+
+    def match(self: Self, search: str) -> SearchMatch:
+        tokens: list[str] = tokenize(search)
+        if not tokens:
+            return EmptySearchMatch(literal_column("0.0"))
+        # Quoted prefix queries, tokens only hold word characters
+        expression: str = " ".join(f'"{token}"*' for token in tokens)
+        # bm25 is lower for better matches
+        rank: ColumnElement = -func.bm25(
+            literal_column(self.table.name), NAME_WEIGHT, DESCRIPTION_WEIGHT
+        )
+        return JoinedSearchMatch(self.table, expression, rank)
+
+    def index(self: Self, connection: Connection, product: Product) -> None:
+        self.remove(connection, product)
+        connection.execute(
+            self.table.insert().values(
+                rowid=product.id, name=product.name, description=product.description
+            )
+        )
+
+    def remove(self: Self, connection: Connection, product: Product) -> None:
+        connection.execute(self.table.delete().where(self.table.c.rowid == product.id))
+
+    def index_rows(self: Self, connection: Connection, session: Session, rows: Iterable) -> None:
+        values: list[dict] = [
+            {"rowid": product_id, "name": name, "description": description}
+            for product_id, name, description in rows
+        ]
+        # Replace rows left behind by bulk deletes, which skip mapper events
+        if values:
+            connection.execute(self.table.insert().prefix_with("OR REPLACE"), values)
+
+    def rebuild(self: Self, connection: Connection) -> None:
+        connection.execute(self.table.delete())
+        connection.execute(
+            self.table.insert().from_select(
+                ["rowid", "name", "description"],
+                select(Product.id, Product.name, Product.description),
+            )
+        )
+
+
+class FilteredSearchMatch(SearchMatch):
+    """
+    Match applied as a plain filter.
+    """
+
+    def __init__(self: Self, condition: ColumnElement, rank: ColumnElement) -> None:
+        super().__init__(rank)
+        self.condition: ColumnElement = condition
+
+    def apply(self: Self, query: Query) -> Query:
+        return query.filter(self.condition)
+
+
+class PostgresSearch(SearchBackend):
+    """
+    PostgreSQL full-text search over a GIN expression index, the index is
+    maintained by PostgreSQL itself.
+    """
+
+    vector: ColumnElement = func.to_tsvector(
+        literal_column("'simple'"),
+        func.coalesce(Product.name, literal_column("''"))
+        .op("||")(literal_column("' '"))
+        .op("||")(func.coalesce(Product.description, literal_column("''"))),
+    )
+    gin_index: Index = Index("ix_product_search", vector, postgresql_using="gin")
+
+    def setup(self: Self, connection: Connection) -> None:
+        if inspect(connection).has_table(Product.__tablename__):
+            self.gin_index.create(connection, checkfirst=True)
+
+    def match(self: Self, search: str) -> SearchMatch:
+        tokens: list[str] = tokenize(search)
+        if not tokens:
+            return EmptySearchMatch(literal_column("0.0"))
+        query = func.to_tsquery(
+            literal_column("'simple'"), " & ".join(f"{token}:*" for token in tokens)
+        )
+        return FilteredSearchMatch(self.vector.op("@@")(query), func.ts_rank(self.vector, query))
+
+
+class MySQLSearch(SearchBackend):
+    """
+    MySQL full-text search over a FULLTEXT index, the index is maintained by
+    MySQL itself.
+    """
+
+    fulltext_index: Index = Index(
+        "ix_product_search", Product.name, Product.description, mysql_prefix="FULLTEXT"
+    )
+
+    def setup(self: Self, connection: Connection) -> None:
+        if inspect(connection).has_table(Product.__tablename__):
+            self.fulltext_index.create(connection, checkfirst=True)
+
+    def match(self: Self, search: str) -> SearchMatch:
+        tokens: list[str] = tokenize(search)
+        if not tokens:
+            return EmptySearchMatch(literal_column("0.0"))
+        # Every term required, as a word prefix
+        relevance: ColumnElement = mysql_match(
+            Product.name, Product.description, against=" ".join(f"+{token}*" for token in tokens)
+        ).in_boolean_mode()
+        return FilteredSearchMatch(relevance, relevance)
+
+
+class InvertedIndex(SearchBackend):
+    """
+    In-process inverted index, used when the database has no full-text search.
+
+    ORM writes of this process are applied once they commit; writes of other
+    processes show up when the index is rebuilt after `ttl` seconds.
+
+    Attributes:
+        postings (dict[str, dict[int, float]]): Weight of every token in every product.
+        ttl (float): Seconds between rebuilds from the product table.
+        max_results (int): Most relevant products a search returns.
+    """
+
+    def __init__(self: Self, ttl: float = SEARCH_INDEX_TTL, max_results: int = SEARCH_MAX_RESULTS) -> None:
+        self.postings: dict[str, dict[int, float]] = {}
+        self.documents: dict[int, set[str]] = {}
+        self.ttl: float = ttl
+        self.max_results: int = max_results
+        self._built_at: Optional[float] = None
+        self._vocabulary: Optional[list[str]] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def setup(self: Self, connection: Connection) -> None:
+        if inspect(connection).has_table(Product.__tablename__):
+            self.rebuild(connection)
+
+    def refresh(self: Self, connection: Connection) -> None:
+        with self._lock:
+            now: float = time.monotonic()
+            if self._built_at is not None and now - self._built_at < self.ttl:
+                return
+            # Other requests keep searching the current index meanwhile
+            self._built_at = now
+        self.rebuild(connection)
+
+    @staticmethod
+    def weights(name: Optional[str], description: Optional[str]) -> dict[str, float]:
+        """
+        Returns the weight of every token of a product.
+        """
+        weights: dict[str, float] = {}
+        for token in tokenize(name):
+            weights[token] = weights.get(token, 0.0) + NAME_WEIGHT
+        for token in tokenize(description):
+            weights[token] = weights.get(token, 0.0) + DESCRIPTION_WEIGHT
+        return weights
+
+    def add(self: Self, product_id: int, name: Optional[str], description: Optional[str]) -> None:
+        """
+        Add or replace the tokens of a product.
+        """
+        weights: dict[str, float] = self.weights(name, description)
+        with self._lock:
+            self._discard(product_id)
+            for token, weight in weights.items():
+                self.postings.setdefault(token, {})[product_id] = weight
+            self.documents[product_id] = set(weights)
+            self._vocabulary = None
+
+    def discard(self: Self, product_id: int) -> None:
+        """
+        Remove the tokens of a product.
+        """
+        with self._lock:
+            self._discard(product_id)
+
+    def _discard(self: Self, product_id: int) -> None:
+        for token in self.documents.pop(product_id, ()):
+            postings: dict[int, float] = self.postings[token]
+            postings.pop(product_id, None)
+            if not postings:
+                del self.postings[token]
+        self._vocabulary = None
+
+    def scores(self: Self, search: str) -> dict[int, float]:
+        """
+        Returns the relevance of every product matching all search terms.
+
+        Args:
+            search (str): Search terms.
+
+        Returns:
+            dict[int, float]: Relevance by product id.
+        """
+        tokens: list[str] = tokenize(search)
+        if not tokens:
+            return {}
+        with self._lock:
+            if self._vocabulary is None:
+                self._vocabulary = sorted(self.postings)
+            vocabulary: list[str] = self._vocabulary
+            scores: Optional[dict[int, float]] = None
+            for token in tokens:
+                # Every word starting with the token, found by bisecting the sorted vocabulary
+                matched: dict[int, float] = {}
+                position: int = bisect.bisect_left(vocabulary, token)
+                while position < len(vocabulary) and vocabulary[position].startswith(token):
+                    for product_id, weight in self.postings[vocabulary[position]].items():
+                        matched[product_id] = matched.get(product_id, 0.0) + weight
+                    position += 1
+                if scores is None:
+                    scores = matched
+                else:
+                    scores = {
+                        product_id: score + matched[product_id]
+                        for product_id, score in scores.items()
+                        if product_id in matched
+                    }
+                if not scores:
+                    return {}
+            return scores
+
+    def match(self: Self, search: str) -> SearchMatch:
+        scores: dict[int, float] = self.scores(search)
+        if not scores:
+            return EmptySearchMatch(literal_column("0.0"))
+        # Bounded so a broad term does not inline the whole catalogue in the statement
+        if len(scores) > self.max_results:
+            scores = dict(heapq.nlargest(self.max_results, scores.items(), key=lambda item: item[1]))
+        rank: ColumnElement = case(scores, value=Product.id, else_=0.0)
+        return FilteredSearchMatch(Product.id.in_(list(scores)), rank)
+
+    def index(self: Self, connection: Connection, product: Product) -> None:
+        # Applied once the transaction commits
+        defer_search_change(inspect(product).session, self.add, product.id, product.name, product.description)
+
+    def remove(self: Self, connection: Connection, product: Product) -> None:
+        defer_search_change(inspect(product).session, self.discard, product.id)
+
+    def index_rows(self: Self, connection: Connection, session: Session, rows: Iterable) -> None:
+        for product_id, name, description in rows:
+            defer_search_change(session, self.add, product_id, name, description)
+
+    def rebuild(self: Self, connection: Connection) -> None:
+        postings: dict[str, dict[int, float]] = {}
+        documents: dict[int, set[str]] = {}
+        rows = connection.execute(select(Product.id, Product.name, Product.description))
+        for product_id, name, description in rows:
+            weights: dict[str, float] = self.weights(name, description)
+            for token, weight in weights.items():
+                postings.setdefault(token, {})[product_id] = weight
+            documents[product_id] = set(weights)
+        # Swapped at once so searches never see a partial index
+        with self._lock:
+            self.postings = postings
+            self.documents = documents
+            self._vocabulary = None
+            self._built_at = time.monotonic()
+
+
+def substring_match(search: str) -> SearchMatch:
+    """
+    Returns the match of products whose name or description contains the whole search.
+
+    Args:
+        search (str): Search text.
+
+    Returns:
+        SearchMatch: Substring filter, every product ranks the same.
+    """
+    return FilteredSearchMatch(
+        or_(
+            Product.name.icontains(search, autoescape=True),
+            Product.description.icontains(search, autoescape=True),
+        ),
+        literal_column("0.0"),
+    )
+
+
+# One backend per engine, created on first use
+_backends: "weakref.WeakKeyDictionary[Engine, SearchBackend]" = weakref.WeakKeyDictionary()
+_backends_lock: threading.Lock = threading.Lock()
+
+
+def create_search_backend(dialect: str, search: str = SEARCH) -> SearchBackend:
+    """
+    Returns a new search backend for a database dialect.
+
+    Args:
+        dialect (str): SQLAlchemy dialect name.
+        search (str): `SEARCH` setting, "python" forces the in-process index.
+
+    Returns:
+        SearchBackend: Search backend.
+    """
+    if search == "python":
+        return InvertedIndex()
+    if dialect == "sqlite":
+        return SQLiteSearch()
+    if dialect == "postgresql":
+        return PostgresSearch()
+    if dialect in ("mysql", "mariadb"):
+        return MySQLSearch()
+    return InvertedIndex()
+
+
+def get_search_backend(connection: Connection) -> SearchBackend:
+    """
+    Returns the search backend of a connection's engine, set up on first use.
+
+    SQLite builds without FTS5 fall back to the in-process index.
+
+    Args:
+        connection (Connection): Database connection.
+
+    Returns:
+        SearchBackend: Search backend.
+    """
+    engine: Engine = connection.engine
+    backend: Optional[SearchBackend] = _backends.get(engine)
+    if backend is not None:
+        return backend
+    with _backends_lock:
+        backend = _backends.get(engine)
+        if backend is None:
+            backend = create_search_backend(engine.dialect.name)
+            try:
+                backend.setup(connection)
+            except OperationalError:
+                backend = InvertedIndex()
+                backend.setup(connection)
+            _backends[engine] = backend
+    return backend
+
+
+def apply_search_change(change: Any, *args: Any) -> None:
+    """
+    Apply an in-process index change once its transaction commits.
+    """
+    change(*args)
+
+
+# Rolled back changes are forgotten
+defer_search_change = run_on_commit("search_changes", apply_search_change)
+
+
+@event.listens_for(Product, "after_insert")
+@event.listens_for(Product, "after_update")
+def index_product(mapper, connection: Connection, target: Product) -> None:
+    """
+    Index a created or updated product in the same transaction.
+    """
+    get_search_backend(connection).index(connection, target)
+
+
+@event.listens_for(Product, "after_delete")
+def remove_product(mapper, connection: Connection, target: Product) -> None:
+    """
+    Remove a deleted product from the index in the same transaction.
+    """
+    get_search_backend(connection).remove(connection, target)
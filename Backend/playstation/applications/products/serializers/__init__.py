@@ -18,7 +18,7 @@ Note:
 
 from playstation.admin.file_manager import image_handler
 from werkzeug.datastructures.file_storage import FileStorage
-from playstation import serializers
+from playstation import serializers, db
 from playstation.settings import MEDIA_DIR
 from playstation.models.products import Product, Category
 from .validators import (
@@ -31,7 +31,11 @@ from .validators import (
     ProductValidatorByImageURL,
 )
 from .pydantic_serializer import ProductsQuery, SortByChoices
-from sqlalchemy import or_
+from ..categories import category_ids as category_id_cache
+from ..search import SearchBackend, SearchMatch, get_search_backend, substring_match
+from ..images import process_image_variants, srcset
+from .pagination import after_cursor, encode_cursor, order_by, sort_column
+from sqlalchemy import Row
 from sqlalchemy.orm import Query
 import os
 from typing import Any, Optional, Union
@@ -57,9 +61,8 @@ class CategorySerializer(serializers.ModelSerializer):
         Returns:
             list[dict]: Serialized list of category objects.
         """
-        categories: list[Category] = Category.query.all()
-        serializer = CategorySerializer(categories, many=True)
-        return serializer.data
+        # Categories are projected straight from rows
+        return CategorySerializer.project()
 
 
 # Create Category Serializer
@@ -143,6 +146,7 @@ class ProductSerializer(serializers.ModelSerializer):
             "stock",
             "category_id",
             "image_url",
+            "image_variants",
             "is_sale",
             "discount",
         ]
@@ -161,8 +165,37 @@ class ProductSerializer(serializers.ModelSerializer):
             dict: Serialized representation of the product.
         """
         data: dict = super().to_representation(instance)
-        category: Category = Category.query.get(data.pop("category_id"))
-        data["category"] = CategorySerializer(instance=category).data
+        data.pop("category_id")
+        data["srcset"] = srcset(data.pop("image_variants"))
+        # The related category comes from the identity map, no serializer per row
+        data["category"] = CategorySerializer.representation_plan().represent(
+            instance.category
+        )
+        return data
+
+    @classmethod
+    def projection(cls) -> list:
+        """
+        Product columns plus the category columns, replacing `category_id`.
+        """
+        columns: list = [column for column in super().projection() if column.key != "category_id"]
+        return columns + [Category.id.label("category_id"), Category.name.label("category_name")]
+
+    @classmethod
+    def projection_query(cls) -> Query:
+        """
+        Projection query joined with the category of each product.
+        """
+        return super().projection_query().select_from(Product).join(Product.category)
+
+    @classmethod
+    def from_row(cls, row: Row) -> dict:
+        """
+        Build the product representation, nesting its category like to_representation.
+        """
+        data: dict = row._asdict()
+        data["category"] = {"id": data.pop("category_id"), "name": data.pop("category_name")}
+        data["srcset"] = srcset(data.pop("image_variants"))
         return data
 
 
@@ -229,30 +262,69 @@ class GetProductSerializer(serializers.Serializer):
         Returns:
             Optional[list[dict]]: List of products matching the queries.
         """
+        products, _ = cls.get_products_page(queries)
+        return products
+
+    @classmethod
+    def get_products_page(cls, queries: dict[str, str]) -> tuple[list[dict], Optional[str]]:
+        """
+        Retrieve a page of products and the cursor of the next page.
+
+        Args:
+            queries (dict[str, str]): Queries to filter products.
+
+        Raises:
+            InvalidCursor: If the cursor is malformed or belongs to another ordering.
+
+        Returns:
+            tuple[list[dict], Optional[str]]: Products and the next cursor, None on the last page.
+        """
+        validated_queries: dict = cls.validate_queries(queries)
+        # Retrieve serialized products
+        return cls.get_products_query(validated_queries)
+
+    @staticmethod
+    def validate_queries(queries: dict[str, str]) -> dict:
+        """
+        Validate and normalize listing queries.
+
+        Args:
+            queries (dict[str, str]): Queries to filter products.
+
+        Returns:
+            dict: Validated queries, equal for equivalent requests.
+        """
         # Verify Queries
         pydantic_model: ProductsQuery = ProductsQuery(**queries)
         # Grab validated queries
-        validated_queries: dict[str, str] = pydantic_model.model_dump()
-        # Retrieve products
-        products: list[Product] = cls.get_products_query(validated_queries)
-        # Serialize products
-        serializer: ProductSerializer = ProductSerializer(instance=products, many=True)
-        # Return Serialized Data
-        return serializer.data
+        return pydantic_model.model_dump()
 
     @classmethod
-    def get_products_query(cls, validated_queries: dict) -> list[Product]:
+    def get_products_query(cls, validated_queries: dict) -> tuple[list[dict], Optional[str]]:
         """
         Retrieve products based on validated queries.
 
+        Only the serialized columns are selected, rows are turned into dicts
+        without loading Product instances. One extra row is fetched to know
+        whether a next page exists.
+
         Args:
             validated_queries (dict): Validated queries to filter products.
 
         Returns:
-            list[Product]: List of products matching the queries.
-        """
-        # Build Up Query
-        query: Query = Product.query
+            tuple[list[dict], Optional[str]]: Products matching the queries and the next cursor.
+        """
+        # Searches default to the relevance ordering
+        match: Optional[SearchMatch] = cls.search_match(validated_queries)
+        sort_by: str = validated_queries.get("sort_by") or (
+            SortByChoices.relevance.value if match else SortByChoices.date.value
+        )
+        if match is None and sort_by == SortByChoices.relevance.value:
+            sort_by = SortByChoices.date.value
+        validated_queries = {**validated_queries, "sort_by": sort_by, "search_match": match}
+        column, _ = sort_column(sort_by, match.rank if match else None)
+        # Build Up Query, the sort key is selected to create the next cursor
+        query: Query = ProductSerializer.projection_query().add_columns(column.label("sort_key"))
         query: Query = cls.filter_sale(query, validated_queries)
         query: Query = cls.filter_category(query, validated_queries)
         query: Query = cls.filter_price(query, validated_queries)
@@ -260,7 +332,16 @@ class GetProductSerializer(serializers.Serializer):
         query: Query = cls.sort_by(query, validated_queries)
         query: Query = cls.paginate(query, validated_queries)
         # Execute Query
-        return query.all()
+        rows: list[Row] = query.all()
+        page_size: int = validated_queries.get("products", 10)
+        next_cursor: Optional[str] = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_cursor(sort_by, rows[-1].sort_key, rows[-1].id)
+        products: list[dict] = [ProductSerializer.from_row(row) for row in rows]
+        for product in products:
+            product.pop("sort_key")
+        return products, next_cursor
 
     @classmethod
     def filter_sale(cls, query: Query, validated_queries: dict):
@@ -318,18 +399,15 @@ class GetProductSerializer(serializers.Serializer):
         """
         Validate category IDs against existing categories.
 
+        Checked against the cached set of category ids, no query per id.
+
         Args:
             category_ids (list[int]): List of category IDs to validate.
 
         Returns:
             list[int]: List of valid category IDs.
         """
-        valid_category_ids = []
-        for cat_id in category_ids:
-            exists = Category.query.filter_by(id=cat_id).first()
-            if exists:
-                valid_category_ids.append(cat_id)
-        return valid_category_ids
+        return category_id_cache.existing(category_ids)
 
     @classmethod
     def filter_price(cls, query: Query, validated_queries: dict):
@@ -352,11 +430,38 @@ class GetProductSerializer(serializers.Serializer):
             query = query.filter(Product.price <= high_price)
         return query
 
+    @staticmethod
+    def search_match(validated_queries: dict) -> Optional[SearchMatch]:
+        """
+        Run the search of the queries against the full-text search backend.
+
+        Args:
+            validated_queries (dict): Validated queries to filter products.
+
+        Returns:
+            Optional[SearchMatch]: Matching products and their relevance, None without a search.
+        """
+        search = validated_queries.get("search")
+        if not search:
+            return None
+        connection = db.session.connection()
+        backend: SearchBackend = get_search_backend(connection)
+        backend.refresh(connection)
+        match: SearchMatch = backend.match(search)
+        # No word starts with the terms, keep finding substrings such as "ider" in "Spider-Man"
+        if not match.exists(db.session):
+            return substring_match(search)
+        return match
+
     @classmethod
     def filter_search(cls, query: Query, validated_queries: dict):
         """
         Filter products by search keyword.
 
+        Every search term must match the start of a word of the product name
+        or description, through the full-text search index. When no product
+        matches, the whole search is matched as a substring instead.
+
         Args:
             query: SQLAlchemy query object.
             validated_queries (dict): Validated queries to filter products.
@@ -364,14 +469,9 @@ class GetProductSerializer(serializers.Serializer):
         Returns:
             Query: Filtered SQLAlchemy query object.
         """
-        search = validated_queries.get("search")
-        if search:
-            query = query.filter(
-                or_(
-                    Product.name.ilike(f"%{search}%"),
-                    Product.description.ilike(f"%{search}%"),
-                )
-            )
+        match: Optional[SearchMatch] = validated_queries.get("search_match")
+        if match is not None:
+            query = match.apply(query)
         return query
 
     @classmethod
@@ -379,6 +479,8 @@ class GetProductSerializer(serializers.Serializer):
         """
         Sort products based on specified criteria.
 
+        Ties are broken by product id so every ordering is total and cursors are stable.
+
         Args:
             query: SQLAlchemy query object.
             validated_queries (dict): Validated queries to sort products.
@@ -386,27 +488,18 @@ class GetProductSerializer(serializers.Serializer):
         Returns:
             Query: Sorted SQLAlchemy query object.
         """
-        sort_by = validated_queries.get("sort_by")
-        if sort_by:
-            if sort_by == SortByChoices.price:
-                query = query.order_by(Product.price)
-            elif sort_by == SortByChoices.price_desc:
-                query = query.order_by(Product.price.desc())
-            elif sort_by == SortByChoices.name:
-                query = query.order_by(Product.name)
-            elif sort_by == SortByChoices.name_desc:
-                query = query.order_by(Product.name.desc())
-            elif sort_by == SortByChoices.date:
-                query = query.order_by(Product.created_at)
-            elif sort_by == SortByChoices.date_desc:
-                query = query.order_by(Product.created_at.desc())
-        return query
+        sort_by = validated_queries.get("sort_by") or SortByChoices.date.value
+        match = validated_queries.get("search_match")
+        return order_by(query, sort_by, match.rank if match else None)
 
     @classmethod
     def paginate(cls, query: Query, validated_queries: dict):
         """
         Paginate the products query.
 
+        A cursor seeks past the last product of the previous page, otherwise
+        `start` rows are skipped. One extra row is fetched to detect the next page.
+
         Args:
             query: SQLAlchemy query object.
             validated_queries (dict): Validated queries for pagination.
@@ -414,10 +507,16 @@ class GetProductSerializer(serializers.Serializer):
         Returns:
             Query: Paginated SQLAlchemy query object.
         """
-        start = validated_queries.get("start", 0)
         products = validated_queries.get("products", 10)
-        query = query.offset(start).limit(products)
-        return query
+        cursor = validated_queries.get("cursor")
+        if cursor:
+            sort_by = validated_queries.get("sort_by") or SortByChoices.date.value
+            match = validated_queries.get("search_match")
+            query = after_cursor(query, cursor, sort_by, match.rank if match else None)
+        else:
+            start = validated_queries.get("start", 0)
+            query = query.offset(start)
+        return query.limit(products + 1)
 
 
 # Create Product Serializer
@@ -440,6 +539,17 @@ class CreateProductSerializer(serializers.Serializer):
             "image_url",
         ]
 
+    def save(self) -> Product:
+        """
+        Create the product, then generate the variants of its uploaded image.
+
+        Returns:
+            Product: Created product.
+        """
+        instance: Product = super().save()
+        process_image_variants(getattr(self, "_image_upload", None))
+        return instance
+
     def validate_name(self, value: str) -> str:
         """
         Validate product name.
@@ -540,11 +650,13 @@ class CreateProductSerializer(serializers.Serializer):
             str: Validated image URL of the product.
         """
         if isinstance(value, FileStorage):
-            value = image_handler.save_image(
+            # Variants are generated once the product is saved
+            self._image_upload = image_handler.upload(
                 value,
                 upload_dir=os.path.join(MEDIA_DIR, self._data.get("name", "random")),
                 safe=True,
             )
+            value = self._image_upload.path
         elif value is None:
             value = os.path.join(MEDIA_DIR, "default.png")
 
@@ -575,6 +687,32 @@ class UpdateProductSerializer(serializers.Serializer):
             "image_url",
         ]
 
+    def save(self) -> Product:
+        """
+        Update the product, then generate the variants of its uploaded image.
+
+        Returns:
+            Product: Updated product.
+        """
+        instance: Product = super().save()
+        process_image_variants(getattr(self, "_image_upload", None))
+        return instance
+
+    def update(self, validated_data: dict, instance: Product) -> Product:
+        """
+        Update the product, dropping the variants of a replaced image.
+
+        Args:
+            validated_data (dict): Validated data of the product.
+            instance (Product): Product to update.
+
+        Returns:
+            Product: Updated product.
+        """
+        if validated_data.get("image_url", instance.image_url) != instance.image_url:
+            instance.image_variants = None
+        return super().update(validated_data, instance)
+
     def validate_id(self, value: int) -> int:
         """
         Validate product ID.
@@ -694,10 +832,12 @@ class UpdateProductSerializer(serializers.Serializer):
         if ProductValidatorByImageURL().validate(value):
             pass
         elif isinstance(value, FileStorage):
-            value = image_handler.save_image(
+            # Variants are generated once the product is saved
+            self._image_upload = image_handler.upload(
                 value,
                 upload_dir=os.path.join(MEDIA_DIR, self._data.get("name", "random")),
             )
+            value = self._image_upload.path
         elif value is None:
             value = os.path.join(MEDIA_DIR, "default.png")
 
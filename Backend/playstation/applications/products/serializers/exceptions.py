@@ -13,3 +13,9 @@ class InvalidCategoriesOption(Exception):
     """Exception raised for invalid category option."""
 
     pass
+
+
+class InvalidCursor(Exception):
+    """Exception raised for a malformed cursor or a cursor of another ordering."""
+
+    pass
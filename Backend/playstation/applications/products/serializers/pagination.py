@@ -0,0 +1,159 @@
+"""
+# Module: products pagination
+# This module contains the keyset (cursor) pagination of the products listing.
+
+A cursor is an opaque url-safe string holding the ordering it was created for,
+the sort key and the id of the last product of a page. The next page starts
+right after that product, so the database seeks with the sort index instead of
+scanning and discarding `start` rows.
+
+```py
+query = after_cursor(query, cursor, sort_by)
+next_cursor = encode_cursor(sort_by, last_product_sort_key, last_product_id)
+```
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional
+from sqlalchemy import and_, or_, select, func
+from sqlalchemy.orm import Query, InstrumentedAttribute
+from sqlalchemy.sql import ColumnElement
+from playstation.models.products import Product
+from .pydantic_serializer import SortByChoices
+from .exceptions import InvalidCursor
+
+
+# Sort column and direction (True for descending) of each ordering
+SORT_COLUMNS: dict[str, tuple[InstrumentedAttribute, bool]] = {
+    SortByChoices.price.value: (Product.price, False),
+    SortByChoices.price_desc.value: (Product.price, True),
+    SortByChoices.name.value: (Product.name, False),
+    SortByChoices.name_desc.value: (Product.name, True),
+    SortByChoices.date.value: (Product.created_at, False),
+    SortByChoices.date_desc.value: (Product.created_at, True),
+}
+
+# Orderings a cursor can belong to, relevance sorts by the rank of a search
+ORDERINGS: frozenset[str] = frozenset(SORT_COLUMNS) | {SortByChoices.relevance.value}
+
+
+def sort_column(
+    sort_by: str, rank: Optional[ColumnElement] = None
+) -> tuple[ColumnElement, bool]:
+    """
+    Returns the sort column and direction of an ordering.
+
+    Args:
+        sort_by (str): Ordering, one of `SortByChoices`.
+        rank (Optional[ColumnElement]): Search relevance, required by the relevance ordering.
+
+    Returns:
+        tuple[ColumnElement, bool]: Column and True if descending.
+    """
+    if sort_by == SortByChoices.relevance.value and rank is not None:
+        return rank, True
+    return SORT_COLUMNS.get(sort_by, SORT_COLUMNS[SortByChoices.date.value])
+
+
+def order_by(query: Query, sort_by: str, rank: Optional[ColumnElement] = None) -> Query:
+    """
+    Order a products query, ties are broken by id in the same direction.
+
+    Args:
+        query (Query): Products query.
+        sort_by (str): Ordering, one of `SortByChoices`.
+        rank (Optional[ColumnElement]): Search relevance, required by the relevance ordering.
+
+    Returns:
+        Query: Ordered query.
+    """
+    column, descending = sort_column(sort_by, rank)
+    if descending:
+        return query.order_by(column.desc(), Product.id.desc())
+    return query.order_by(column, Product.id)
+
+
+def encode_cursor(sort_by: str, key: Any, id: int) -> str:
+    """
+    Create the cursor pointing after a product.
+
+    Args:
+        sort_by (str): Ordering the cursor belongs to.
+        key (Any): Sort key of the product.
+        id (int): Id of the product.
+
+    Returns:
+        str: Opaque cursor.
+    """
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    payload: bytes = json.dumps({"sort_by": sort_by, "key": key, "id": id}).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor (str): Opaque cursor.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+
+    Returns:
+        dict: Ordering, sort key and id of the cursor.
+    """
+    try:
+        padding: str = "=" * (-len(cursor) % 4)
+        payload: Any = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        if not isinstance(payload, dict) or not isinstance(payload.get("id"), int):
+            raise ValueError("Cursor id must be an integer")
+        if payload.get("sort_by") not in ORDERINGS:
+            raise ValueError("Unknown cursor ordering")
+        if payload["sort_by"] in (SortByChoices.date.value, SortByChoices.date_desc.value):
+            payload["key"] = datetime.fromisoformat(payload["key"])
+        return payload
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+def after_cursor(
+    query: Query, cursor: str, sort_by: str, rank: Optional[ColumnElement] = None
+) -> Query:
+    """
+    Filter a products query to the products following a cursor.
+
+    The sort key is read from the cursor's product row, so the comparison uses
+    the value exactly as stored. The key carried by the cursor is only used
+    when that product has since been deleted, and for the relevance ordering
+    whose rank is not stored.
+
+    Args:
+        query (Query): Products query.
+        cursor (str): Opaque cursor.
+        sort_by (str): Ordering of the query.
+        rank (Optional[ColumnElement]): Search relevance, required by the relevance ordering.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or was created for another ordering.
+
+    Returns:
+        Query: Filtered query.
+    """
+    payload: dict[str, Any] = decode_cursor(cursor)
+    if payload["sort_by"] != sort_by:
+        raise InvalidCursor(f"Cursor does not belong to the {sort_by} ordering")
+    column, descending = sort_column(sort_by, rank)
+    if sort_by == SortByChoices.relevance.value:
+        anchor = payload["key"]
+    else:
+        anchor = func.coalesce(
+            select(column).where(Product.id == payload["id"]).scalar_subquery(),
+            payload["key"],
+        )
+    if descending:
+        return query.filter(or_(column < anchor, and_(column == anchor, Product.id < payload["id"])))
+    return query.filter(or_(column > anchor, and_(column == anchor, Product.id > payload["id"])))
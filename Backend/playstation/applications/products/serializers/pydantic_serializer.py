@@ -22,6 +22,7 @@ class SortByChoices(str, Enum):
     name_desc = "name_desc"
     date = "date"
     date_desc = "date_desc"
+    relevance = "relevance"
 
 
 class ProductsQuery(BaseModel):
@@ -42,10 +43,11 @@ class ProductsQuery(BaseModel):
         "all"  # Field that can be an int (ID) or the string "all"
     )
     search: Optional[StrictStr] = None  # Optional search field
-    sort_by: SortByChoices = (
-        SortByChoices.date
-    )  # Optional sort by field, default is 'date'
+    sort_by: Optional[SortByChoices] = (
+        None
+    )  # Optional sort by field, default is 'relevance' when searching, otherwise 'date'
     start: int = Field(0, ge=0)  # Optional start field, must be >= 0
+    cursor: Optional[StrictStr] = None  # Optional cursor field, replaces start when given
     products: int = Field(
         10, ge=10, le=40
     )  # Optional products field, must be between 10 and 40
@@ -75,3 +77,25 @@ class ProductsQuery(BaseModel):
                     f"Only allowed category delimiter is '-', you entered: {v}"
                 )
         return v
+
+
+class ProductImportRow(BaseModel):
+    """
+    Serializer for one row of a bulk product import.
+    Unknown columns such as the `id` of an export are ignored.
+    """
+
+    # Configuration for Pydantic V2
+    model_config = ConfigDict(
+        extra="ignore",  # Ignore extra columns, exports can be imported back
+    )
+
+    # Fields
+    name: str
+    price: float = Field(ge=0)  # Price must be >= 0
+    description: Optional[str] = None
+    stock: int = Field(ge=0)  # Stock must be >= 0, sold out products can be imported
+    category_id: int
+    image_url: Optional[str] = None  # Defaults to the default product image
+    is_sale: bool = False
+    discount: float = Field(0, ge=0, le=100)  # Discount must be between 0 and 100
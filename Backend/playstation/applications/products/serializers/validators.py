@@ -2,14 +2,17 @@
 # File that contains validators for the products application
 """
 
-from playstation.admin.validators import BaseValidator
+from playstation.admin.validators import BaseValidator, ExistsValidator
 from playstation.models.products import Category, Product
 from typing import Self, Optional, NoReturn
 import re
 
 
 # class to check if category exists
-class CategoryValidatorByName(BaseValidator):
+class CategoryValidatorByName(ExistsValidator):
+    model: type = Category
+    column: str = "name"
+
     def validate(self: Self, data: str) -> Optional[NoReturn]:
         """
         Validate if the category exists in the database
@@ -24,66 +27,36 @@ class CategoryValidatorByName(BaseValidator):
             Optional[NoReturn]: If the category exists, returns None. Otherwise, raises a ValueError
         """
         # Check if there is a duplicate category name
-        if Category.query.filter_by(name=data).first():
+        if self.exists(data):
             raise self.raise_exception(ValueError, "Category already exists")
 
 
-class CategoryValidatorByID(BaseValidator):
-    def validate(self: Self, data: int) -> bool:
-        """
-        Validate if the category exists in the database
-
-        Args:
-            data (int): The category ID to be validated
+class CategoryValidatorByID(ExistsValidator):
+    """
+    Validate if the category exists in the database, `validate_many` checks a batch of IDs
+    """
 
-        Returns:
-            bool: True if the category exists, False otherwise
-        """
-        # Check if there is a duplicate category ID
-        if Category.query.filter_by(id=data).first():
-            return True
-        # Category does not exist return False
-        return False
+    model: type = Category
+    column: str = "id"
 
 
 # class to check if exists
-class ProductValidatorByName(BaseValidator):
-    def validate(self: Self, data: str) -> bool:
-        """
-        Validate if the Product exists in the database
-
-        Args:
-            data (str): The Product name to be validated
-
-        Raises:
-            ValueError: Product already exists.
-
-        Returns:
-            bool: If the Product exists, returns True. Otherwise, False
-        """
-        # Check if there is a duplicate Product name
-        if Product.query.filter_by(name=data).first():
-            return True
-        # Product does not exist return False
-        return False
+class ProductValidatorByName(ExistsValidator):
+    """
+    Validate if the Product exists in the database, `validate_many` checks a batch of names
+    """
 
+    model: type = Product
+    column: str = "name"
 
-class ProductValidatorByID(BaseValidator):
-    def validate(self: Self, data: int) -> bool:
-        """
-        Validate if the product exists in the database
 
-        Args:
-            data (int): The product ID to be validated
+class ProductValidatorByID(ExistsValidator):
+    """
+    Validate if the product exists in the database, `validate_many` checks a batch of IDs
+    """
 
-        Returns:
-            bool: True if the product exists, False otherwise
-        """
-        # Check if there is a duplicate product ID
-        if Product.query.filter_by(id=data).first():
-            return True
-        # product does not exist return False
-        return False
+    model: type = Product
+    column: str = "id"
 
 
 class ProductNameByLength(BaseValidator):
@@ -138,30 +111,10 @@ class ImageUrlValidator(BaseValidator):
         return True
 
 
-class ProductValidatorByImageURL(BaseValidator):
+class ProductValidatorByImageURL(ExistsValidator):
     """
     Check if a product with the same image link exists
     """
 
-    def _validate_image_url(self: Self, url: str) -> bool:
-        """
-        Validate if the image URL is a valid HTTPS URL and points to an image file.
-        """
-        if Product.query.filter_by(image_url=url).first():
-            return True
-        return False
-
-    def validate(self: Self, url: str) -> bool:
-        """
-        Validate if the product with the same image link exists
-
-        Args:
-            url (str): The image URL to be validated
-
-        Returns:
-            bool: True if the product with the same image link exists, False otherwise
-        """
-        # Validate the image URL
-        if not self._validate_image_url(url):
-            return False
-        return True
+    model: type = Product
+    column: str = "image_url"
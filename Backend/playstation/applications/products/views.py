@@ -44,6 +44,18 @@ These routes require authentication and appropriate permissions to access:
   - Authentication: JWT required
   - Permissions: Admin permissions required
 
+- **/api/products/import: Import products in bulk.
+  - Method: POST
+  - Description: Allows admins to create products from a CSV or NDJSON body or uploaded `file`.
+  - Authentication: JWT required
+  - Permissions: Admin permissions required
+
+- **/api/products/export: Export every product.
+  - Method: GET
+  - Description: Streams the catalog as CSV or NDJSON.
+  - Authentication: JWT required
+  - Permissions: Admin permissions required
+
 ### Public Routes
 These routes are accessible without authentication:
 
@@ -69,13 +81,16 @@ These routes are accessible without authentication:
     - **sale** (bool, optional): Specify if the product is on sale.
 """
 
-from flask import current_app, Response, make_response, request
+from flask import current_app, Response, make_response, request, stream_with_context
 from typing import Optional
+import codecs
 from playstation.admin.authentications import authentication_classess
 from playstation.admin.authentications.jwt_authentication import JWTAuthentication
 from playstation.admin.permissions import permission_required
 from werkzeug.datastructures import FileStorage
 from .permissions import IsAdmin
+from .cache import listing_cache
+from .bulk import FORMATS, ProductImporter, export_products, guess_format, read_rows
 from .serializers import (
     CategorySerializer,
     CreateCategorySerializer,
@@ -84,7 +99,7 @@ from .serializers import (
     GetProductSerializer,
     UpdateProductSerializer,
 )
-from .serializers.exceptions import InvalidCategoriesDelimiter, InvalidCategoriesOption
+from .serializers.exceptions import InvalidCategoriesDelimiter, InvalidCategoriesOption, InvalidCursor
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
 from . import products_api
@@ -134,15 +149,16 @@ def get_categories(*args, **kwargs) -> Response:
     Get all product categories
 
     Returns:
-        Response: A list of all product categories with status 200.
+        Response: A list of all product categories with status 200, 304 if the ETag matches If-None-Match.
 
     Error Codes:
         - 404: Not Found - If no categories are found.
     """
     try:
-        # Get all categories
-        categories = CategorySerializer.get_all_categories()
-        return make_response(categories, 200)
+        # Get all categories, cached until a category changes
+        return listing_cache.respond(
+            "categories", None, lambda: (CategorySerializer.get_all_categories(), {})
+        )
     except Exception as e:
         error: str = str(e)
         current_app.logger.error(error)
@@ -421,26 +437,38 @@ def get_all_products(*args, **kwargs) -> Response:
     Get all products
 
     Returns:
-        Response: A list of all products with status 200.
+        Response: A list of all products with status 200, 304 if the ETag matches If-None-Match.
 
     Query Parameters:
         - category (str, optional): Filter products by category.
-        - search (str, optional): Search products by name or description.
-        - sort_by (str, optional): Sort products by specified field (e.g., price, name).
+        - search (str, optional): Search products by name or description, every word must match the start of a word.
+        - sort_by (str, optional): Sort products by specified field (e.g., price, name, relevance). Searches default to relevance.
         - start (int, optional): Specify the page number for pagination.
+        - cursor (str, optional): Cursor of the next page, returned in the X-Next-Cursor header. Replaces start.
         - products (int, optional): Specify the number of products per page for pagination.
         - low_price (int, optional): Specify the lowest price for product.
         - high_price (int, optional): Specify the highest price for the product.
         - sale (bool, optional): Specify the sale for the product.
 
+    Headers:
+        - X-Next-Cursor: Cursor of the next page, missing on the last page.
+
     Error Codes:
+        - 400: Bad Request - If the cursor is invalid.
         - 404: Not Found - If no products are found.
     """
     queries: dict = request.args.to_dict()
     try:
-        serialized_products: list[dict] = GetProductSerializer.get_products(queries)
-        # Logic to get all products
-        return make_response(serialized_products, 200)
+        validated_queries: dict = GetProductSerializer.validate_queries(queries)
+
+        def build_page() -> tuple[list[dict], dict[str, str]]:
+            # Logic to get all products
+            products, next_cursor = GetProductSerializer.get_products_query(validated_queries)
+            headers: dict[str, str] = {} if next_cursor is None else {"X-Next-Cursor": next_cursor}
+            return products, headers
+
+        # Pages are cached by their validated queries until a product or category changes
+        return listing_cache.respond("products", validated_queries, build_page)
     except ValidationError as e:
         # Grab error to logs
         errors: list = e.errors()
@@ -455,6 +483,11 @@ def get_all_products(*args, **kwargs) -> Response:
         error: str = str(e)
         current_app.logger.error(error)
         return make_response({"message": "Forbidden Request"}, 403)
+    except InvalidCursor as e:
+        # Grab error to logs
+        error: str = str(e)
+        current_app.logger.error(error)
+        return make_response({"message": "Invalid cursor"}, 400)
     except SQLAlchemyError as e:
         # Grab error to logs
         error: str = str(e)
@@ -464,3 +497,85 @@ def get_all_products(*args, **kwargs) -> Response:
         error: str = str(e)
         current_app.logger.error(error)
         return make_response({"message": "Failed to retrieve products"}, 500)
+
+
+# API to import products in bulk
+@products_api.route("/import", methods=["POST"])
+@authentication_classess([JWTAuthentication])
+@permission_required([IsAdmin])
+def import_products(*args, **kwargs) -> Response:
+    """
+    Import products from a CSV or NDJSON body, or from an uploaded `file`.
+
+    The body is read as a stream and imported in batches, every batch is committed on its own.
+
+    Query Parameters:
+        - format (str, optional): "csv" or "ndjson", defaults to the content type or file extension.
+
+    Returns:
+        Response: The import report with status 201, created and failed counts and the first errors.
+
+    Error Codes:
+        - 400: Bad Request - If no product was created.
+        - 401: Unauthorized - If the user is not authenticated.
+        - 403: Forbidden - If the user does not have the required permissions.
+        - 415: Unsupported Media Type - If the format is not csv or ndjson.
+    """
+    try:
+        # Grab the stream and its format
+        content_type: str = request.content_type or ""
+        file_format: Optional[str] = request.args.get("format")
+        if content_type.startswith("multipart/form-data"):
+            file: Optional[FileStorage] = request.files.get("file", None)
+            if file is None:
+                return make_response({"message": "Missing file"}, 400)
+            file_format = file_format or guess_format(file.filename)
+            stream = file.stream
+        else:
+            file_format = file_format or {"text/csv": "csv", "application/x-ndjson": "ndjson"}.get(
+                content_type.split(";")[0].strip()
+            )
+            stream = request.stream
+        if file_format not in FORMATS:
+            return make_response({"message": "Invalid content type"}, 415)
+        # Import the rows as they are read
+        report: dict = ProductImporter().run(read_rows(codecs.iterdecode(stream, "utf-8"), file_format))
+        return make_response(report, 201 if report["created"] else 400)
+    except SQLAlchemyError as e:
+        error: str = str(e)
+        current_app.logger.error(error)
+        return make_response({"message": "Database error while importing products"}, 500)
+    except Exception as e:
+        error: str = str(e)
+        current_app.logger.error(error)
+        return make_response({"message": "Failed to import products"}, 400)
+
+
+# API to export every product
+@products_api.route("/export", methods=["GET"])
+@authentication_classess([JWTAuthentication])
+@permission_required([IsAdmin])
+def export_all_products(*args, **kwargs) -> Response:
+    """
+    Stream every product as CSV or NDJSON without loading the catalog in memory.
+
+    Query Parameters:
+        - format (str, optional): "csv" (default) or "ndjson".
+
+    Returns:
+        Response: The catalog with status 200.
+
+    Error Codes:
+        - 401: Unauthorized - If the user is not authenticated.
+        - 403: Forbidden - If the user does not have the required permissions.
+        - 415: Unsupported Media Type - If the format is not csv or ndjson.
+    """
+    file_format: str = request.args.get("format", "csv")
+    if file_format not in FORMATS:
+        return make_response({"message": "Invalid format"}, 415)
+    mimetype: str = "text/csv" if file_format == "csv" else "application/x-ndjson"
+    return Response(
+        stream_with_context(export_products(file_format)),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename=products.{file_format}"},
+    )
@@ -2,14 +2,16 @@
 # Validator Model for Shipping Addresses Serializers Package
 """
 
-from playstation.admin.validators import BaseValidator
+from playstation.admin.validators import BaseValidator, ExistsValidator
 from playstation.models.users import User
 from playstation.models.shipping_address import ShippingAddress
 from typing import Optional, NoReturn
 
 
 # Validate user exists
-class UserExists(BaseValidator):
+class UserExists(ExistsValidator):
+    model: type = User
+
     def validate(self, value: Optional[int]) -> Optional[NoReturn]:
         """
         Validate user exists
@@ -20,7 +22,7 @@ class UserExists(BaseValidator):
         if value is None or int(value) < 0:
             raise self.raise_exception(ValueError, "Invalid ID")
 
-        if not User.query.filter_by(id=value).first():
+        if not self.exists(value):
             raise self.raise_exception(ValueError, "User not found")
 
 
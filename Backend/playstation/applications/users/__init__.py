@@ -11,4 +11,4 @@ url_prefix: str = "/api/users"
 # Blueprint
 users_api: Blueprint = Blueprint("users", __name__, url_prefix=url_prefix)
 
-from . import views
+from . import views, commands
@@ -0,0 +1,24 @@
+"""
+# File that contains CLI commands for the users application
+
+```bash
+flask users reap-tokens
+```
+"""
+
+import click
+from flask import current_app
+from playstation.admin.authentications.reaper import TokenReaper
+from . import users_api
+
+
+@users_api.cli.command("reap-tokens")
+def reap_tokens() -> None:
+    """
+    Purge expired blacklisted tokens once, meant for cron style scheduling.
+    """
+    report: dict = TokenReaper(current_app._get_current_object(), 0).reap()
+    click.echo(
+        f"Purged {report['purged']} blacklisted tokens "
+        f"and {report['index_purged']} index entries in {report['seconds']}s"
+    )
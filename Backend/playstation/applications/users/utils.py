@@ -3,13 +3,13 @@
 """
 
 from playstation.admin.authentications.exceptions import UserNotAssignedError
-from playstation.models.users import User
+from playstation.admin.authentications.principal import UserPrincipal
 from flask import Request
 
 
-def get_request_user(request: Request) -> User:
-    """Get user from request"""
-    user: User = getattr(request, "user", None)
+def get_request_user(request: Request) -> UserPrincipal:
+    """Get user principal from request, the User row is only loaded when needed"""
+    user: UserPrincipal = getattr(request, "user", None)
     if user is None:
         raise UserNotAssignedError("User not assigned to request")
     return user
@@ -3,7 +3,7 @@
 """
 
 import re
-from playstation.admin.validators import BaseValidator
+from playstation.admin.validators import BaseValidator, ExistsValidator
 from playstation.models.users import User
 from typing import Self, Optional, NoReturn
 
@@ -139,11 +139,13 @@ class PasswordValidator(BaseValidator):
         return format_valid and length_valid
 
 
-class IDValidator(BaseValidator):
+class IDValidator(ExistsValidator):
     """
     Class used to validate ID input
     """
 
+    model: type = User
+
     def validate(self, id: Optional[int]) -> Optional[NoReturn]:
         """
         Method used to validate ID input
@@ -157,5 +159,5 @@ class IDValidator(BaseValidator):
         if id is None or id < 0:
             raise self.raise_exception(ValueError, "Invalid ID")
 
-        if not User.query.filter_by(id=id).first():
+        if not self.exists(id):
             raise self.raise_exception(ValueError, "User not found")
@@ -17,7 +17,8 @@ database(app)
 """
 
 from flask import Flask
-from playstation import db
+from playstation import db, configure_engine
+from playstation.config import engine_options
 from playstation.models.users import User
 from playstation.models.blacklisted_tokens import BlackListedTokens
 from playstation.models.coupons import Coupons
@@ -26,7 +27,10 @@ from playstation.models.orders import Orders
 from playstation.models.payments import Payments
 from playstation.models.products import Product, Category
 from playstation.models.shipping_address import ShippingAddress
-from playstation.settings import DATABASE
+from playstation.models.media import MediaBlob
+from playstation.admin.authentications.reaper import TokenReaper
+from playstation.applications.products.search import get_search_backend
+from playstation.settings import DATABASE, SQLITE_PRAGMAS, TOKEN_REAPER_INTERVAL
 
 
 # Create function
@@ -42,14 +46,30 @@ def database(app: Flask) -> None:
     """
     # Database Configurations
     app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(DATABASE)
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLITE_PRAGMAS"] = SQLITE_PRAGMAS
 
     # Initialize the app with the extension
     db.init_app(app)
+    configure_engine(app)
 
     # Create Database Tables
     with app.app_context():
         db.create_all()
+        # Add columns missing from tables created by older versions
+        BlackListedTokens.upgrade_schema()
+        # Warm the revocation index with previously blacklisted tokens
+        BlackListedTokens.load_revocation_index()
+        # Create the product search index before the first request
+        with db.engine.begin() as connection:
+            get_search_backend(connection)
+
+    # Purge expired blacklisted tokens in the background
+    if TOKEN_REAPER_INTERVAL > 0:
+        reaper: TokenReaper = TokenReaper(app, TOKEN_REAPER_INTERVAL)
+        app.extensions["token_reaper"] = reaper
+        reaper.start()
 
     # Clear Session
     @app.teardown_appcontext
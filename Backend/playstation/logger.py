@@ -1,6 +1,11 @@
 """
 # Module that has setup logging function
 
+Request threads only put records on a queue. A `QueueListener` thread
+formats them and writes them to the console and a size rotated file,
+flushing once per batch. The handlers and the listener live as long as the
+process and are stopped at exit.
+
 Usage Example:
 
 ```py
@@ -16,25 +21,124 @@ setup_logging(app)
 ```
 """
 
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from logging import Logger
+from typing import Self
 from flask import Flask
 from .settings import LOGGING_COFIGURATION
 import os
 
 
+# Listener of every logger set up in the process, by name
+_listeners: dict[str, "BatchQueueListener"] = {}
+
+
+class BatchFlushMixin:
+    """
+    Leaves flushing a stream handler to the listener, so a burst of records is written at once.
+    """
+
+    def flush(self: Self) -> None:
+        """
+        Called after every record, the listener flushes with flush_batch instead.
+        """
+
+    def flush_batch(self: Self) -> None:
+        """
+        Flush the records written since the last batch.
+        """
+        super().flush()
+
+
+class BatchStreamHandler(BatchFlushMixin, logging.StreamHandler):
+    """
+    Console handler flushed once per batch.
+    """
+
+
+class BatchRotatingFileHandler(BatchFlushMixin, RotatingFileHandler):
+    """
+    Size rotated file handler flushed once per batch.
+    """
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats every record as one JSON object, the `fields` of a record are added at the top level.
+    """
+
+    def format(self: Self, record: logging.LogRecord) -> str:
+        entry: dict = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+        }
+        fields: dict = getattr(record, "fields", None)
+        if fields is not None:
+            entry.update(fields)
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, separators=(",", ":"), default=str)
+
+
+class BatchQueueListener(QueueListener):
+    """
+    Queue listener flushing its handlers when the queue is drained or every `batch_size` records.
+
+    Attributes:
+        batch_size (int): Records handled before the handlers are flushed.
+    """
+
+    def __init__(self: Self, queue: queue.Queue, *handlers: logging.Handler, batch_size: int = 100) -> None:
+        super().__init__(queue, *handlers, respect_handler_level=True)
+        self.batch_size: int = max(batch_size, 1)
+        self._pending: int = 0
+
+    def handle(self: Self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        self._pending += 1
+        if self._pending >= self.batch_size or self.queue.empty():
+            self.flush()
+
+    def flush(self: Self) -> None:
+        """
+        Flush every handler.
+        """
+        self._pending = 0
+        for handler in self.handlers:
+            getattr(handler, "flush_batch", handler.flush)()
+
+    def stop(self: Self) -> None:
+        """
+        Write the queued records, then stop the thread and flush the handlers.
+        """
+        if self._thread is None:
+            return
+        super().stop()
+        self.flush()
+
+
 def setup_logging(app: Flask, name: str = LOGGING_COFIGURATION["NAME"]) -> None:
     """
     Set up logging for the Flask application.
 
     This function configures a logger named as specified with the following settings:
     - Log level is set to DEBUG to capture detailed log messages.
-    - Logs are sent to both the console and a rotating file.
+    - The logger only queues records, a listener thread writes them to the console and a rotating file.
     - Console handler logs messages at the DEBUG level and above.
-    - File handler logs messages at the INFO level and above.
+    - File handler logs messages at the INFO level and above, rotating at MAX_BYTES.
     - Log messages are formatted to include the timestamp, logger name, log level, and message.
 
+    The handlers are created once per process, later calls attach the same logger.
+
     Args:
         app (Flask): The Flask application instance to which the logger is attached.
         name (str): The name of the logger
@@ -45,38 +149,45 @@ def setup_logging(app: Flask, name: str = LOGGING_COFIGURATION["NAME"]) -> None:
     # Create a logger
     logger: Logger = logging.getLogger(name)
 
-    logger.setLevel(
-        logging.DEBUG
-    )  # Set the logger to capture all levels of log messages
-
-    # Create a console handler to output logs to the console
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(
-        logging.DEBUG
-    )  # Console handler captures DEBUG level logs and above
-
-    # Create a rotating file handler to output logs to a file with rotation
-    log_file_path = os.path.abspath(LOGGING_COFIGURATION["FILE"])
-    file_handler = RotatingFileHandler(log_file_path, maxBytes=10000, backupCount=3)
-    file_handler.setLevel(
-        logging.INFO
-    )  # File handler captures INFO level logs and above
-
-    # Define the format for log messages
-    formatter = logging.Formatter(LOGGING_COFIGURATION["FORMAT"])
-    console_handler.setFormatter(formatter)  # Apply the format to console handler
-    file_handler.setFormatter(formatter)  # Apply the format to file handler
-
-    # Add the handlers to the logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    if name not in _listeners:
+        logger.setLevel(
+            logging.DEBUG
+        )  # Set the logger to capture all levels of log messages
+
+        # Create a console handler to output logs to the console
+        console_handler = BatchStreamHandler()
+        console_handler.setLevel(
+            logging.DEBUG
+        )  # Console handler captures DEBUG level logs and above
+
+        # Create a rotating file handler to output logs to a file with rotation
+        log_file_path = os.path.abspath(LOGGING_COFIGURATION["FILE"])
+        file_handler = BatchRotatingFileHandler(
+            log_file_path,
+            maxBytes=LOGGING_COFIGURATION["MAX_BYTES"],
+            backupCount=LOGGING_COFIGURATION["BACKUP_COUNT"],
+            encoding="utf-8",
+        )
+        file_handler.setLevel(
+            logging.INFO
+        )  # File handler captures INFO level logs and above
+
+        # Define the format for log messages
+        formatter = (
+            JsonFormatter() if LOGGING_COFIGURATION["JSON"] else logging.Formatter(LOGGING_COFIGURATION["FORMAT"])
+        )
+        console_handler.setFormatter(formatter)  # Apply the format to console handler
+        file_handler.setFormatter(formatter)  # Apply the format to file handler
+
+        # The logger only queues records, the listener thread writes them
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        listener = BatchQueueListener(
+            records, console_handler, file_handler, batch_size=LOGGING_COFIGURATION["BATCH_SIZE"]
+        )
+        logger.addHandler(QueueHandler(records))
+        listener.start()
+        atexit.register(listener.stop)
+        _listeners[name] = listener
 
     # Attach the logger to the Flask application
     app.logger = logger
-
-    @app.teardown_appcontext
-    def shutdown_session(exception=None):
-        print("Logger Close Handlers")
-        for handler in logger.handlers:
-            handler.close()
-            logger.removeHandler(handler)
@@ -2,10 +2,25 @@
 # This file contains the model and methods related to BlackListedTokens in the database.
 """
 
+import jwt
 from playstation import db, SQLMixin
 from playstation.admin.authentications.token import RefreshToken
+from playstation.admin.authentications.revocation import revocation_index
 from playstation.settings import JWT_AUTHENTICATIONS
+from datetime import datetime, timedelta, timezone
 from typing import Self, Optional
+from sqlalchemy import bindparam, inspect, select, text, update
+
+
+# Ids below the last loaded one read again by each sync, covers out of order commits
+REVOCATION_SYNC_OVERLAP: int = 100
+
+
+def utc_now() -> datetime:
+    """
+    Returns the current UTC time as a naive datetime, the format stored by the database.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class BlackListedTokensMixin(SQLMixin):
@@ -13,11 +28,145 @@ class BlackListedTokensMixin(SQLMixin):
     Mixin class providing functionalities for BlackListedTokens.
     """
 
-    def check_token_life(self: Self) -> None:
+    def save(self: Self, *args, **kwargs) -> None:
+        """
+        Saves the blacklisted tokens and adds them to the revocation index.
+        """
+        if self.expires_at is None:
+            self.expires_at = self.refresh_expiry()
+        super().save(*args, **kwargs)
+        ttl: timedelta = max(self.expires_at - utc_now(), timedelta(seconds=1))
+        revocation_index.revoke(self.access, ttl)
+        revocation_index.revoke(self.refresh, ttl)
+
+    def refresh_expiry(
+        self: Self,
+        key: str = JWT_AUTHENTICATIONS["SECRET_KEY"],
+        algorithm: str = JWT_AUTHENTICATIONS["ALGORITHM"],
+    ) -> datetime:
+        """
+        Returns the expiry of the refresh token, decoded once when the row is created.
+
+        Falls back to a full refresh lifetime from now when the token cannot be decoded.
+
+        Args:
+            key (str): Secret key for decoding the token.
+            algorithm (str): Algorithm used for decoding the token.
+
+        Returns:
+            datetime: Naive UTC expiry of the refresh token.
+        """
+        token: Optional[dict] = RefreshToken.decode_token(self.refresh, key, algorithm)
+        if token is None or "exp" not in token:
+            return utc_now() + JWT_AUTHENTICATIONS["REFRESH_TOKEN_LIFETIME"]
+        return datetime.fromtimestamp(token["exp"], timezone.utc).replace(tzinfo=None)
+
+    @classmethod
+    def load_revocation_index(cls) -> int:
+        """
+        Loads every unexpired blacklisted token into the revocation index.
+
+        Called at start up so a fresh process rejects tokens revoked before it started.
+
+        Returns:
+            int: Number of rows loaded.
         """
-        Checks if the token is expired based on the refresh duration and deletes it if expired.
+        revocation_index.synced_id = 0
+        return cls.sync_revocation_index()
+
+    @classmethod
+    def sync_revocation_index(cls) -> int:
         """
-        pass
+        Loads the unexpired tokens blacklisted since the last load, by any process.
+
+        The last `REVOCATION_SYNC_OVERLAP` ids are read again, so rows of
+        transactions that committed out of id order are not missed.
+
+        Returns:
+            int: Number of rows loaded.
+        """
+        now: datetime = utc_now()
+        rows: list[tuple[int, str, str, datetime]] = (
+            db.session.query(cls.id, cls.access, cls.refresh, cls.expires_at)
+            .filter(cls.id > revocation_index.synced_id - REVOCATION_SYNC_OVERLAP, cls.expires_at > now)
+            .all()
+        )
+        for _, access, refresh, expires_at in rows:
+            revocation_index.revoke(access, expires_at - now)
+            revocation_index.revoke(refresh, expires_at - now)
+        last_id: Optional[int] = db.session.query(db.func.max(cls.id)).scalar()
+        revocation_index.synced_id = max(revocation_index.synced_id, last_id or 0)
+        return len(rows)
+
+    @classmethod
+    def upgrade_schema(cls) -> int:
+        """
+        Adds the expires_at column to a table created before it existed.
+
+        Tables are created with `db.create_all()`, which leaves existing tables
+        as they are. Each row is filled from the exp claim of its refresh token,
+        read without verification so expired tokens keep their past expiry and
+        are purged. Undecodable tokens get a full refresh lifetime.
+
+        Returns:
+            int: Number of rows filled, 0 when the table is up to date or missing.
+        """
+        table = cls.__table__
+        with db.engine.begin() as connection:
+            inspector = inspect(connection)
+            if not inspector.has_table(table.name):
+                return 0
+            if "expires_at" in {column["name"] for column in inspector.get_columns(table.name)}:
+                return 0
+            # Nullable in the database, SQLite cannot add a NOT NULL column without a default
+            column_type: str = table.c.expires_at.type.compile(connection.dialect)
+            connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN expires_at {column_type}"))
+            rows = [
+                {"row_id": row_id, "expiry": cls.token_expiry(refresh)}
+                for row_id, refresh in connection.execute(select(table.c.id, table.c.refresh))
+            ]
+            if rows:
+                connection.execute(
+                    update(table).where(table.c.id == bindparam("row_id")).values(expires_at=bindparam("expiry")),
+                    rows,
+                )
+            for index in table.indexes:
+                if "expires_at" in index.columns:
+                    index.create(connection)
+        return len(rows)
+
+    @staticmethod
+    def token_expiry(token: str) -> datetime:
+        """
+        Returns the expiry of a stored token without verifying its signature or expiry.
+
+        Args:
+            token (str): Refresh token.
+
+        Returns:
+            datetime: Naive UTC expiry, a full refresh lifetime from now when it cannot be read.
+        """
+        try:
+            claims: dict = jwt.decode(token, options={"verify_signature": False})
+            return datetime.fromtimestamp(claims["exp"], timezone.utc).replace(tzinfo=None)
+        except (jwt.InvalidTokenError, KeyError, TypeError, ValueError):
+            return utc_now() + JWT_AUTHENTICATIONS["REFRESH_TOKEN_LIFETIME"]
+
+    @classmethod
+    def purge_expired(cls, now: Optional[datetime] = None) -> int:
+        """
+        Deletes every expired blacklisted token in a single statement.
+
+        Args:
+            now (Optional[datetime]): Naive UTC reference time, defaults to the current time.
+
+        Returns:
+            int: Number of rows deleted.
+        """
+        now = utc_now() if now is None else now
+        result = db.session.execute(db.delete(cls).where(cls.expires_at <= now))
+        db.session.commit()
+        return result.rowcount
 
 
 class BlackListedTokens(db.Model, BlackListedTokensMixin):
@@ -28,6 +177,7 @@ class BlackListedTokens(db.Model, BlackListedTokensMixin):
         id (int): Primary key.
         access (str): Access token.
         refresh (str): Refresh token.
+        expires_at (datetime): Expiry of the refresh token, rows are purged after it.
         user_id (int): Foreign key referencing User.
         user (User): The user associated with this token.
     """
@@ -35,6 +185,7 @@ class BlackListedTokens(db.Model, BlackListedTokensMixin):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     access = db.Column(db.String(1000), nullable=False, unique=True)
     refresh = db.Column(db.String(1000), nullable=False, unique=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     user = db.relationship("User", back_populates="blacklisted_tokens")
 
@@ -46,19 +197,3 @@ class BlackListedTokens(db.Model, BlackListedTokensMixin):
             str: String representation of the BlackListedTokens instance.
         """
         return f"<{self.__class__.__name__} {self.id}>"
-
-    def check_token_life(
-        self: Self,
-        key: str = JWT_AUTHENTICATIONS["SECRET_KEY"],
-        algorithm: str = JWT_AUTHENTICATIONS["ALGORITHM"],
-    ) -> None:
-        """
-        Checks if the token is expired based on the refresh duration and deletes it if expired.
-
-        Args:
-            key (str): Secret key for decoding the token.
-            algorithm (str): Algorithm used for decoding the token.
-        """
-        token: Optional[dict] = RefreshToken.decode_token(self.refresh, key, algorithm)
-        if token is None:
-            self.delete()
@@ -0,0 +1,73 @@
+"""
+# This file contains the model and methods related to stored media blobs in the database.
+"""
+
+from playstation import db, SQLMixin
+from sqlalchemy import Connection, insert, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from typing import Self
+
+
+class MediaBlob(db.Model, SQLMixin):
+    """
+    Represents a content-addressed file in storage, referenced by products.
+
+    Attributes:
+        digest (str): SHA-256 of the content, primary key.
+        refcount (int): Number of products referencing the blob.
+        created_at (datetime): Timestamp when the blob was first referenced.
+    """
+
+    __tablename__ = "media_blob"
+
+    digest = db.Column(db.String(64), primary_key=True)
+    refcount = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, nullable=False, default=db.func.current_timestamp())
+
+    def __repr__(self: Self) -> str:
+        """
+        String representation of the MediaBlob instance.
+
+        Returns:
+            str: String representation of the MediaBlob instance.
+        """
+        return f"<{self.__class__.__name__} {self.digest}>"
+
+    @classmethod
+    def reference(cls, connection: Connection, digest: str, delta: int) -> None:
+        """
+        Change the reference count of a blob inside the current transaction,
+        registering the blob on its first reference.
+
+        Args:
+            connection (Connection): Connection of the transaction.
+            digest (str): Digest of the blob.
+            delta (int): Change of the reference count.
+        """
+        table = cls.__table__
+        refcount = table.c.refcount + delta
+        if delta <= 0:
+            connection.execute(update(table).where(table.c.digest == digest).values(refcount=refcount))
+            return
+
+        # Single statement upsert, safe when two transactions reference the same new blob
+        dialect: str = connection.dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            statement = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+            statement = statement.values(digest=digest, refcount=delta).on_conflict_do_update(
+                index_elements=[table.c.digest], set_={"refcount": refcount}
+            )
+        elif dialect in ("mysql", "mariadb"):
+            statement = mysql.insert(table).values(digest=digest, refcount=delta).on_duplicate_key_update(
+                refcount=refcount
+            )
+        else:
+            try:
+                with connection.begin_nested():
+                    connection.execute(insert(table).values(digest=digest, refcount=delta))
+                return
+            except IntegrityError:
+                # Registered by a concurrent transaction
+                statement = update(table).where(table.c.digest == digest).values(refcount=refcount)
+        connection.execute(statement)
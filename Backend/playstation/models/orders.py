@@ -2,7 +2,7 @@
 # This file contains the model and methods related to Orders in the database.
 """
 
-from playstation import db, SQLMixin
+from playstation import db, db_commit, SQLMixin
 from sqlalchemy.exc import MultipleResultsFound
 from playstation.models.junction_models import order_product
 
@@ -54,8 +54,8 @@ class Orders(db.Model, SQLMixin):
         # Add the association instance to the session to persist it
         db.session.execute(order_product_instance)
 
-        # Commit the session to save the changes
-        self.save()
+        # Commit the session to save the changes, the order row is already persisted
+        db_commit()
 
     def product_quantity(self, product: object) -> int:
         """
@@ -2,11 +2,11 @@
 # This file contains the models and methods related to Products and Categories in the database.
 """
 
-from playstation import db, SQLMixin
+from playstation import db, db_commit, SQLMixin
 from playstation.models.junction_models import order_product
 from .exceptions import ProductOutOfStock
-from typing import Self
-from sqlalchemy import CheckConstraint
+from typing import Self, Optional
+from sqlalchemy import CheckConstraint, update
 from playstation.settings import MEDIA_DIR
 import os
 
@@ -23,6 +23,7 @@ class Product(db.Model, SQLMixin):
         discount (float): Discount on the product, between 0 and 100.
         stock (int): Quantity in stock.
         image_url (str): URL to the product image.
+        image_variants (dict): Width and paths of the resized variants of the image, by variant name.
         is_sale (bool): Indicates if the product is on sale.
         created_at (datetime): Timestamp when the product was created.
         updated_at (datetime): Timestamp when the product was last updated.
@@ -36,6 +37,7 @@ class Product(db.Model, SQLMixin):
     discount = db.Column(db.Float, CheckConstraint("discount >= 0 AND discount <= 100"), nullable=False, default=0)
     stock = db.Column(db.Integer, nullable=False)
     image_url = db.Column(db.String(2056), default=os.path.join(MEDIA_DIR, "default.png"), nullable=False)
+    image_variants = db.Column(db.JSON, nullable=True)
     is_sale = db.Column(db.Boolean, default=False, nullable=False)
     created_at = db.Column(db.DateTime, nullable=False, default=db.func.current_timestamp())
     updated_at = db.Column(db.DateTime, nullable=False, default=db.func.current_timestamp(), onupdate=db.func.current_timestamp())
@@ -60,13 +62,70 @@ class Product(db.Model, SQLMixin):
         Returns:
             int: Cost of the product.
         """
+        return self.unit_cost(self.price, self.discount, self.is_sale)
+
+    @staticmethod
+    def unit_cost(price: float, discount: float, is_sale: bool) -> int:
+        """
+        Returns the cost of one unit from the product columns, shared with checkouts
+        that read the columns without loading Product instances.
+
+        Returns:
+            int: Cost of one unit.
+        """
         # Check if product is on sale
-        if self.is_sale:
+        if is_sale:
             # Calculate cost with discount
-            return int(self.price * (1 - self.discount / 100))
+            return int(price * (1 - discount / 100))
 
         # Calculate cost without discount
-        return int(self.price)
+        return int(price)
+
+    @classmethod
+    def take_stock(cls, product_id: int, amount: int) -> bool:
+        """
+        Decrease the stock of a product in a single conditional UPDATE, without committing.
+
+        Concurrent sales can never take the stock below zero.
+
+        Args:
+            product_id (int): Product id.
+            amount (int): Amount of products to take.
+
+        Returns:
+            bool: True if the stock was taken, False if there was not enough.
+        """
+        result = db.session.execute(
+            update(cls)
+            .where(cls.id == product_id, cls.stock >= amount, cls.stock > 0)
+            .values(stock=cls.stock - amount)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return False
+        # A loaded product reads its new stock on next access
+        key: tuple = cls.__mapper__.identity_key_from_primary_key((product_id,))
+        product: Optional[Self] = db.session.identity_map.get(key)
+        if product is not None:
+            db.session.expire(product, ["stock"])
+        return True
+
+    @classmethod
+    def set_image_variants(cls, image_url: str, variants: dict) -> None:
+        """
+        Record the variants of an image on the products still using it, and commit.
+
+        Args:
+            image_url (str): URL of the original image.
+            variants (dict): Width and paths of each variant.
+        """
+        db.session.execute(
+            update(cls)
+            .where(cls.image_url == image_url)
+            .values(image_variants=variants)
+            .execution_options(synchronize_session=False)
+        )
+        db_commit()
 
     def sell(self, amount: int) -> int:
         """
@@ -74,12 +133,10 @@ class Product(db.Model, SQLMixin):
         :param amount: Amount of products to sell.
         :return: The new stock of the product.
         """
-        # Check if stock is enough
-        if self.stock < amount or self.stock <= 0 or (self.stock - amount) < 0:
+        # Check and decrease stock atomically
+        if not self.take_stock(self.id, amount):
             raise ProductOutOfStock("Not enough stock to sell this amount of products.")
-        # Decrease stock
-        self.stock -= amount
-        self.save()
+        db_commit()
         return self.cost() * amount
 
 class Category(db.Model, SQLMixin):
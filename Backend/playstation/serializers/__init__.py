@@ -2,9 +2,14 @@
 # Serializer Models
 """
 
-from sqlalchemy import Table
+from sqlalchemy import inspect, Row
+from sqlalchemy.orm import Query
+from playstation import db, db_unit_of_work
+from playstation.admin.profiling import stage
 from .serializer import (
     AbstractSerializer,
+    SerializerPlan,
+    RepresentationPlan,
     Validatable,
     Saveable,
     Updatable,
@@ -14,7 +19,7 @@ from .serializer import (
     ToInstance,
     ExtendsPydantic,
 )
-from typing import Self, NoReturn, Optional, Any, Union
+from typing import Self, NoReturn, Optional, Any, Union, Callable
 from pydantic import BaseModel, ValidationError
 
 
@@ -65,7 +70,8 @@ class Serializer(SerializerInterface):
         """
         # Check instance
         if self.instance:
-            return self.to_representation(self.instance)
+            with stage("serialization"):
+                return self.to_representation(self.instance)
         # Return self._data
         return self.validated_data
 
@@ -98,8 +104,9 @@ class Serializer(SerializerInterface):
         self.__data_checker()
 
         # validate data
-        if self.validate(data):
-            return True
+        with stage("validation"):
+            if self.validate(data):
+                return True
         # Data not valid
         return False
 
@@ -129,51 +136,42 @@ class Serializer(SerializerInterface):
         # Implement your validation logic here
         # Check data keys if match the fields of the model or mismatch
         self.__validate_data_fields(data)
-        # Get all validate methods
-        validate_methods: list[str] = self.__validate_methods()
         # Create validated_data
         self._validated_data: dict = data
-        # Get Fields
-        fields: set[str] = set(self.fields)
-        # Check Validation methods
-        if validate_methods:
-            for method in validate_methods:
-                try:
-                    # Grab key
-                    key: str = method.replace("validate_", "")
-                    # Grab the field
-                    value: Optional[str] = data.get(key)
-                    # Check if field is in fields
-                    if key in fields:
-                        # Call each validation method
-                        self._validated_data[key] = getattr(self, method)(value)
-                except SerializerError as e:
-                    # add to error
-                    self.errors.append(
-                        {
-                            "msg": str(e.args[1]),
-                            "field": key,
-                            "input": (
-                                value
-                                if key != "password"
-                                else "" if key in self.write_only else ""
-                            ),
-                            "type": f"{e.args[0].__name__}",
-                        }
-                    )
-                except Exception as e:
-                    self.errors.append(
-                        {
-                            "msg": str(e),
-                            "field": key,
-                            "input": (
-                                value
-                                if key != "password"
-                                else "" if key in self.write_only else ""
-                            ),
-                            "type": f"{type(e).__name__}",
-                        }
-                    )
+        # Run the validation methods compiled in the class plan
+        for key, method in self._plan.validators:
+            # Grab the field
+            value: Optional[str] = data.get(key)
+            try:
+                # Call each validation method
+                self._validated_data[key] = method(self, value)
+            except SerializerError as e:
+                # add to error
+                self.errors.append(
+                    {
+                        "msg": str(e.args[1]),
+                        "field": key,
+                        "input": (
+                            value
+                            if key != "password"
+                            else "" if key in self.write_only else ""
+                        ),
+                        "type": f"{e.args[0].__name__}",
+                    }
+                )
+            except Exception as e:
+                self.errors.append(
+                    {
+                        "msg": str(e),
+                        "field": key,
+                        "input": (
+                            value
+                            if key != "password"
+                            else "" if key in self.write_only else ""
+                        ),
+                        "type": f"{type(e).__name__}",
+                    }
+                )
         # Validate using pydantic
         if self.pydantic_model is not None:
             self._validated_data = getattr(self, "validate_pydantic")(
@@ -187,30 +185,12 @@ class Serializer(SerializerInterface):
         Method used to validate data fields
         """
         # Grab fields
-        fields: set = {
-            key for key in self.model.__dict__.keys() if not key.startswith("_")
-        }
+        fields: frozenset[str] = self._plan.columns
         # Check if data keys match with fields
         for key in data.keys():
             if key not in fields:
                 raise ValueError(f"Invalid field: {key}")
 
-    def __validate_methods(self: Self) -> list[str]:
-        """
-        Method to retrieve a list of validation callable methods.
-
-        Returns:
-            - list of (callable) methods
-        """
-        return [
-            method
-            for method in dir(self)
-            if method.startswith("validate_")  # Get all validate methods
-            if method.replace("validate_", "")
-            in self.fields  # Check if validation method matchs name of a field
-            if callable(getattr(self, method))  # Check if it is a callable method
-        ]
-
     def validate_pydantic(self: Self, validated_data: dict) -> Optional[BaseModel]:
         """Validate data using Pydantic."""
         try:
@@ -254,20 +234,22 @@ class Serializer(SerializerInterface):
             raise ValueError("No validated data found")
         # Check if save method exists
         self.__check_save()
-        # Check if object instance exists or not
-        # Grab object id
-        object_id: Optional[int] = data.get("id", None)
-        instance: Optional[None] = None
-        # Check if id exists
-        if object_id:
+        # Every save made by create/update hooks is committed once
+        with db_unit_of_work():
             # Check if object instance exists or not
-            instance: object = self.model.query.get(object_id)
-            if instance:
-                # Update instance
-                self.instance = self.update(data, instance)
-                return self.instance
-        # Else perform create new instance method
-        self.instance = self.create(data)
+            # Grab object id
+            object_id: Optional[int] = data.get("id", None)
+            instance: Optional[None] = None
+            # Check if id exists
+            if object_id:
+                # Check if object instance exists or not
+                instance: object = db.session.get(self.model, object_id)
+                if instance:
+                    # Update instance
+                    self.instance = self.update(data, instance)
+                    return self.instance
+            # Else perform create new instance method
+            self.instance = self.create(data)
         # Return the instance
         return self.instance
 
@@ -331,60 +313,22 @@ class Serializer(SerializerInterface):
         """
         Convert the model instance into a dictionary representation.
         """
-        # Implement representation logic here
-        fields: list[str] = self.fields
-        # Serialize
-        serialized_data: dict = {
-            field: self.__grab_field(instance, field)
-            for field in fields
-            if field not in self.write_only
-        }
-        # Return Serialized data
-        return serialized_data
-
-    def __grab_field(self, instance: object, field: str) -> Any:
-        """Helper function to grab field for serialization process."""
-        # Grab field value from instance_dict
-        value: Any = getattr(instance, field)
-        # Grab nested serializer
-        # If value is None, check if the field is a relationship
-        if self.__check_model(value):
-            nested_serialization = getattr(self, field, None)
-            return self.__serialize_relationship(nested_serialization, value)
-        if isinstance(value, list):
-            nested_serialization = getattr(self, field, None)
-            return self.__serialize_relationship_list(nested_serialization, value)
-        # Return Value
-        return value
-
-    def __check_model(self, instance: object) -> bool:
-        """Helper function to check if the model exists."""
-        # Check if the model exists
-        return hasattr(instance, "__table__") and isinstance(instance.__table__, Table)
-
-    def __serialize_relationship(
-        self,
-        nested_serializer: Optional["Serializer"],
-        relationship: object,
-    ) -> Any:
-        """Helper function to serialize a single nested relationship."""
-        if nested_serializer and isinstance(nested_serializer, Serializer):
-            nested_serializer.instance = relationship
-            return nested_serializer.data
-        return self.__grab_field(relationship, "id")
-
-    def __serialize_relationship_list(
-        self, nested_serializer: Optional["Serializer"], relationship: list
-    ) -> list:
-        """Helper function to serialize a list of nested relationships."""
-        if nested_serializer and isinstance(nested_serializer, Serializer):
-            nested_serializer.instance = relationship
-            return nested_serializer.data
-        return [
-            self.__grab_field(model, "id")
-            for model in relationship
-            if self.__check_model(model)
-        ]
+        # Representation is compiled once per serializer class
+        return self.representation_plan().represent(instance)
+
+    @classmethod
+    def representation_plan(cls) -> RepresentationPlan:
+        """
+        Returns the compiled representation of the class.
+
+        Compiled on first use rather than at class definition, the mapper
+        relationships may not be configured yet when the class is defined.
+        """
+        plan: Optional[RepresentationPlan] = cls.__dict__.get("_representation_plan")
+        if plan is None:
+            plan = RepresentationPlan(cls, cls._plan)
+            cls._representation_plan = plan
+        return plan
 
     def to_instance(self, find_by: str = "id") -> Optional[object]:
         """
@@ -411,14 +355,68 @@ class ModelSerializer(Serializer):
 
             raise ValueError("Model instance is not provided")
 
-        # Treat instance as many instances
-        if self.many:
-            if not isinstance(self.instance, list):
-                raise TypeError("Expected a list of instances with many set to True")
-            return [self.to_representation(instance) for instance in self.instance]
+        with stage("serialization"):
+            # Treat instance as many instances
+            if self.many:
+                if not isinstance(self.instance, list):
+                    raise TypeError("Expected a list of instances with many set to True")
+                to_representation = self.to_representation
+                return [to_representation(instance) for instance in self.instance]
 
-        if isinstance(model, list):
-            model = model[0]
+            if isinstance(model, list):
+                model = model[0]
 
-        # Call to_representation method
-        return self.to_representation(model)
+            # Call to_representation method
+            return self.to_representation(model)
+
+    @classmethod
+    def projection(cls) -> list:
+        """
+        Columns selected in projection mode, one per represented field.
+
+        Raises:
+            ValueError: If a represented field is not a column of the model.
+        """
+        plan: SerializerPlan = cls._plan
+        if plan is None:
+            raise AttributeError("Serializer class must define a Meta class")
+        columns: dict = inspect(plan.model).column_attrs
+        projection: list = []
+        for field in plan.fields:
+            if field in plan.write_only:
+                continue
+            if field not in columns:
+                raise ValueError(f"Field {field} can not be projected, it is not a column")
+            projection.append(getattr(plan.model, field))
+        return projection
+
+    @classmethod
+    def projection_query(cls) -> Query:
+        """
+        Query selecting the projection columns, filters apply to it like a model query.
+        """
+        return db.session.query(*cls.projection())
+
+    @classmethod
+    def from_row(cls, row: Row) -> dict:
+        """
+        Convert a projected row into its dictionary representation.
+        """
+        return row._asdict()
+
+    @classmethod
+    def project(cls, query: Optional[Query] = None) -> list[dict]:
+        """
+        Run a projection query and build the representations straight from the rows.
+
+        Rows skip the identity map and attribute instrumentation of model instances.
+
+        Args:
+            query (Optional[Query]): Query built from projection_query(), defaults to every row.
+
+        Returns:
+            list[dict]: Serialized rows.
+        """
+        query = cls.projection_query() if query is None else query
+        from_row: Callable[[Row], dict] = cls.from_row
+        return [from_row(row) for row in query.all()]
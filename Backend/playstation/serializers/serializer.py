@@ -3,8 +3,207 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Iterable, Self
+from operator import attrgetter
+from typing import Optional, Iterable, Self, Callable, Any
 from pydantic import BaseModel
+from sqlalchemy import Table, inspect
+
+
+# Compiled Serializer Plan
+class SerializerPlan:
+    """
+    Validation plan compiled once per serializer class.
+
+    Holds everything `is_valid()` used to work out through reflection on every call.
+
+    Attributes:
+        model: Model class of the serializer.
+        columns (frozenset[str]): Public attributes of the model, allowed keys of input data.
+        fields (list[str]): Serializer fields.
+        write_only (list[str]): Fields never included in representations.
+        read_only (list[str]): Fields never written on update.
+        validators (tuple[tuple[str, Callable], ...]): (field, validate_<field> function) pairs
+            in the order they run.
+    """
+
+    __slots__ = ("model", "columns", "fields", "write_only", "read_only", "validators")
+
+    def __init__(self, serializer_class: type, meta: type) -> None:
+        """
+        Compile the plan of a serializer class.
+
+        Args:
+            serializer_class (type): Serializer class.
+            meta (type): Meta class of the serializer.
+        """
+        self.model = getattr(meta, "model", None)
+        model_keys: list[str] = list(self.model.__dict__.keys())
+        public_keys: list[str] = [key for key in model_keys if not key.startswith("_")]
+        self.columns: frozenset[str] = frozenset(public_keys)
+
+        fields: Optional[Iterable[str]] = getattr(meta, "fields", None)
+        if fields is None:
+            raise ValueError("Fields cannot be None.")
+        self.fields: list[str] = self.select(fields, public_keys)
+        self.write_only: Iterable[str] = self.select(
+            getattr(meta, "write_only", []), model_keys
+        )
+        self.read_only: Iterable[str] = self.select(
+            getattr(meta, "read_only", {"id"}), model_keys
+        )
+
+        field_set: set[str] = set(self.fields)
+        # Validation methods run in name order, the order dir() used to return them in
+        self.validators: tuple[tuple[str, Callable], ...] = tuple(
+            (name[len("validate_"):], getattr(serializer_class, name))
+            for name in sorted(dir(serializer_class))
+            if name.startswith("validate_")
+            if name[len("validate_"):] in field_set
+            if callable(getattr(serializer_class, name))
+        )
+
+    @staticmethod
+    def select(requested: Iterable[str], available: list[str]) -> list[str]:
+        """
+        Resolve requested fields against the available model keys.
+
+        Args:
+            requested (Iterable[str]): Fields from the Meta class or '__all__'.
+            available (list[str]): Model keys the fields may refer to.
+
+        Raises:
+            ValueError: If a requested field does not exist in the model.
+
+        Returns:
+            list[str]: Resolved fields.
+        """
+        if AbstractSerializer.is_all_fields(requested):
+            return available
+        missing: list[str] = [key for key in requested if key not in available]
+        if missing:
+            raise ValueError(f"Field '{missing[0]}' does not exist in model.")
+        return list(requested)
+
+
+# Compiled Representation Plan
+class RepresentationPlan:
+    """
+    Representation function compiled once per serializer class.
+
+    Each represented field gets a getter specialised for its kind, resolved once
+    from the SQLAlchemy mapper: columns are read with `operator.attrgetter`,
+    relationships go straight to their nested serializer or to the related ids.
+
+    Attributes:
+        getters (tuple[tuple[str, Callable], ...]): (field, getter) pairs in field order.
+    """
+
+    __slots__ = ("getters",)
+
+    def __init__(self, serializer_class: type, plan: SerializerPlan) -> None:
+        """
+        Compile the representation of a serializer class.
+
+        Args:
+            serializer_class (type): Serializer class.
+            plan (SerializerPlan): Compiled plan of the serializer class.
+        """
+        mapper = inspect(plan.model)
+        columns: set[str] = set(mapper.column_attrs.keys())
+        relationships: dict[str, bool] = {
+            relationship.key: relationship.uselist for relationship in mapper.relationships
+        }
+        getters: list[tuple[str, Callable[[object], Any]]] = []
+        for field in plan.fields:
+            if field in plan.write_only:
+                continue
+            # Nested serializers are declared as class attributes named after the field
+            nested: Optional[AbstractSerializer] = getattr(serializer_class, field, None)
+            if not isinstance(nested, AbstractSerializer):
+                nested = None
+            if field in columns:
+                getter = attrgetter(field)
+            elif field in relationships:
+                getter = self.relationship_getter(field, nested, relationships[field])
+            else:
+                getter = self.dynamic_getter(field, nested)
+            getters.append((field, getter))
+        self.getters: tuple[tuple[str, Callable[[object], Any]], ...] = tuple(getters)
+
+    def represent(self, instance: object) -> dict:
+        """
+        Convert a model instance into its dictionary representation.
+
+        Args:
+            instance (object): Model instance.
+
+        Returns:
+            dict: Representation of the instance.
+        """
+        return {field: getter(instance) for field, getter in self.getters}
+
+    @staticmethod
+    def relationship_getter(
+        field: str, nested: Optional["AbstractSerializer"], uselist: bool
+    ) -> Callable[[object], Any]:
+        """
+        Build the getter of a relationship field.
+
+        Args:
+            field (str): Relationship name.
+            nested (Optional[AbstractSerializer]): Nested serializer of the field.
+            uselist (bool): True for one-to-many and many-to-many relationships.
+
+        Returns:
+            Callable: Getter returning the nested representation or the related ids.
+        """
+        get: Callable[[object], Any] = attrgetter(field)
+        if nested is not None:
+
+            def nested_getter(instance: object) -> Any:
+                value: Any = get(instance)
+                if value is None:
+                    return None
+                nested.instance = value
+                return nested.data
+
+            return nested_getter
+        if uselist:
+            return lambda instance: [related.id for related in get(instance)]
+        return lambda instance: getattr(get(instance), "id", None)
+
+    @staticmethod
+    def dynamic_getter(
+        field: str, nested: Optional["AbstractSerializer"]
+    ) -> Callable[[object], Any]:
+        """
+        Build the getter of a field the mapper does not know, such as a property.
+
+        The value is inspected on every call since its kind is only known at runtime.
+
+        Args:
+            field (str): Attribute name.
+            nested (Optional[AbstractSerializer]): Nested serializer of the field.
+
+        Returns:
+            Callable: Getter returning the representation of the attribute.
+        """
+
+        def is_model(value: Any) -> bool:
+            return hasattr(value, "__table__") and isinstance(value.__table__, Table)
+
+        def getter(instance: object) -> Any:
+            value: Any = getattr(instance, field)
+            if is_model(value) or isinstance(value, list):
+                if nested is not None:
+                    nested.instance = value
+                    return nested.data
+                if isinstance(value, list):
+                    return [model.id for model in value if is_model(model)]
+                return value.id
+            return value
+
+        return getter
 
 
 # Abstract Serializer
@@ -13,6 +212,17 @@ class AbstractSerializer(ABC):
     Abstract class for serializer implementation.
     """
 
+    # Compiled plan of the class, None for base classes without a Meta class
+    _plan: Optional[SerializerPlan] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Compile the serializer plan once, when the class is defined.
+        """
+        super().__init_subclass__(**kwargs)
+        meta: Optional[type] = getattr(cls, "Meta", None)
+        cls._plan = SerializerPlan(cls, meta) if meta is not None else None
+
     def __init__(
         self,
         instance: Optional[object] = None,
@@ -24,13 +234,12 @@ class AbstractSerializer(ABC):
         self.many: bool = many
         self._errors = []
         self._meta = self.get_meta()  # Access Meta Class
-        self._fields: Optional[Iterable[str]] = getattr(self._meta, "fields", None)
-        self._write_only: Iterable[str] = getattr(self._meta, "write_only", [])
-        self._read_only: Iterable[str] = getattr(self._meta, "read_only", {"id"})
-
-        self.fields = self._fields  # Trigger the fields setter
-        self.write_only = self._write_only  # Trigger the write_only setter
-        self.read_only = self._read_only  # Trigger the read_only setter
+        plan: Optional[SerializerPlan] = self._plan
+        if plan is None:
+            raise AttributeError("Meta class is not defined.")
+        self._fields: list[str] = plan.fields
+        self._write_only: Iterable[str] = plan.write_only
+        self._read_only: Iterable[str] = plan.read_only
 
     def get_meta(self):
         meta = getattr(self, "Meta", None)
@@ -124,6 +333,19 @@ class AbstractSerializer(ABC):
         """
         Helper function to check fields specified fields against '__all__'
 
+        Args:
+            - fields (Optional[Iterable[str]]): Fields
+
+        Returns:
+            - True in case all fields otherwise False
+        """
+        return self.is_all_fields(fields)
+
+    @staticmethod
+    def is_all_fields(fields: Optional[Iterable[str]]) -> bool:
+        """
+        Check specified fields against '__all__'
+
         Args:
             - fields (Optional[Iterable[str]]): Fields
 
@@ -0,0 +1,37 @@
+import unittest
+from flask import Flask
+from playstation.admin.authentications import Authentication, authentication_classess
+
+
+class AcceptToken(Authentication):
+    def authenticate(self, token):
+        return token == "token"
+
+
+class TestAuthenticationHeader(unittest.TestCase):
+    def setUp(self):
+        app = Flask(__name__)
+
+        @app.route("/private")
+        @authentication_classess([AcceptToken])
+        def private():
+            return "ok"
+
+        self.client = app.test_client()
+
+    def status(self, header):
+        headers = {} if header is None else {"Authorization": header}
+        return self.client.get("/private", headers=headers).status_code
+
+    def test_bearer_scheme(self):
+        self.assertEqual(self.status("Bearer token"), 200)
+        self.assertEqual(self.status("Bearer   token "), 200)
+
+    def test_other_schemes_are_rejected(self):
+        for header in (None, "", "Bearer", "Bearer ", "Bearertoken", "BearerXYZ token", "Basic token"):
+            with self.subTest(header=header):
+                self.assertEqual(self.status(header), 401)
+
+
+if __name__ == '__main__':
+    unittest.main()
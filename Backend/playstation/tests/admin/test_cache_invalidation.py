@@ -0,0 +1,47 @@
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from playstation.admin.cache import invalidate_on_commit, run_on_commit
+
+
+class TestRunOnCommit(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        self.session = Session(self.engine)
+        self.calls = []
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_commit_applies_once_per_arguments(self):
+        defer = run_on_commit("test_commit", lambda *args: self.calls.append(args))
+        defer(self.session, 1)
+        defer(self.session, 2)
+        defer(self.session, 1)
+        self.assertEqual(self.calls, [])
+        self.session.commit()
+        self.assertEqual(self.calls, [(2,), (1,)])
+        self.session.commit()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_rollback(self):
+        forget = run_on_commit("test_forget", lambda *args: self.calls.append(("forget",) + args))
+        apply = run_on_commit("test_apply", lambda *args: self.calls.append(("apply",) + args), rollback=True)
+        forget(self.session, 1)
+        apply(self.session, 1)
+        self.session.connection()
+        self.session.rollback()
+        self.assertEqual(self.calls, [("apply", 1)])
+
+    def test_mark_invalidates_now_and_after_commit(self):
+        mark = invalidate_on_commit(lambda *args: self.calls.append(args), key="test_mark")
+        mark(self.session, 7)
+        mark(None, 8)
+        self.assertEqual(self.calls, [(7,), (8,)])
+        self.session.commit()
+        self.assertEqual(self.calls, [(7,), (8,), (7,)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from werkzeug.datastructures import FileStorage
+from playstation.admin.file_manager.storage import ContentAddressedStorage, LocalStorage
+
+
+def upload(content, filename="cover.png"):
+    return FileStorage(stream=BytesIO(content), filename=filename)
+
+
+class TestContentAddressedStorage(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.storage = ContentAddressedStorage(LocalStorage(), os.path.join(self.directory, "blobs"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_blob_path(self):
+        digest = hashlib.sha256(b"image").hexdigest()
+        path = self.storage.save(upload(b"image", "Cover.PNG"), "ignored", "Cover.PNG")
+        self.assertEqual(path, os.path.join(self.directory, "blobs", digest[:2], f"{digest}.png"))
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), b"image")
+        self.assertEqual(ContentAddressedStorage.digest(path), digest)
+        self.assertIsNone(ContentAddressedStorage.digest("/images/cover.png"))
+
+    def test_same_content_is_stored_once(self):
+        first = self.storage.save(upload(b"image"), "a", "a.png")
+        second = self.storage.save(upload(b"image"), "b", "b.png")
+        other = self.storage.save(upload(b"other"), "a", "a.png")
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(len(list(self.storage.list_keys(self.storage.root))), 2)
+
+    def test_derived_files_belong_to_their_blob(self):
+        path = self.storage.save(upload(b"image"), "a", "a.png")
+        name = os.path.basename(path) + "@card.webp"
+        variant = self.storage.save_beside(upload(b"variant", name), path, name)
+        self.assertEqual(os.path.dirname(variant), os.path.dirname(path))
+        blobs = self.storage.blobs()
+        self.assertEqual(sorted(key for key, _ in blobs[ContentAddressedStorage.digest(path)]), sorted([path, variant]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+from playstation.admin.file_manager.image_handler import ImageHandler
+from playstation.admin.file_manager.storage import LocalStorage
+from playstation.admin.file_manager.exceptions import InvalidFileTypeException
+
+
+def image_file(filename="cover.png", size=(800, 400), format="PNG"):
+    buffer = BytesIO()
+    Image.new("RGBA" if format == "PNG" else "RGB", size, (200, 10, 10)).save(buffer, format)
+    buffer.seek(0)
+    return FileStorage(stream=buffer, filename=filename)
+
+
+class TestImageHandler(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.handler = ImageHandler(LocalStorage(), variants={"thumbnail": 100, "card": 400, "detail": 1200}, workers=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_invalid_image_is_not_written(self):
+        file = FileStorage(stream=BytesIO(b"not an image"), filename="cover.png")
+        with self.assertRaises(InvalidFileTypeException):
+            self.handler.upload(file, self.directory)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_disallowed_extension(self):
+        with self.assertRaises(InvalidFileTypeException):
+            self.handler.upload(image_file("cover.gif"), self.directory)
+
+    def test_variants(self):
+        upload = self.handler.upload(image_file(), self.directory)
+        self.assertEqual(upload.path, os.path.join(self.directory, "cover.png"))
+        variants = upload.process().result(timeout=30)
+        self.assertEqual({name: variant["width"] for name, variant in variants.items()}, {"thumbnail": 100, "card": 400, "detail": 800})
+        with Image.open(variants["thumbnail"]["webp"]) as thumbnail:
+            self.assertEqual((thumbnail.format, thumbnail.size), ("WEBP", (100, 50)))
+        with Image.open(variants["card"]["png"]) as card:
+            self.assertEqual((card.format, card.size), ("PNG", (400, 200)))
+
+    def test_jpeg_variants(self):
+        upload = self.handler.upload(image_file("cover.jpg", format="JPEG"), self.directory)
+        variants = upload.process().result(timeout=30)
+        with Image.open(variants["card"]["jpg"]) as card:
+            self.assertEqual(card.format, "JPEG")
+
+    def test_original_path(self):
+        self.assertEqual(ImageHandler.original_path("/images/a/cover.png@card.webp"), "/images/a/cover.png")
+        self.assertEqual(ImageHandler.original_path("/images/a/cover.png"), "/images/a/cover.png")
+
+
+if __name__ == '__main__':
+    unittest.main()
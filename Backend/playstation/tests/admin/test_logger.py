@@ -0,0 +1,89 @@
+import json
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import unittest
+from logging.handlers import QueueHandler
+from flask import Flask
+from playstation.logger import BatchQueueListener, JsonFormatter, _listeners, setup_logging
+
+
+class CountingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.records.append(record.getMessage())
+
+    def flush_batch(self):
+        self.flushes += 1
+
+
+class TestLogger(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        os.chdir(self.directory)
+        self.name = f"playstation.tests.{self.id()}"
+
+    def tearDown(self):
+        listener = _listeners.pop(self.name, None)
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        logging.getLogger(self.name).handlers.clear()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def test_handlers_outlive_the_app_context(self):
+        app = Flask(__name__)
+        setup_logging(app, self.name)
+        with app.app_context():
+            app.logger.info("first request")
+        with app.app_context():
+            app.logger.info("second request")
+            app.logger.debug("console only")
+        _listeners[self.name].stop()
+        with open("app.logs", encoding="utf-8") as file:
+            logs = file.read()
+        self.assertIn("first request", logs)
+        self.assertIn("second request", logs)
+        self.assertNotIn("console only", logs)
+
+    def test_setup_is_once_per_process(self):
+        setup_logging(Flask(__name__), self.name)
+        setup_logging(Flask(__name__), self.name)
+        handlers = logging.getLogger(self.name).handlers
+        self.assertEqual(len(handlers), 1)
+        self.assertIsInstance(handlers[0], QueueHandler)
+
+    def test_flushes_once_per_batch(self):
+        records = queue.SimpleQueue()
+        handler = CountingHandler()
+        listener = BatchQueueListener(records, handler, batch_size=3)
+        for index in range(5):
+            records.put(logging.makeLogRecord({"msg": f"record {index}", "levelno": logging.INFO}))
+        while not records.empty():
+            listener.handle(records.get())
+        self.assertEqual(len(handler.records), 5)
+        # Once at the batch size, once when the queue is drained
+        self.assertEqual(handler.flushes, 2)
+
+    def test_json_formatter(self):
+        formatter = JsonFormatter()
+        record = logging.makeLogRecord({"name": "playstation", "levelname": "INFO", "msg": "hello %s", "args": ("you",)})
+        self.assertEqual(json.loads(formatter.format(record))["message"], "hello you")
+        record = logging.makeLogRecord({"name": "playstation.requests", "levelname": "INFO", "fields": {"status": 200}})
+        entry = json.loads(formatter.format(record))
+        self.assertEqual(entry["status"], 200)
+        self.assertEqual(entry["logger"], "playstation.requests")
+        self.assertNotIn("message", entry)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import importlib.util
+import unittest
+from flask import Flask
+from playstation.admin import metrics
+from playstation.admin.cache import InMemoryCache
+from playstation.admin.metrics import observe_image, record_cache, setup_metrics
+
+HAS_PROMETHEUS = importlib.util.find_spec("prometheus_client") is not None
+
+
+def sample(text, name, **labels):
+    for line in text.splitlines():
+        if line.startswith(name + "{") and all(f'{key}="{value}"' in line for key, value in labels.items()):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+class TestMetricsDisabled(unittest.TestCase):
+    def test_no_endpoint(self):
+        app = Flask(__name__)
+        setup_metrics(app, enabled=False)
+        self.assertEqual(app.test_client().get("/metrics").status_code, 404)
+
+    @unittest.skipIf(HAS_PROMETHEUS, "prometheus_client is installed")
+    def test_missing_package(self):
+        with self.assertRaises(ImportError):
+            setup_metrics(Flask(__name__), enabled=True)
+
+    @unittest.skipIf(HAS_PROMETHEUS, "prometheus_client is installed")
+    def test_hooks_are_no_ops(self):
+        record_cache("listings", True)
+        with observe_image("upload"):
+            pass
+        self.assertIsNone(metrics._metrics)
+
+
+@unittest.skipUnless(HAS_PROMETHEUS, "prometheus_client is not installed")
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        setup_metrics(self.app, enabled=True)
+
+        @self.app.route("/ping")
+        def ping():
+            return "pong"
+
+        self.client = self.app.test_client()
+
+    def scrape(self):
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("text/plain", response.content_type)
+        return response.get_data(as_text=True)
+
+    def test_requests(self):
+        before = sample(self.scrape(), "playstation_http_requests_total", endpoint="ping", status="200")
+        self.client.get("/ping")
+        self.client.get("/ping")
+        text = self.scrape()
+        self.assertEqual(sample(text, "playstation_http_requests_total", endpoint="ping", status="200"), before + 2)
+        self.assertGreater(sample(text, "playstation_http_request_duration_seconds_count", endpoint="ping"), 0)
+        self.assertEqual(sample(text, "playstation_http_requests_total", endpoint="metrics"), 0)
+
+    def test_cache_lookups(self):
+        cache = InMemoryCache(namespace="test_metrics")
+        cache.set("key", 1)
+        cache.get("key")
+        cache.get("missing")
+        text = self.scrape()
+        self.assertEqual(sample(text, "playstation_cache_requests_total", namespace="test_metrics", result="hit"), 1)
+        self.assertEqual(sample(text, "playstation_cache_requests_total", namespace="test_metrics", result="miss"), 1)
+
+    def test_image_processing(self):
+        before = sample(self.scrape(), "playstation_image_processing_seconds_count", stage="upload")
+        with observe_image("upload"):
+            pass
+        self.assertEqual(sample(self.scrape(), "playstation_image_processing_seconds_count", stage="upload"), before + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
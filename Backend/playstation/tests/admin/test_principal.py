@@ -0,0 +1,76 @@
+import unittest
+from playstation import create_app, db
+from playstation.admin.authentications import authentication_classess
+from playstation.admin.authentications.principal import principal_cache
+from playstation.admin.authentications.revocation import revocation_index
+from playstation.admin.authentications.jwt_authentication import JWTAuthentication
+from playstation.admin.authentications.token import get_tokens_for_user, RefreshToken
+from playstation.models.users import User
+from playstation.tests.helpers import QueryBudgetMixin
+from flask import request
+
+
+class TestPrincipalCache(QueryBudgetMixin, unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        principal_cache.backend.clear()
+        self.user = User.create_user(
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="password123"
+        )
+
+    def tearDown(self):
+        principal_cache.backend.clear()
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_principal_is_cached(self):
+        principal = principal_cache.get(self.user.id)
+        self.assertEqual(principal.id, self.user.id)
+        self.assertIsNotNone(principal_cache.backend.get(str(self.user.id)))
+
+    def test_update_invalidates_principal(self):
+        principal_cache.get(self.user.id)
+        self.user.is_admin = True
+        self.user.save()
+        self.assertIsNone(principal_cache.backend.get(str(self.user.id)))
+        self.assertTrue(principal_cache.get(self.user.id).is_admin)
+
+    def test_principal_loads_user_lazily(self):
+        principal = principal_cache.get(self.user.id)
+        self.assertEqual(principal.email, self.user.email)
+        token = RefreshToken.decode_token(get_tokens_for_user(principal)["access"])
+        self.assertEqual(token["User"], self.user.id)
+
+    def test_authenticate_rejects_inactive_user(self):
+        token = get_tokens_for_user(self.user)["access"]
+        with self.app.test_request_context():
+            self.assertTrue(JWTAuthentication().authenticate(token))
+            self.assertEqual(request.user.id, self.user.id)
+        self.user.active = False
+        self.user.save()
+        with self.app.test_request_context():
+            self.assertFalse(JWTAuthentication().authenticate(token))
+
+    def test_authenticated_requests_skip_the_database(self):
+        @self.app.route("/whoami")
+        @authentication_classess([JWTAuthentication])
+        def whoami():
+            return {"id": request.user.id}
+
+        revocation_index.clear()
+        headers = {"Authorization": "Bearer " + get_tokens_for_user(self.user)["access"]}
+        client = self.app.test_client()
+        self.assertEqual(client.get("/whoami", headers=headers).json, {"id": self.user.id})
+        with self.assertMaxQueries(0):
+            self.assertEqual(client.get("/whoami", headers=headers).json, {"id": self.user.id})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import json
+import unittest
+from flask import Flask
+from playstation import create_app, db
+from playstation.models.products import Category
+from playstation.applications.products.serializers import CategorySerializer
+from playstation.admin.authentications import Authentication, authentication_classess
+from playstation.admin.permissions import BasePermission, permission_required
+from playstation.admin.profiling import QueryStats, count_queries, setup_profiling
+
+
+class CountingAuthentication(Authentication):
+    instances = 0
+
+    def __init__(self):
+        CountingAuthentication.instances += 1
+
+    def authenticate(self, token):
+        return token == "valid"
+
+
+class AllowAll(BasePermission):
+    def has_permission(self, request, *args, **kwargs):
+        return True
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        setup_profiling(self.app, enabled=True)
+
+        @self.app.route("/protected")
+        @authentication_classess([CountingAuthentication])
+        @permission_required([AllowAll])
+        def protected():
+            return "ok"
+
+        self.client = self.app.test_client()
+
+    def test_authentication_is_created_once(self):
+        created = CountingAuthentication.instances
+        for _ in range(3):
+            self.client.get("/protected", headers={"Authorization": "Bearer valid"})
+        self.assertEqual(CountingAuthentication.instances, created)
+
+    def test_server_timing_header(self):
+        response = self.client.get("/protected", headers={"Authorization": "Bearer valid"})
+        self.assertEqual(response.status_code, 200)
+        timing = response.headers["Server-Timing"]
+        for name in ("auth", "permission", "view", "total"):
+            self.assertIn(f"{name};dur=", timing)
+
+    def test_invalid_token(self):
+        response = self.client.get("/protected", headers={"Authorization": "Bearer invalid"})
+        self.assertEqual(response.status_code, 401)
+
+
+class TestRequestLog(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        setup_profiling(self.app, enabled=True, request_log=True)
+
+        @self.app.route("/categories/<int:category_id>")
+        @authentication_classess([CountingAuthentication])
+        def category(category_id):
+            return CategorySerializer(instance=db.session.get(Category, category_id)).data
+
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        category = Category(name="Games")
+        category.save()
+        self.category_id = category.id
+        # Views load the category from the database
+        db.session.expunge_all()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_request_line(self):
+        with self.assertLogs("playstation.requests", "INFO") as logs:
+            response = self.client.get(f"/categories/{self.category_id}", headers={"Authorization": "Bearer valid"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(logs.records), 1)
+        fields = json.loads(logs.records[0].getMessage())
+        self.assertEqual(fields, logs.records[0].fields)
+        self.assertEqual(fields["route"], "/categories/<int:category_id>")
+        self.assertEqual(fields["status"], 200)
+        self.assertIsNone(fields["user_id"])
+        self.assertGreater(fields["db_ms"], 0)
+        self.assertIn("auth", fields["stages_ms"])
+        self.assertIn("serialization", fields["stages_ms"])
+        self.assertIn("db;dur=", response.headers["Server-Timing"])
+
+    def test_failed_requests_are_logged(self):
+        @self.app.route("/fail")
+        def fail():
+            db.session.get(Category, self.category_id)
+            raise RuntimeError("Failed view")
+
+        for propagate in (True, False):
+            with self.subTest(propagate=propagate):
+                self.app.config["PROPAGATE_EXCEPTIONS"] = propagate
+                with self.assertLogs("playstation.requests", "INFO") as logs:
+                    try:
+                        self.assertEqual(self.client.get("/fail").status_code, 500)
+                    except RuntimeError:
+                        self.assertTrue(propagate)
+                self.assertEqual(len(logs.records), 1)
+                fields = logs.records[0].fields
+                self.assertEqual(fields["status"], 500)
+                self.assertEqual(fields["error"], "RuntimeError")
+                self.assertEqual(fields["queries"], 1)
+
+    def test_repeated_queries(self):
+        @self.app.route("/n-plus-one")
+        def n_plus_one():
+            for _ in range(6):
+                db.session.get(Category, self.category_id, populate_existing=True)
+            return "ok"
+
+        with self.assertLogs("playstation.requests", "INFO") as logs:
+            response = self.client.get("/n-plus-one")
+        self.assertEqual(response.headers["X-Query-Count"], "6")
+        self.assertEqual(response.headers["X-Query-Repeated"], "1")
+        fields = logs.records[0].fields
+        self.assertEqual(fields["queries"], 6)
+        self.assertEqual(fields["repeated_queries"][0]["count"], 6)
+        self.assertIn("FROM category", fields["repeated_queries"][0]["statement"])
+        # Counters are reset for every request
+        response = self.client.get(f"/categories/{self.category_id}", headers={"Authorization": "Bearer valid"})
+        self.assertEqual(response.headers["X-Query-Repeated"], "0")
+
+    def test_count_queries(self):
+        with count_queries() as queries:
+            db.session.get(Category, self.category_id, populate_existing=True)
+            db.session.execute(db.select(Category).where(Category.id.in_([1, 2, 3]))).all()
+            db.session.execute(db.select(Category).where(Category.id.in_([4, 5]))).all()
+        self.assertEqual(queries.count, 3)
+        self.assertEqual(queries.repeated(2), {QueryStats.shape(
+            "SELECT category.id, category.name FROM category WHERE category.id IN (?, ?)"
+        ): 2})
+
+    def test_unauthorized_request_line(self):
+        with self.assertLogs("playstation.requests", "INFO") as logs:
+            self.client.get(f"/categories/{self.category_id}")
+        self.assertEqual(logs.records[0].fields["status"], 401)
+
+
+if __name__ == '__main__':
+    unittest.main()
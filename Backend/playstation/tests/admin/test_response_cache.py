@@ -0,0 +1,61 @@
+import unittest
+from flask import Flask
+from playstation.admin.cache.backends import InMemoryCache
+from playstation.admin.cache.responses import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.cache = ResponseCache(InMemoryCache(max_entries=8), ttl=60)
+        self.builds = 0
+
+        @self.app.route("/items")
+        def items():
+            return self.cache.respond("items", {"page": 1}, self.build)
+
+        self.client = self.app.test_client()
+
+    def build(self):
+        self.builds += 1
+        return [{"id": 1, "build": self.builds}], {"X-Next-Cursor": "abc"}
+
+    def test_response_is_cached(self):
+        first = self.client.get("/items")
+        second = self.client.get("/items")
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(first.json, second.json)
+        self.assertEqual(second.headers["X-Next-Cursor"], "abc")
+        self.assertEqual(second.headers["Cache-Control"], "no-cache")
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get("/items").headers["ETag"]
+        response = self.client.get("/items", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_invalidate_starts_a_new_generation(self):
+        self.client.get("/items")
+        self.cache.invalidate()
+        self.assertEqual(self.client.get("/items").json[0]["build"], 2)
+
+    def test_evicted_generation_does_not_revive_entries(self):
+        self.client.get("/items")
+        self.cache.backend.delete(self.cache.generation_key)
+        self.assertEqual(self.client.get("/items").json[0]["build"], 2)
+
+    def test_params_are_normalized(self):
+        with self.app.test_request_context():
+            self.assertEqual(self.cache.key("items", {"a": 1, "b": 2}), self.cache.key("items", {"b": 2, "a": 1}))
+            self.assertNotEqual(self.cache.key("items", {"a": 1}), self.cache.key("items", {"a": 2}))
+
+    def test_zero_ttl_disables_cache(self):
+        self.cache.ttl = 0
+        self.client.get("/items")
+        self.client.get("/items")
+        self.assertEqual(self.builds, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from datetime import timedelta
+from playstation import create_app, db
+from playstation.admin.cache import InMemoryCache, SharedCache, LocalSharedStore
+from playstation.admin.authentications.revocation import RevocationIndex, revocation_index
+from playstation.admin.authentications.jwt_authentication import JWTAuthentication
+from playstation.admin.authentications.token import get_tokens_for_user
+from playstation.models.users import User
+from playstation.models.blacklisted_tokens import BlackListedTokens, utc_now
+from playstation.settings import REVOCATION_SYNC_INTERVAL
+
+
+class TestRevocationIndex(unittest.TestCase):
+    def test_in_memory_backend(self):
+        index = RevocationIndex(InMemoryCache(max_entries=None))
+        index.revoke("token")
+        self.assertTrue(index.is_revoked("token"))
+        self.assertFalse(index.is_revoked("other"))
+
+    def test_shared_backend(self):
+        store = LocalSharedStore()
+        writer = RevocationIndex(SharedCache(store, prefix="revoked:"))
+        reader = RevocationIndex(SharedCache(store, prefix="revoked:"))
+        writer.revoke("token")
+        self.assertTrue(reader.is_revoked("token"))
+
+    def test_revocation_expires(self):
+        index = RevocationIndex(InMemoryCache(max_entries=None))
+        index.revoke("token", ttl=timedelta(seconds=-1))
+        self.assertFalse(index.is_revoked("token"))
+
+    def test_in_memory_lru_eviction(self):
+        cache = InMemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+
+class TestJWTAuthenticationRevocation(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        revocation_index.clear()
+        self.user = User.create_user(
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="password123"
+        )
+        self.tokens = get_tokens_for_user(self.user)
+
+    def tearDown(self):
+        revocation_index.clear()
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_blacklisted_token_is_rejected(self):
+        authentication = JWTAuthentication()
+        self.assertFalse(authentication.check_blacklisted(self.tokens["access"], self.user))
+        BlackListedTokens(user_id=self.user.id, **self.tokens).save()
+        self.assertTrue(authentication.check_blacklisted(self.tokens["access"], self.user))
+
+    def test_token_revoked_by_another_worker_is_rejected(self):
+        authentication = JWTAuthentication()
+        self.assertFalse(authentication.check_blacklisted(self.tokens["access"], self.user))
+        # Saved without touching this process's index
+        db.session.add(BlackListedTokens(
+            user_id=self.user.id, expires_at=utc_now() + timedelta(days=1), **self.tokens
+        ))
+        db.session.commit()
+        self.assertFalse(authentication.check_blacklisted(self.tokens["access"], self.user))
+        revocation_index.sync_interval = 0
+        try:
+            self.assertTrue(authentication.check_blacklisted(self.tokens["access"], self.user))
+        finally:
+            revocation_index.sync_interval = REVOCATION_SYNC_INTERVAL
+
+    def test_shared_index_never_syncs(self):
+        index = RevocationIndex(SharedCache(LocalSharedStore(), prefix="revoked:"))
+        self.assertFalse(index.sync_due())
+
+    def test_load_revocation_index(self):
+        BlackListedTokens(user_id=self.user.id, **self.tokens).save()
+        revocation_index.clear()
+        self.assertEqual(BlackListedTokens.load_revocation_index(), 1)
+        self.assertTrue(revocation_index.is_revoked(self.tokens["refresh"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from botocore.stub import Stubber
+from werkzeug.datastructures import FileStorage
+from playstation.admin.file_manager.storage import AmazonS3Bucket, ContentAddressedStorage, LocalStorage, Storage
+from playstation.admin.file_manager.exceptions import FileSaveException
+
+
+def upload(content, filename):
+    return FileStorage(stream=BytesIO(content), filename=filename)
+
+
+class TestStorage(unittest.TestCase):
+    def test_backends_must_implement_every_operation(self):
+        class SaveOnlyStorage(Storage):
+            def save(self, file, upload_dir, filename):
+                return filename
+
+        with self.assertRaises(TypeError):
+            SaveOnlyStorage()
+
+
+class TestSaveMany(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_concurrent_saves_keep_order(self):
+        storage = LocalStorage(workers=4)
+        files = [(upload(f"{index}".encode(), f"{index}.txt"), self.directory, f"{index}.txt") for index in range(10)]
+        paths = storage.save_many(files)
+        self.assertEqual(paths, [os.path.join(self.directory, f"{index}.txt") for index in range(10)])
+
+    def test_derived_files_skip_hashing(self):
+        storage = ContentAddressedStorage(LocalStorage(workers=4), self.directory)
+        path = storage.save(upload(b"image", "a.png"), "", "a.png")
+        names = [os.path.basename(path) + f"@{index}.webp" for index in range(3)]
+        paths = storage.save_many_beside([(upload(b"variant", name), name) for name in names], path)
+        self.assertEqual([os.path.basename(variant) for variant in paths], names)
+
+
+class TestAmazonS3Bucket(unittest.TestCase):
+    def setUp(self):
+        self.bucket = AmazonS3Bucket(
+            "store",
+            "key",
+            "secret",
+            endpoint_url="http://localhost:9000",
+            multipart_threshold=16 * 1024 * 1024,
+            max_pool_connections=32,
+            max_attempts=3,
+        )
+
+    def test_client_is_built_on_first_use(self):
+        self.assertIsNone(self.bucket._client)
+        client = self.bucket.s3_client
+        self.assertIs(client, self.bucket.s3_client)
+        self.assertEqual(client.meta.config.max_pool_connections, 32)
+        self.assertEqual(client.meta.config.retries["mode"], "adaptive")
+        self.assertEqual(client.meta.endpoint_url, "http://localhost:9000")
+        self.assertEqual(self.bucket.transfer_config.multipart_threshold, 16 * 1024 * 1024)
+
+    def test_urls(self):
+        url = self.bucket.url("images/a.png")
+        self.assertEqual(url, "http://localhost:9000/store/images/a.png")
+        self.assertEqual(self.bucket.key(url), "images/a.png")
+
+    def test_save_and_exists(self):
+        with Stubber(self.bucket.s3_client) as stubber:
+            stubber.add_response("put_object", {})
+            stubber.add_client_error("head_object", "404", http_status_code=404)
+            self.assertEqual(self.bucket.save(BytesIO(b"image"), "images", "a.png"), "http://localhost:9000/store/images/a.png")
+            self.assertFalse(self.bucket.exists("images/b.png"))
+
+    def test_failed_upload(self):
+        with Stubber(self.bucket.s3_client) as stubber:
+            stubber.add_client_error("put_object", "AccessDenied", http_status_code=403)
+            with self.assertRaises(FileSaveException):
+                self.bucket.save(BytesIO(b"image"), "images", "a.png")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from sqlalchemy import event
+from playstation import create_app, db
+from playstation.models.products import Product, Category
+from playstation.applications.products.serializers.validators import (
+    CategoryValidatorByID,
+    CategoryValidatorByName,
+    ProductValidatorByImageURL,
+    ProductValidatorByName,
+)
+
+
+class TestExistsValidator(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.category = Category(name="Games")
+        self.category.save()
+        self.category_id = self.category.id
+        Product(name="Astro Bot", price=59.0, stock=5, category_id=self.category_id, image_url="https://a.com/astro.png").save()
+        self.statements = []
+        event.listen(db.engine, "before_cursor_execute", self.record)
+
+    def tearDown(self):
+        event.remove(db.engine, "before_cursor_execute", self.record)
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_validate(self):
+        self.assertTrue(ProductValidatorByName().validate("Astro Bot"))
+        self.assertFalse(ProductValidatorByName().validate("Returnal"))
+        self.assertTrue(CategoryValidatorByID().validate(self.category_id))
+        self.assertTrue(ProductValidatorByImageURL().validate("https://a.com/astro.png"))
+        self.assertTrue(all("EXISTS" in statement for statement in self.statements))
+
+    def test_validate_many_is_one_query(self):
+        self.assertEqual(ProductValidatorByName().validate_many(["Astro Bot", "Returnal", "Astro Bot"]), {"Astro Bot"})
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(ProductValidatorByName().validate_many([]), set())
+        self.assertEqual(len(self.statements), 1)
+
+    def test_raising_validator(self):
+        with self.assertRaises(ValueError):
+            CategoryValidatorByName(ValueError).validate("Games")
+        self.assertIsNone(CategoryValidatorByName(ValueError).validate("Movies"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from playstation import create_app, db
+from playstation.models.users import User
+from playstation.models.orders import Orders
+from playstation.models.products import Product, Category
+from playstation.models.shipping_address import ShippingAddress
+from playstation.models.coupons import Coupons
+from playstation.models.payments import Payments
+from playstation.models.junction_models import order_product
+from playstation.models.exceptions import ProductOutOfStock
+from playstation.applications.users import users_api
+from playstation.applications.orders import orders_api
+from playstation.applications.orders.checkout import Checkout
+from playstation.applications.orders.exceptions import UnknownProducts, InvalidShippingAddress
+from playstation.tests.helpers import QueryBudgetMixin
+
+
+class TestCheckout(QueryBudgetMixin, unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app.register_blueprint(users_api)
+        self.app.register_blueprint(orders_api)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.user = User.create_user(first_name="John", last_name="Doe", email="john@example.com", password="password123")
+        self.category = Category(name="Games")
+        self.category.save()
+        self.console = Product(name="PS5", price=500.0, stock=2, category_id=self.category.id)
+        self.console.save()
+        self.game = Product(name="Astro Bot", price=60.0, discount=50.0, is_sale=True, stock=10, category_id=self.category.id)
+        self.game.save()
+        self.address = ShippingAddress(user_id=self.user.id, address="1 Main St", city="Town", state="State", country="Country", default=True)
+        self.address.save()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def stock(self, product):
+        return db.session.get(Product, product.id).stock
+
+    def test_place_order(self):
+        order = Checkout(self.user.id, [(self.console.id, 1), (self.game.id, 2), (self.game.id, 1)], self.address.id).place()
+        self.assertEqual(order.total_amount, 500 + 30 * 3)
+        self.assertEqual(order.status, "Pending")
+        self.assertEqual(self.stock(self.console), 1)
+        self.assertEqual(self.stock(self.game), 7)
+        lines = db.session.execute(
+            order_product.select().where(order_product.c.order_id == order.id).order_by(order_product.c.product_id)
+        ).all()
+        self.assertEqual([(line.product_id, line.quantity) for line in lines], [(self.console.id, 1), (self.game.id, 3)])
+
+    def test_out_of_stock_rolls_back_the_order(self):
+        with self.assertRaises(ProductOutOfStock):
+            Checkout(self.user.id, [(self.game.id, 1), (self.console.id, 3)]).place()
+        self.assertEqual(self.stock(self.game), 10)
+        self.assertEqual(self.stock(self.console), 2)
+        self.assertEqual(Orders.query.count(), 0)
+
+    def test_unknown_product(self):
+        with self.assertRaises(UnknownProducts):
+            Checkout(self.user.id, [(999, 1)]).place()
+
+    def test_address_of_another_user(self):
+        other = User.create_user(first_name="Jane", last_name="Doe", email="jane@example.com", password="password123")
+        with self.assertRaises(InvalidShippingAddress):
+            Checkout(other.id, [(self.game.id, 1)], self.address.id).place()
+        self.assertEqual(self.stock(self.game), 10)
+
+    def test_sell_is_conditional(self):
+        self.assertEqual(self.console.sell(2), 1000)
+        self.assertEqual(self.stock(self.console), 0)
+        with self.assertRaises(ProductOutOfStock):
+            self.console.sell(1)
+
+    def test_checkout_endpoint(self):
+        client = self.app.test_client()
+        token = client.post("/api/users/login", json={"email": "john@example.com", "password": "password123"}).json["token"]["access"]
+        headers = {"Authorization": f"Bearer {token}"}
+        response = client.post(
+            "/api/orders/checkout",
+            json={"items": [{"product_id": self.game.id, "quantity": 2}], "shipping_address_id": self.address.id},
+            headers=headers,
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json["total_amount"], 60)
+        response = client.post("/api/orders/checkout", json={"items": [{"product_id": self.console.id, "quantity": 5}]}, headers=headers)
+        self.assertEqual(response.status_code, 409)
+        response = client.post("/api/orders/checkout", json={"items": []}, headers=headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_checkout_query_budget(self):
+        client = self.app.test_client()
+        token = client.post("/api/users/login", json={"email": "john@example.com", "password": "password123"}).json["token"]["access"]
+        items = [{"product_id": self.game.id, "quantity": 2}, {"product_id": self.console.id, "quantity": 1}]
+        address_id = self.address.id
+        # One conditional stock update per cart line
+        with self.assertMaxQueries(9, repeat_threshold=3):
+            response = client.post(
+                "/api/orders/checkout",
+                json={"items": items, "shipping_address_id": address_id},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        self.assertEqual(response.status_code, 201)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from sqlalchemy import event
+from playstation import create_app, db
+from playstation.models.products import Product, Category
+from playstation.applications.pages import pages
+from playstation.applications.pages.images import known_images
+from playstation.applications.pages.views import send_static
+
+DIGEST = "ab" * 32
+
+
+class TestStaticFiles(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app.register_blueprint(pages)
+        # Serve the static directory from a temporary root
+        self.root = tempfile.mkdtemp()
+        self.app.root_path = self.root
+        for path in ("static/js/index-DbMNdUTD.js", "static/js/vendor.js", "static/js/chart-ABCDEF12.js",
+                     "static/images/default.png", f"static/images/blobs/ab/{DIGEST}.png",
+                     "static/images/covers/astro.png"):
+            self.write(path, path)
+        self.write("static/manifests/shop.json", json.dumps({
+            "index.html": {"file": "assets/index-DbMNdUTD.js", "isEntry": True, "css": ["assets/index-DiwrgTda.css"]},
+        }))
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        known_images.invalidate()
+        self.category = Category(name="Games")
+        self.category.save()
+        Product(name="Astro Bot", price=59.0, stock=5, category_id=self.category.id,
+                image_url=f"/images/blobs/ab/{DIGEST}.png").save()
+        self.client = self.app.test_client()
+        self.statements = []
+        event.listen(db.engine, "before_cursor_execute", self.record)
+
+    def tearDown(self):
+        event.remove(db.engine, "before_cursor_execute", self.record)
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+        shutil.rmtree(self.root)
+
+    def write(self, path, content):
+        os.makedirs(os.path.join(self.root, os.path.dirname(path)), exist_ok=True)
+        with open(os.path.join(self.root, path), "w") as file:
+            file.write(content)
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_fingerprinted_files_are_immutable(self):
+        response = self.client.get("/js/index-DbMNdUTD.js")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.cache_control.immutable)
+        self.assertFalse(response.cache_control.no_cache)
+        self.assertGreater(response.cache_control.max_age, 0)
+        image = self.client.get(f"/images/blobs/ab/{DIGEST}.png")
+        self.assertEqual(image.get_data(as_text=True), f"static/images/blobs/ab/{DIGEST}.png")
+        self.assertTrue(image.cache_control.immutable)
+
+    def test_other_files_are_revalidated(self):
+        # Named like a bundle, but missing from the manifests
+        for url in ("/js/vendor.js", "/js/chart-ABCDEF12.js", "/images/default.png"):
+            response = self.client.get(url)
+            self.assertTrue(response.cache_control.no_cache)
+            self.assertFalse(response.cache_control.immutable)
+            self.assertIn("ETag", response.headers)
+            self.assertIn("Last-Modified", response.headers)
+
+    def test_manifests_are_read_again_when_changed(self):
+        self.assertTrue(self.client.get("/js/index-DbMNdUTD.js").cache_control.immutable)
+        self.write("static/manifests/shop.json", json.dumps({"index.html": {"file": "assets/chart-ABCDEF12.js"}}))
+        os.utime(os.path.join(self.root, "static/manifests/shop.json"), ns=(0, 0))
+        self.assertFalse(self.client.get("/js/index-DbMNdUTD.js").cache_control.immutable)
+        self.assertTrue(self.client.get("/js/chart-ABCDEF12.js").cache_control.immutable)
+
+    def test_conditional_requests(self):
+        response = self.client.get("/js/index-DbMNdUTD.js")
+        cached = self.client.get("/js/index-DbMNdUTD.js", headers={"If-None-Match": response.headers["ETag"]})
+        self.assertEqual(cached.status_code, 304)
+        self.assertTrue(cached.cache_control.immutable)
+        modified = self.client.get("/images/default.png", headers={
+            "If-Modified-Since": self.client.get("/images/default.png").headers["Last-Modified"]
+        })
+        self.assertEqual(modified.status_code, 304)
+
+    def test_known_images_skip_the_database(self):
+        self.client.get(f"/images/blobs/ab/{DIGEST}.png")
+        self.statements.clear()
+        self.client.get(f"/images/blobs/ab/{DIGEST}.png")
+        self.assertEqual(self.statements, [])
+
+    def test_unknown_images_fall_back_to_the_default(self):
+        response = self.client.get("/images/covers/astro.png")
+        self.assertEqual(response.get_data(as_text=True), "static/images/default.png")
+        self.assertTrue(response.cache_control.no_cache)
+        self.statements.clear()
+        self.client.get("/images/covers/astro.png")
+        self.assertEqual(self.statements, [])
+
+    def test_product_writes_update_known_images(self):
+        self.client.get(f"/images/blobs/ab/{DIGEST}.png")
+        Product(name="Returnal", price=69.0, stock=5, category_id=self.category.id,
+                image_url="/images/covers/astro.png").save()
+        response = self.client.get("/images/covers/astro.png")
+        self.assertEqual(response.get_data(as_text=True), "static/images/covers/astro.png")
+
+    def test_images_created_elsewhere_are_found_once_invalidated(self):
+        self.client.get(f"/images/blobs/ab/{DIGEST}.png")
+        # Bypasses the mapper events like a write from another worker
+        db.session.execute(Product.__table__.update().values(image_url="/images/covers/astro.png"))
+        db.session.commit()
+        response = self.client.get("/images/covers/astro.png")
+        self.assertEqual(response.get_data(as_text=True), "static/images/default.png")
+        # Invalidated by the TTL
+        known_images.invalidate()
+        response = self.client.get("/images/covers/astro.png")
+        self.assertEqual(response.get_data(as_text=True), "static/images/covers/astro.png")
+
+    def test_x_accel_redirect(self):
+        with self.app.test_request_context():
+            response = send_static("static/images/blobs/ab", f"{DIGEST}.png", True, offload="x-accel-redirect")
+        self.assertEqual(response.headers["X-Accel-Redirect"], f"/protected/images/blobs/ab/{DIGEST}.png")
+        self.assertEqual(response.get_data(), b"")
+        self.assertEqual(response.mimetype, "image/png")
+        self.assertTrue(response.cache_control.immutable)
+        with self.app.test_request_context(headers={"If-None-Match": response.headers["ETag"]}):
+            cached = send_static("static/images/blobs/ab", f"{DIGEST}.png", True, offload="x-accel-redirect")
+        self.assertEqual(cached.status_code, 304)
+        self.assertNotIn("X-Accel-Redirect", cached.headers)
+
+    def test_x_sendfile(self):
+        with self.app.test_request_context(headers={"Range": "bytes=0-3"}):
+            response = send_static("static/js", "vendor.js", offload="x-sendfile")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Sendfile"], os.path.join(self.root, "static/js/vendor.js"))
+        self.assertEqual(response.get_data(), b"")
+
+
+if __name__ == '__main__':
+    unittest.main()
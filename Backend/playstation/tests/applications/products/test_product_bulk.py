@@ -0,0 +1,107 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from playstation import create_app, db
+from playstation.models.products import Product, Category
+from playstation.applications.products import products_api
+from playstation.applications.products.bulk import (
+    DEFAULT_IMAGE,
+    ProductImporter,
+    export_products,
+    read_rows,
+)
+from playstation.applications.products.cache import listing_cache
+from playstation.applications.products.serializers import GetProductSerializer
+
+
+class TestProductBulk(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app.register_blueprint(products_api)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        listing_cache.invalidate()
+        self.category = Category(name="Games")
+        self.category.save()
+        Product(name="Astro Bot", price=59.0, stock=5, category_id=self.category.id).save()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_import_csv(self):
+        stream = io.StringIO(
+            "name,price,stock,category_id,description,is_sale,discount\n"
+            f"Gran Turismo,69.5,3,{self.category.id},Racing,true,10\n"
+            f"Spider-Man 2,59,0,{self.category.id},,,\n"
+        )
+        report = ProductImporter().run(read_rows(stream, "csv"))
+        self.assertEqual(report, {"created": 2, "failed": 0, "errors": []})
+        racing = Product.query.filter_by(name="Gran Turismo").first()
+        self.assertEqual((racing.price, racing.stock, racing.is_sale, racing.discount), (69.5, 3, True, 10.0))
+        spider = Product.query.filter_by(name="Spider-Man 2").first()
+        self.assertIsNone(spider.description)
+        self.assertEqual(spider.image_url, DEFAULT_IMAGE)
+        self.assertIsNotNone(spider.created_at)
+
+    def test_rejected_rows_are_reported(self):
+        rows = [
+            {"name": "Astro Bot", "price": 1, "stock": 1, "category_id": self.category.id},
+            {"name": "Returnal", "price": 1, "stock": 1, "category_id": 999},
+            {"name": "Returnal", "price": -1, "stock": 1, "category_id": self.category.id},
+            {"name": "Ratchet", "price": 1, "stock": 1, "category_id": self.category.id, "image_url": "ftp://a/b.png"},
+            "not json",
+            {"name": "Ratchet", "price": 1, "stock": 1, "category_id": self.category.id},
+            {"name": "Ratchet", "price": 2, "stock": 1, "category_id": self.category.id},
+        ]
+        report = ProductImporter(batch_size=3).run(rows)
+        self.assertEqual((report["created"], report["failed"]), (1, 6))
+        self.assertEqual(
+            sorted((error["line"], error["field"]) for error in report["errors"]),
+            [(1, "name"), (2, "category_id"), (3, "price"), (4, "image_url"), (5, None), (7, "name")],
+        )
+        self.assertEqual(Product.query.filter_by(name="Ratchet").count(), 1)
+
+    def test_imported_products_are_listed_and_searchable(self):
+        self.assertEqual(len(GetProductSerializer.get_products({})), 1)
+        lines = [json.dumps({"name": f"Spider {index}", "price": 1, "stock": 1, "category_id": self.category.id}) for index in range(5)]
+        ProductImporter(batch_size=2).run(read_rows(io.StringIO("\n".join(lines)), "ndjson"))
+        self.assertEqual(len(GetProductSerializer.get_products({})), 6)
+        self.assertEqual(len(GetProductSerializer.get_products({"search": "spider"})), 5)
+
+    def test_export_round_trips(self):
+        exported = "".join(export_products("csv"))
+        self.assertTrue(exported.startswith("id,name,description,price,discount,stock,is_sale,image_url,category_id"))
+        Product.query.delete()
+        db.session.commit()
+        report = ProductImporter().run(read_rows(io.StringIO(exported), "csv"))
+        self.assertEqual(report["created"], 1)
+        self.assertEqual(Product.query.first().image_url, DEFAULT_IMAGE)
+
+    def test_export_ndjson(self):
+        rows = [json.loads(line) for line in export_products("ndjson")]
+        self.assertEqual([row["name"] for row in rows], ["Astro Bot"])
+
+    def test_cli_import_and_export(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "catalog.ndjson")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(json.dumps({"name": "Returnal", "price": 1, "stock": 1, "category_id": self.category.id}))
+            runner = self.app.test_cli_runner()
+            result = runner.invoke(args=["products", "import", path])
+            self.assertIn("Created 1 products, 0 rows failed", result.output)
+            result = runner.invoke(args=["products", "export", "--format", "ndjson"])
+            self.assertEqual(len(result.output.splitlines()), 2)
+
+    def test_endpoints_require_authentication(self):
+        client = self.app.test_client()
+        self.assertEqual(client.get("/api/products/export").status_code, 401)
+        self.assertEqual(client.post("/api/products/import", data="", content_type="text/csv").status_code, 401)
+
+
+if __name__ == '__main__':
+    unittest.main()
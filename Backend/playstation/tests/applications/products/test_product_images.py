@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import unittest
+from playstation import create_app, db
+from playstation.models.products import Product, Category
+from playstation.admin.file_manager.image_handler import ImageHandler
+from playstation.admin.file_manager.storage import ContentAddressedStorage, LocalStorage
+from playstation.models.media import MediaBlob
+from playstation.applications.products.images import collect_unreferenced_blobs, process_image_variants
+from playstation.applications.products.serializers import ProductSerializer
+from playstation.tests.admin.test_image_handler import image_file
+
+
+class TestProductImages(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.directory = tempfile.mkdtemp()
+        self.storage = ContentAddressedStorage(LocalStorage(), self.directory)
+        self.handler = ImageHandler(self.storage, variants={"thumbnail": 100, "card": 400}, workers=1)
+        self.category = Category(name="Games")
+        self.category.save()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+        shutil.rmtree(self.directory)
+
+    def test_variants_are_recorded_as_srcset(self):
+        upload = self.handler.upload(image_file(), self.directory)
+        product = Product(name="Astro Bot", price=59.0, stock=5, category_id=self.category.id, image_url=upload.path)
+        product.save()
+        self.assertIsNone(ProductSerializer(instance=product).data["srcset"])
+        process_image_variants(upload).result(timeout=30)
+        db.session.expire_all()
+        srcset = ProductSerializer(instance=db.session.get(Product, product.id)).data["srcset"]
+        self.assertEqual(
+            srcset["webp"],
+            f"{upload.path}@thumbnail.webp 100w, {upload.path}@card.webp 400w",
+        )
+        self.assertEqual(ProductSerializer.project()[0]["srcset"], srcset)
+
+    def refcount(self, path):
+        blob = db.session.get(MediaBlob, ContentAddressedStorage.digest(path))
+        return blob.refcount if blob else 0
+
+    def test_reference_upserts_the_blob(self):
+        connection = db.session.connection()
+        MediaBlob.reference(connection, "ab" * 32, 1)
+        MediaBlob.reference(connection, "ab" * 32, 2)
+        MediaBlob.reference(connection, "ab" * 32, -1)
+        MediaBlob.reference(connection, "cd" * 32, -1)
+        db.session.commit()
+        self.assertEqual(db.session.get(MediaBlob, "ab" * 32).refcount, 2)
+        self.assertIsNone(db.session.get(MediaBlob, "cd" * 32))
+
+    def test_products_reference_blobs(self):
+        first = self.handler.upload(image_file(), self.directory).path
+        second = self.handler.upload(image_file(size=(10, 10)), self.directory).path
+        products = [
+            Product(name=name, price=1.0, stock=1, category_id=self.category.id, image_url=first)
+            for name in ("Astro Bot", "Returnal")
+        ]
+        for product in products:
+            product.save()
+        self.assertEqual(self.refcount(first), 2)
+        product = db.session.get(Product, products[0].id)
+        product.image_url = second
+        product.save()
+        self.assertEqual((self.refcount(first), self.refcount(second)), (1, 1))
+        db.session.get(Product, products[1].id).delete()
+        self.assertEqual(self.refcount(first), 0)
+
+    def test_unreferenced_blobs_are_collected(self):
+        kept = self.handler.upload(image_file(), self.directory)
+        dropped = self.handler.upload(image_file(size=(10, 10)), self.directory)
+        process_image_variants(dropped).result(timeout=30)
+        Product(name="Astro Bot", price=1.0, stock=1, category_id=self.category.id, image_url=kept.path).save()
+        self.assertEqual(collect_unreferenced_blobs(self.storage, grace=3600)["deleted"], 0)
+        report = collect_unreferenced_blobs(self.storage, grace=-1)
+        self.assertEqual((report["blobs"], report["deleted"], report["files"]), (2, 1, 5))
+        self.assertTrue(os.path.exists(kept.path))
+        self.assertFalse(os.path.exists(dropped.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from playstation import create_app, db
+from playstation.models.products import Product, Category
+from playstation.applications.products.serializers import GetProductSerializer
+from playstation.applications.products.search import (
+    InvertedIndex,
+    MySQLSearch,
+    SQLiteSearch,
+    _backends,
+    create_search_backend,
+    get_search_backend,
+)
+
+
+class SearchTestMixin:
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.use_backend()
+        self.category = Category(name="Games")
+        self.category.save()
+        products = [
+            ("Spider-Man 2", "Swing through New York"),
+            ("God of War", "Norse spider myths"),
+            ("Spider Spider", "Webs"),
+            ("Gran Turismo", "Racing"),
+        ]
+        for name, description in products:
+            Product(name=name, description=description, price=10.0, stock=1, category_id=self.category.id).save()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def use_backend(self):
+        pass
+
+    def search(self, **queries):
+        return [product["name"] for product in GetProductSerializer.get_products(queries)]
+
+    def test_results_are_ranked(self):
+        self.assertEqual(self.search(search="spider"), ["Spider Spider", "Spider-Man 2", "God of War"])
+
+    def test_terms_match_word_prefixes(self):
+        self.assertEqual(self.search(search="spid ma"), ["Spider-Man 2"])
+
+    def test_substring_fallback(self):
+        # No word starts with "ider", newest products first
+        self.assertEqual(self.search(search="ider"), ["Spider Spider", "God of War", "Spider-Man 2"])
+        self.assertEqual(self.search(search="man 2"), ["Spider-Man 2"])
+        self.assertEqual(self.search(search="%"), [])
+
+    def test_explicit_ordering(self):
+        self.assertEqual(self.search(search="spider", sort_by="name"), ["God of War", "Spider Spider", "Spider-Man 2"])
+
+    def test_index_follows_updates_and_deletes(self):
+        product = Product.query.filter_by(name="Gran Turismo").first()
+        product.name = "Spider Racing"
+        product.save()
+        self.assertIn("Spider Racing", self.search(search="racing"))
+        product.delete()
+        self.assertEqual(self.search(search="racing"), [])
+
+    def test_rolled_back_product_is_not_indexed(self):
+        db.session.add(Product(name="Astro Bot", price=1.0, stock=1, category_id=self.category.id))
+        db.session.flush()
+        db.session.rollback()
+        self.assertEqual(self.search(search="astro"), [])
+
+    def test_relevance_cursor(self):
+        for index in range(12):
+            Product(name=f"Spider {index}", price=1.0, stock=1, category_id=self.category.id).save()
+        names, cursor = [], None
+        while True:
+            queries = {"search": "spider", "products": "10"}
+            if cursor:
+                queries["cursor"] = cursor
+            products, cursor = GetProductSerializer.get_products_page(queries)
+            names.extend(product["name"] for product in products)
+            if cursor is None:
+                break
+        self.assertEqual(len(names), 15)
+        self.assertEqual(len(set(names)), 15)
+        self.assertEqual(names[:10], self.search(search="spider", products="10"))
+
+    def test_search_without_words(self):
+        self.assertEqual(self.search(search="!!"), [])
+
+
+class TestSQLiteSearch(SearchTestMixin, unittest.TestCase):
+    def test_backend(self):
+        self.assertIsInstance(get_search_backend(db.session.connection()), SQLiteSearch)
+
+
+class TestInvertedIndexSearch(SearchTestMixin, unittest.TestCase):
+    def use_backend(self):
+        _backends[db.engine] = InvertedIndex()
+
+    def test_backend(self):
+        self.assertIsInstance(get_search_backend(db.session.connection()), InvertedIndex)
+
+    def test_rebuilds_pick_up_other_workers_writes(self):
+        backend = _backends[db.engine]
+        self.assertEqual(self.search(search="astro"), [])
+        # Bypasses the mapper events like a write from another worker
+        db.session.execute(Product.__table__.insert().values(
+            name="Astro Bot", price=1.0, stock=1, category_id=self.category.id
+        ))
+        db.session.commit()
+        self.search(search="astro")
+        self.assertEqual(backend.scores("astro"), {})
+        backend.ttl = 0
+        self.assertEqual(self.search(search="astro"), ["Astro Bot"])
+        self.assertEqual(len(backend.scores("astro")), 1)
+
+    def test_results_are_bounded(self):
+        _backends[db.engine].max_results = 2
+        self.assertEqual(self.search(search="spider"), ["Spider Spider", "Spider-Man 2"])
+
+
+class TestMySQLSearch(unittest.TestCase):
+    def test_backend(self):
+        self.assertIsInstance(create_search_backend("mysql"), MySQLSearch)
+        self.assertIsInstance(create_search_backend("mysql", search="python"), InvertedIndex)
+
+    def test_fulltext_match(self):
+        match = MySQLSearch().match("Spider-Man")
+        statement = str(select(Product.id).where(match.condition).compile(
+            dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+        self.assertIn("MATCH (product.name, product.description) AGAINST ('+spider* +man*' IN BOOLEAN MODE)", statement)
+
+
+if __name__ == '__main__':
+    unittest.main()
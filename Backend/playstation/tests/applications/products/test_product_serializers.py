@@ -0,0 +1,173 @@
+import unittest
+from playstation import create_app, db
+from playstation.models.products import Product, Category
+from playstation.applications.products.serializers import (
+    CategorySerializer,
+    GetProductSerializer,
+    ProductSerializer,
+)
+from playstation.applications.products.serializers.exceptions import InvalidCursor
+from playstation.applications.products.categories import category_ids
+from playstation.applications.products.serializers.pagination import encode_cursor
+
+
+class TestProductListing(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.consoles = Category(name="Consoles")
+        self.consoles.save()
+        self.games = Category(name="Games")
+        self.games.save()
+        self.products = [
+            Product(name="PS5", description="Console", price=499.0, stock=3, category_id=self.consoles.id),
+            Product(name="Spider-Man", description="Game", price=69.0, stock=10, category_id=self.games.id, is_sale=True),
+            Product(name="God of War", description="Game", price=59.0, stock=0, category_id=self.games.id),
+        ]
+        for product in self.products:
+            product.save()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_projection_matches_representation(self):
+        projected = {product["id"]: product for product in ProductSerializer.project()}
+        for product in self.products:
+            self.assertEqual(projected[product.id], ProductSerializer(instance=product).data)
+
+    def test_projection_skips_unselected_columns(self):
+        keys = [column.key for column in ProductSerializer.projection()]
+        self.assertNotIn("created_at", keys)
+        self.assertEqual(keys[-2:], ["category_id", "category_name"])
+
+    def test_categories_are_projected(self):
+        self.assertEqual(
+            CategorySerializer.get_all_categories(),
+            [{"id": self.consoles.id, "name": "Consoles"}, {"id": self.games.id, "name": "Games"}],
+        )
+
+    def test_get_products_filters(self):
+        products = GetProductSerializer.get_products({"category": str(self.games.id), "sort_by": "price"})
+        self.assertEqual([product["name"] for product in products], ["God of War", "Spider-Man"])
+        self.assertEqual(products[0]["category"], {"id": self.games.id, "name": "Games"})
+        products = GetProductSerializer.get_products({"sale": True})
+        self.assertEqual([product["name"] for product in products], ["Spider-Man"])
+
+
+class TestProductCursorPagination(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.category = Category(name="Games")
+        self.category.save()
+        # Duplicated prices and creation times exercise the id tie-breaker
+        for index in range(25):
+            Product(name=f"Game {index:02d}", price=float(index % 4), stock=1, category_id=self.category.id).save()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def walk(self, sort_by):
+        names, cursor = [], None
+        while True:
+            queries = {"sort_by": sort_by, "products": "10"}
+            if cursor:
+                queries["cursor"] = cursor
+            products, cursor = GetProductSerializer.get_products_page(queries)
+            names.extend(product["name"] for product in products)
+            if cursor is None:
+                return names
+
+    def offset_walk(self, sort_by):
+        names = []
+        for start in range(0, 30, 10):
+            products = GetProductSerializer.get_products({"sort_by": sort_by, "products": "10", "start": str(start)})
+            names.extend(product["name"] for product in products)
+        return names
+
+    def test_cursor_walk_matches_offset_walk(self):
+        for sort_by in ("price", "price_desc", "name", "name_desc", "date", "date_desc"):
+            with self.subTest(sort_by=sort_by):
+                names = self.walk(sort_by)
+                self.assertEqual(len(names), 25)
+                self.assertEqual(len(set(names)), 25)
+                self.assertEqual(names, self.offset_walk(sort_by))
+
+    def test_last_page_has_no_cursor(self):
+        _, cursor = GetProductSerializer.get_products_page({"products": "40"})
+        self.assertIsNone(cursor)
+
+    def test_cursor_of_another_ordering(self):
+        _, cursor = GetProductSerializer.get_products_page({"sort_by": "price", "products": "10"})
+        with self.assertRaises(InvalidCursor):
+            GetProductSerializer.get_products_page({"sort_by": "name", "cursor": cursor})
+
+    def test_malformed_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            GetProductSerializer.get_products_page({"cursor": "not-a-cursor"})
+
+    def test_cursor_survives_deleted_anchor(self):
+        products, cursor = GetProductSerializer.get_products_page({"sort_by": "name", "products": "10"})
+        db.session.delete(db.session.get(Product, products[-1]["id"]))
+        db.session.commit()
+        products, _ = GetProductSerializer.get_products_page({"sort_by": "name", "products": "10", "cursor": cursor})
+        self.assertEqual(products[0]["name"], "Game 10")
+
+    def test_cursor_has_no_padding(self):
+        cursor = encode_cursor("price", 1.5, 7)
+        self.assertNotIn("=", cursor)
+
+
+class TestCategoryIdCache(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        category_ids.invalidate()
+        self.category = Category(name="Consoles")
+        self.category.save()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        category_ids.invalidate()
+        self.app_context.pop()
+
+    def test_existing_keeps_order(self):
+        other = Category(name="Games")
+        other.save()
+        self.assertEqual(category_ids.existing([other.id, 99, self.category.id]), [other.id, self.category.id])
+
+    def test_ids_are_cached(self):
+        self.assertEqual(category_ids.ids(), {self.category.id})
+        self.assertIsNotNone(category_ids.backend.get(category_ids.key))
+
+    def test_create_and_delete_invalidate(self):
+        category_ids.ids()
+        other = Category(name="Games")
+        other.save()
+        self.assertIn(other.id, category_ids.ids())
+        db.session.delete(other)
+        db.session.commit()
+        self.assertNotIn(other.id, category_ids.ids())
+
+    def test_rollback_invalidates(self):
+        other = Category(name="Games")
+        db.session.add(other)
+        db.session.flush()
+        self.assertIn(other.id, category_ids.ids())
+        db.session.rollback()
+        self.assertEqual(category_ids.ids(), {self.category.id})
+
+
+if __name__ == '__main__':
+    unittest.main()
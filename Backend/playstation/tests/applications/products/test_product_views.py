@@ -0,0 +1,70 @@
+import unittest
+from playstation import create_app, db
+from playstation.models.products import Product, Category
+from playstation.applications.products import products_api
+from playstation.applications.products.cache import listing_cache
+from playstation.tests.helpers import QueryBudgetMixin
+
+
+class TestProductListingCache(QueryBudgetMixin, unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app.register_blueprint(products_api)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        listing_cache.invalidate()
+        self.category = Category(name="Games")
+        self.category.save()
+        Product(name="Astro Bot", price=59.0, stock=5, category_id=self.category.id).save()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_equivalent_queries_share_an_etag(self):
+        first = self.client.get("/api/products")
+        second = self.client.get("/api/products?sort_by=date&start=0&products=10")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["ETag"], second.headers["ETag"])
+
+    def test_if_none_match(self):
+        etag = self.client.get("/api/products").headers["ETag"]
+        response = self.client.get("/api/products", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_product_write_invalidates_listing(self):
+        self.assertEqual(len(self.client.get("/api/products").json), 1)
+        Product(name="Gran Turismo", price=69.0, stock=5, category_id=self.category.id).save()
+        self.assertEqual(len(self.client.get("/api/products").json), 2)
+
+    def test_stock_update_statement_invalidates_listing(self):
+        self.assertEqual(self.client.get("/api/products").json[0]["stock"], 5)
+        product = Product.query.first()
+        self.assertEqual(product.sell(2), 118)
+        self.assertEqual(self.client.get("/api/products").json[0]["stock"], 3)
+
+    def test_category_write_invalidates_categories(self):
+        etag = self.client.get("/api/products/categories").headers["ETag"]
+        self.category.name = "Video Games"
+        self.category.save()
+        response = self.client.get("/api/products/categories", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, [{"id": self.category.id, "name": "Video Games"}])
+
+    def test_invalid_queries_are_not_cached(self):
+        self.assertEqual(self.client.get("/api/products?products=1000").status_code, 404)
+
+    def test_listing_query_budget(self):
+        for index in range(5):
+            Product(name=f"Game {index}", price=19.0, stock=5, category_id=self.category.id).save()
+        with self.assertMaxQueries(1):
+            self.assertEqual(len(self.client.get("/api/products").json), 6)
+        with self.assertMaxQueries(0):
+            self.client.get("/api/products")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Helpers shared by the test cases.
+
+```py
+class TestProductViews(QueryBudgetMixin, unittest.TestCase):
+    def test_listing_budget(self):
+        with self.assertMaxQueries(2):
+            self.client.get("/api/products")
+```
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+from playstation.admin.profiling import QueryStats, count_queries
+
+
+class QueryBudgetMixin:
+    """
+    Adds query budget assertions to a unittest.TestCase.
+    """
+
+    @contextmanager
+    def assertMaxQueries(self, budget: int, repeat_threshold: int = 2) -> Iterator[QueryStats]:
+        """
+        Fail when the block runs more than `budget` queries, or repeats a statement
+        `repeat_threshold` times or more.
+
+        Args:
+            budget (int): Maximum number of queries.
+            repeat_threshold (int): Executions of one statement reported as an N+1 query.
+        """
+        with count_queries() as queries:
+            yield queries
+        details: str = "\n".join(f"{count}x {shape}" for shape, count in queries.shapes.most_common())
+        self.assertLessEqual(queries.count, budget, f"{queries.count} queries, budget {budget}:\n{details}")
+        repeated: dict[str, int] = queries.repeated(repeat_threshold)
+        self.assertFalse(repeated, f"Repeated queries:\n{details}")
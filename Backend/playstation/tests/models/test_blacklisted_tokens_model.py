@@ -0,0 +1,86 @@
+import unittest
+import jwt
+from datetime import timedelta
+from sqlalchemy import inspect, text
+from playstation import create_app, db
+from playstation.models.users import User
+from playstation.models.blacklisted_tokens import BlackListedTokens, utc_now
+from playstation.admin.authentications.token import get_tokens_for_user
+from playstation.admin.authentications.revocation import revocation_index
+from playstation.admin.authentications.reaper import TokenReaper
+
+class TestBlackListedTokensModel(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.user = User.create_user(
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="password123"
+        )
+
+    def tearDown(self):
+        revocation_index.clear()
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_expires_at_is_set_from_refresh_token(self):
+        token = BlackListedTokens(user_id=self.user.id, **get_tokens_for_user(self.user))
+        token.save()
+        self.assertIsNotNone(token.expires_at)
+        self.assertGreater(token.expires_at, utc_now())
+
+    def test_purge_expired(self):
+        BlackListedTokens(
+            user_id=self.user.id,
+            access="expired-access",
+            refresh="expired-refresh",
+            expires_at=utc_now() - timedelta(minutes=1),
+        ).save()
+        BlackListedTokens(user_id=self.user.id, **get_tokens_for_user(self.user)).save()
+        self.assertEqual(BlackListedTokens.purge_expired(), 1)
+        self.assertEqual(BlackListedTokens.query.count(), 1)
+
+    def test_reaper_reports_counts(self):
+        BlackListedTokens(
+            user_id=self.user.id,
+            access="expired-access",
+            refresh="expired-refresh",
+            expires_at=utc_now() - timedelta(minutes=1),
+        ).save()
+        report = TokenReaper(self.app, 0).reap()
+        self.assertEqual(report["purged"], 1)
+        self.assertIn("seconds", report)
+
+    def test_upgrade_schema_backfills_expires_at(self):
+        tokens = get_tokens_for_user(self.user)
+        expired = jwt.encode({"exp": utc_now() - timedelta(days=1)}, "other-key")
+        db.session.remove()
+        BlackListedTokens.__table__.drop(db.engine)
+        # Table as created before expires_at existed
+        with db.engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE black_listed_tokens (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "access VARCHAR(1000) NOT NULL UNIQUE, refresh VARCHAR(1000) NOT NULL UNIQUE, "
+                "user_id INTEGER NOT NULL REFERENCES user(id))"
+            ))
+            connection.execute(text(
+                "INSERT INTO black_listed_tokens (access, refresh, user_id) VALUES "
+                "(:access, :refresh, :user_id), ('old-access', :expired, :user_id)"
+            ), {**tokens, "expired": expired, "user_id": self.user.id})
+        self.assertEqual(BlackListedTokens.upgrade_schema(), 2)
+        self.assertEqual(BlackListedTokens.upgrade_schema(), 0)
+        self.assertIn("ix_black_listed_tokens_expires_at", {
+            index["name"] for index in inspect(db.engine).get_indexes("black_listed_tokens")
+        })
+        self.assertEqual(BlackListedTokens.load_revocation_index(), 1)
+        self.assertTrue(revocation_index.is_revoked(tokens["access"]))
+        self.assertEqual(BlackListedTokens.purge_expired(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
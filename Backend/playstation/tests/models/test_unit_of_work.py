@@ -0,0 +1,83 @@
+import unittest
+from sqlalchemy import event
+from playstation import create_app, db, db_unit_of_work
+from playstation.models.products import Product, Category
+
+
+class TestUnitOfWork(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.statements = []
+        self.commits = 0
+        event.listen(db.engine, "before_cursor_execute", self.record_statement)
+        event.listen(db.session, "after_commit", self.record_commit)
+
+    def tearDown(self):
+        event.remove(db.engine, "before_cursor_execute", self.record_statement)
+        event.remove(db.session, "after_commit", self.record_commit)
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def record_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def record_commit(self, session):
+        self.commits += 1
+
+    def selects(self):
+        return [statement for statement in self.statements if statement.startswith("SELECT")]
+
+    def test_save_does_not_select(self):
+        Category(name="Games").save()
+        self.assertEqual(self.selects(), [])
+        self.assertEqual(self.commits, 1)
+
+    def test_update_does_not_select(self):
+        with db_unit_of_work():
+            category = Category(name="Games")
+            category.save()
+            category.name = "Video Games"
+            category.save()
+        self.assertEqual(self.selects(), [])
+        self.assertEqual(self.commits, 1)
+
+    def test_unit_of_work_commits_once(self):
+        with db_unit_of_work():
+            category = Category(name="Games")
+            category.save()
+            self.assertIsNotNone(category.id)
+            Product(name="Astro Bot", price=1.0, stock=1, category_id=category.id).save()
+            with db_unit_of_work():
+                Category(name="Consoles").save()
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(Category.query.count(), 2)
+
+    def test_unit_of_work_rolls_back(self):
+        with self.assertRaises(RuntimeError):
+            with db_unit_of_work():
+                Category(name="Games").save()
+                raise RuntimeError("Failed flow")
+        self.assertEqual(Category.query.count(), 0)
+        # Saves after the block commit again
+        Category(name="Consoles").save()
+        self.assertEqual(self.commits, 1)
+
+    def test_sold_stock_is_read_back_in_the_unit_of_work(self):
+        category = Category(name="Games")
+        category.save()
+        product = Product(name="Astro Bot", price=1.0, stock=5, category_id=category.id)
+        product.save()
+        with db_unit_of_work():
+            product.sell(2)
+            self.assertEqual(product.stock, 3)
+            self.assertEqual(self.commits, 2)
+        self.assertEqual(product.stock, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
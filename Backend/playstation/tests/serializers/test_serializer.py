@@ -0,0 +1,124 @@
+import unittest
+from playstation import create_app, db, serializers
+from playstation.models.users import User
+from playstation.models.products import Product, Category
+from playstation.applications.users.serializers import UserRegisterSerializer, LoginSerializer
+from playstation.applications.products.serializers import ProductSerializer, CategorySerializer
+
+
+class TestSerializerPlan(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_plan_is_compiled_on_class_definition(self):
+        plan = UserRegisterSerializer._plan
+        self.assertEqual(plan.fields, ["first_name", "email", "last_name", "password"])
+        self.assertEqual(plan.write_only, ["password"])
+        self.assertEqual(
+            [field for field, _ in plan.validators],
+            ["email", "first_name", "last_name", "password"],
+        )
+        self.assertIn("email", plan.columns)
+
+    def test_base_classes_have_no_plan(self):
+        self.assertIsNone(serializers.Serializer._plan)
+        self.assertIsNone(serializers.ModelSerializer._plan)
+
+    def test_invalid_meta_field_fails_at_definition(self):
+        with self.assertRaises(ValueError):
+            class InvalidSerializer(serializers.Serializer):
+                class Meta:
+                    model = User
+                    fields = ["missing"]
+
+    def test_validation_runs_compiled_validators(self):
+        serializer = UserRegisterSerializer(
+            data={"first_name": "John1", "last_name": "Doe", "email": "bad", "password": "password123"}
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual({error["field"] for error in serializer.errors}, {"first_name", "email"})
+
+    def test_validators_run_in_name_order(self):
+        User.create_user(first_name="John", last_name="Doe", email="john@example.com", password="password123")
+        serializer = LoginSerializer(data={"email": "john@example.com", "password": "password123"})
+        self.assertTrue(serializer.is_valid())
+
+    def test_invalid_data_field(self):
+        serializer = UserRegisterSerializer(data={"unknown": 1})
+        with self.assertRaises(ValueError):
+            serializer.is_valid()
+
+
+class TestRepresentationPlan(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.category = Category(name="Consoles")
+        self.category.save()
+        self.product = Product(name="PS5", price=499.0, stock=3, category_id=self.category.id)
+        self.product.save()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_plan_is_compiled_once_per_class(self):
+        plan = ProductSerializer.representation_plan()
+        self.assertIs(ProductSerializer.representation_plan(), plan)
+        self.assertIsNot(CategorySerializer.representation_plan(), plan)
+
+    def test_write_only_fields_are_skipped(self):
+        fields = [field for field, _ in UserRegisterSerializer.representation_plan().getters]
+        self.assertEqual(fields, ["first_name", "email", "last_name"])
+
+    def test_product_representation(self):
+        data = ProductSerializer(instance=self.product).data
+        self.assertEqual(data["name"], "PS5")
+        self.assertNotIn("category_id", data)
+        self.assertEqual(data["category"], {"id": self.category.id, "name": "Consoles"})
+
+    def test_relationships_are_represented_by_id(self):
+        class CategoryProductsSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = Category
+                fields = ["id", "products"]
+
+        class ProductCategorySerializer(serializers.ModelSerializer):
+            class Meta:
+                model = Product
+                fields = ["id", "category"]
+
+        self.assertEqual(
+            CategoryProductsSerializer(instance=self.category).data,
+            {"id": self.category.id, "products": [self.product.id]},
+        )
+        self.assertEqual(
+            ProductCategorySerializer(instance=self.product).data,
+            {"id": self.product.id, "category": self.category.id},
+        )
+
+    def test_nested_serializer_is_used(self):
+        class ProductCategorySerializer(serializers.ModelSerializer):
+            category = CategorySerializer()
+
+            class Meta:
+                model = Product
+                fields = ["id", "category"]
+
+        data = ProductCategorySerializer(instance=[self.product], many=True).data
+        self.assertEqual(data, [{"id": self.product.id, "category": {"id": self.category.id, "name": "Consoles"}}])
+
+
+if __name__ == '__main__':
+    unittest.main()
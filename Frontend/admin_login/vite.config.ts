@@ -4,4 +4,8 @@ import react from '@vitejs/plugin-react-swc'
 // https://vitejs.dev/config/
 export default defineConfig({
   plugins: [react()],
+  // Lists the fingerprinted bundles the backend caches as immutable
+  build: {
+    manifest: true,
+  },
 })